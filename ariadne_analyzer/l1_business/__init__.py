@@ -12,6 +12,7 @@ Provides semantic analysis for business understanding:
 from .prompts import (
     CLASS_SUMMARY_PROMPT,
     CONSTRAINT_EXTRACTION_PROMPT,
+    GLOSSARY_BATCH_PROMPT,
     GLOSSARY_TERM_PROMPT,
     METHOD_SUMMARY_PROMPT,
     MODULE_SUMMARY_PROMPT,
@@ -26,5 +27,6 @@ __all__ = [
     "PACKAGE_SUMMARY_PROMPT",
     "MODULE_SUMMARY_PROMPT",
     "GLOSSARY_TERM_PROMPT",
+    "GLOSSARY_BATCH_PROMPT",
     "CONSTRAINT_EXTRACTION_PROMPT",
 ]
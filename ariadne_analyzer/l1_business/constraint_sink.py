@@ -0,0 +1,147 @@
+"""
+Constraint Sinks
+================
+
+Columnar buffers that receive extracted constraints.
+
+Extraction appends plain fields into parallel column lists instead of
+building a ConstraintEntry per constraint. Sinks decide what happens on
+flush: ListSink materializes entries for legacy callers, and
+SQLiteConstraintSink streams rows straight into the constraints table.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from ariadne_core.models.types import ConstraintEntry, ConstraintType
+
+if TYPE_CHECKING:
+    from ariadne_core.storage.sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+# Lightweight constraint record in ConstraintEntry field order:
+# (name, description, source_fqn, source_line, constraint_type)
+ConstraintRow = tuple[str, str, str | None, int | None, ConstraintType]
+
+
+class ConstraintSink:
+    """Base sink buffering constraints as five parallel columns."""
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.descriptions: list[str] = []
+        self.source_fqns: list[str | None] = []
+        self.source_lines: list[int | None] = []
+        self.constraint_types: list[ConstraintType] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(
+        self,
+        name: str,
+        description: str,
+        source_fqn: str | None,
+        source_line: int | None,
+        constraint_type: ConstraintType,
+    ) -> None:
+        """Buffer one constraint."""
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.source_fqns.append(source_fqn)
+        self.source_lines.append(source_line)
+        self.constraint_types.append(constraint_type)
+
+    def extend(self, rows: Iterable[ConstraintRow]) -> None:
+        """Buffer many constraint rows."""
+        for row in rows:
+            self.append(*row)
+
+    def rows(self) -> list[ConstraintRow]:
+        """Buffered constraints as row tuples."""
+        return list(
+            zip(
+                self.names,
+                self.descriptions,
+                self.source_fqns,
+                self.source_lines,
+                self.constraint_types,
+                strict=True,
+            )
+        )
+
+    def clear(self) -> None:
+        """Drop all buffered constraints."""
+        for column in (
+            self.names,
+            self.descriptions,
+            self.source_fqns,
+            self.source_lines,
+            self.constraint_types,
+        ):
+            column.clear()
+
+    def flush(self) -> int:
+        """Deliver buffered constraints and clear the buffer.
+
+        Returns:
+            Number of constraints flushed
+        """
+        raise NotImplementedError
+
+
+class ListSink(ConstraintSink):
+    """In-memory sink for callers that want ConstraintEntry objects."""
+
+    def to_entries(self) -> list[ConstraintEntry]:
+        """Materialize buffered constraints as entries."""
+        return [ConstraintEntry(*row) for row in self.rows()]
+
+    def flush(self) -> int:
+        """Discard buffered constraints (nothing to persist)."""
+        count = len(self)
+        self.clear()
+        return count
+
+
+class SQLiteConstraintSink(ConstraintSink):
+    """Sink that upserts constraints into SQLite in executemany batches."""
+
+    def __init__(self, store: SQLiteStore, batch_size: int = 1000) -> None:
+        """Initialize SQLite sink.
+
+        Args:
+            store: Store to write constraints into
+            batch_size: Flush automatically once this many constraints are buffered
+        """
+        super().__init__()
+        self.store = store
+        self.batch_size = batch_size
+        self.written = 0
+
+    def append(
+        self,
+        name: str,
+        description: str,
+        source_fqn: str | None,
+        source_line: int | None,
+        constraint_type: ConstraintType,
+    ) -> None:
+        """Buffer one constraint, flushing when the batch is full."""
+        super().append(name, description, source_fqn, source_line, constraint_type)
+        if len(self) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered constraints to the constraints table."""
+        if not self:
+            return 0
+        count = self.store.batch_create_constraint_rows(self.rows())
+        self.written += count
+        self.clear()
+        logger.debug(f"Flushed {count} constraints to SQLite")
+        return count
@@ -5,31 +5,131 @@ Business Constraint Extractor
 Extracts business constraints and rules from code and comments.
 """
 
+import asyncio
 import json
 import logging
 import re
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+try:
+    # Linear-time RE2 engine (optional: pip install google-re2)
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+try:
+    # Token-accurate source truncation (optional: pip install tiktoken)
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from ariadne_core.models.types import ConstraintEntry, ConstraintType, SymbolData
 from ariadne_llm import LLMClient, LLMConfig
 
+from .constraint_sink import ConstraintRow, ConstraintSink, ListSink
+from .extraction_cache import ExtractionCache, prompt_version
 from .prompts import CONSTRAINT_EXTRACTION_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Version tag of the implicit constraint prompt (part of the cache key)
+CONSTRAINT_PROMPT_VERSION = prompt_version(CONSTRAINT_EXTRACTION_PROMPT)
+
+# Constraint language in comments, compiled once as a single alternation.
+# Flags are inline so the pattern compiles identically under re and re2.
+_COMMENT_CONSTRAINT_RE = _regex.compile(
+    r"(?i)必须|不能|不可|禁止|限制|要求|约束|规则|should not|must not|required|mandatory"
+)
+
+# Source budget for implicit constraint prompts
+MAX_SOURCE_TOKENS = 800
+MAX_SOURCE_CHARS = 2000  # Used when tiktoken is not installed
+
+# Leading /* ... */ block; dropped when it mentions a copyright or license
+_LEADING_BLOCK_COMMENT_RE = _regex.compile(r"\A\s*/\*(?:[^*]|\*+[^*/])*\*+/")
+_LICENSE_WORD_RE = _regex.compile(r"(?i)copyright|license")
+_BLANK_LINES_RE = _regex.compile(r"\n(?:[ \t]*\n)+")
+
+# Comment scans spread over a process pool only above this many files
+COMMENT_POOL_MIN_FILES = 64
+COMMENT_POOL_CHUNKSIZE = 32
+
+# Control flow that can encode an implicit constraint; without it the LLM is skipped
+_BRANCH_RE = _regex.compile(r"\b(?:if|switch|throw|assert|while|for)\b")
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> Any:
+    """Get the tiktoken encoding for a model (cl100k_base for unknown models).
+
+    tiktoken downloads the BPE file on first use, so this returns None (cached)
+    when that fails, e.g. on an offline host; callers fall back to a character
+    budget.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, truncating by characters: {e}")
+        return None
+
+
+def _comment_rows(comments: list[tuple[int, str]], context_fqn: str) -> list[ConstraintRow]:
+    """Scan comments for constraint language and return constraint rows."""
+    rows: list[ConstraintRow] = []
+
+    for line_no, comment in comments:
+        # Check if comment contains constraint language
+        if _COMMENT_CONSTRAINT_RE.search(comment):
+            rows.append((
+                f"constraint_line_{line_no}",
+                comment.strip(),
+                context_fqn,
+                line_no,
+                ConstraintType.BUSINESS_RULE,
+            ))
+
+    return rows
+
+
+def _comment_rows_for_file(item: tuple[list[tuple[int, str]], str]) -> list[ConstraintRow]:
+    """Process pool entry point for extract_from_comments_many()."""
+    comments, context_fqn = item
+    return _comment_rows(comments, context_fqn)
+
+
+def _entry_row(entry: ConstraintEntry) -> ConstraintRow:
+    """Convert a ConstraintEntry back into a constraint row."""
+    return (
+        entry.name,
+        entry.description,
+        entry.source_fqn,
+        entry.source_line,
+        entry.constraint_type,
+    )
+
 
 class BusinessConstraintExtractor:
     """Extracts business constraints from code.
 
     Identifies:
-    - Validation constraints from annotations and asserts
+    - Validation constraints from annotations, asserts and guard checks
     - Business rules from logic patterns
     - Invariants from code structure
     """
 
     # Patterns for explicit constraint extraction
-    ASSERT_PATTERN = re.compile(r'assert\s+(.+?)\s*:\s*["\'](.+?)["\']')
-    VALIDATION_ANNOTATIONS = [
+    ASSERT_PATTERN = _regex.compile(
+        r'assert\s+(?P<condition>.+?)\s*:\s*["\'](?P<message>.+?)["\']'
+    )
+    # Tuple so str.startswith() can test every prefix in a single C-level call
+    VALIDATION_ANNOTATIONS = (
         "@NotNull",
         "@NotEmpty",
         "@NotBlank",
@@ -40,26 +140,72 @@ class BusinessConstraintExtractor:
         "@Email",
         "@Positive",
         "@Negative",
-    ]
+    )
+    NULL_VALIDATORS = frozenset({"@NotNull", "@NotEmpty", "@NotBlank"})
 
-    # Patterns for implicit constraint detection
+    # Patterns for implicit constraint detection: (pattern, label, type)
     CONSTRAINT_CHECKS = [
-        (r"if\s*\(\s*(.+?)\s*[<>=]+\s*0\s*\)", "边界值检查"),
-        (r"if\s*\(\s*(.+?)\s*==\s*null\s*\)", "空值检查"),
-        (r"throw new IllegalArgumentException\((.+?)\)", "非法参数异常"),
-        (r"throw new IllegalStateException\((.+?)\)", "非法状态异常"),
+        (r"if\s*\(\s*(.+?)\s*[<>=]+\s*0\s*\)", "边界值检查", ConstraintType.VALIDATION),
+        (r"if\s*\(\s*(.+?)\s*==\s*null\s*\)", "空值检查", ConstraintType.VALIDATION),
+        (
+            r"throw new IllegalArgumentException\((.+?)\)",
+            "非法参数异常",
+            ConstraintType.VALIDATION,
+        ),
+        (
+            r"throw new IllegalStateException\((.+?)\)",
+            "非法状态异常",
+            ConstraintType.INVARIANT,
+        ),
     ]
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    # All CONSTRAINT_CHECKS as one alternation; match.lastgroup ("check_<i>")
+    # recovers the category via CONSTRAINT_CHECK_LABELS
+    CONSTRAINT_CHECK_PATTERN = _regex.compile(
+        "|".join(f"(?P<check_{i}>{check[0]})" for i, check in enumerate(CONSTRAINT_CHECKS))
+    )
+    CONSTRAINT_CHECK_LABELS = {f"check_{i}": check[1] for i, check in enumerate(CONSTRAINT_CHECKS)}
+
+    # Asserts and constraint checks in a single pattern so method source is
+    # scanned once; match.lastgroup dispatches through EXPLICIT_TYPES
+    EXPLICIT_PATTERN = _regex.compile(
+        f"(?P<assert>{ASSERT_PATTERN.pattern})|{CONSTRAINT_CHECK_PATTERN.pattern}"
+    )
+    EXPLICIT_TYPES = {
+        "assert": ConstraintType.BUSINESS_RULE,
+        **{f"check_{i}": check[2] for i, check in enumerate(CONSTRAINT_CHECKS)},
+    }
+
+    # LLM gate: shorter sources, or methods already this well covered by
+    # explicit constraints, are not sent for implicit extraction
+    MIN_LLM_SOURCE_CHARS = 40
+    MAX_EXPLICIT_CONSTRAINTS = 5
+
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         """Initialize constraint extractor with LLM client.
 
         Args:
             config: Optional LLMConfig (uses env if not provided)
+            cache_dir: Optional directory for the persistent extraction cache
         """
         if config is None:
             config = LLMConfig.from_env()
 
         self.llm_client = LLMClient(config)
+        self.config = config
+
+        self.cache: ExtractionCache | None = None
+        if cache_dir is not None:
+            self.cache = ExtractionCache(
+                cache_dir,
+                provider=config.provider.value,
+                model=config.model,
+                prompt_version=CONSTRAINT_PROMPT_VERSION,
+            )
 
     def extract_from_method(
         self,
@@ -77,25 +223,97 @@ class BusinessConstraintExtractor:
         Returns:
             List of constraint entries
         """
-        constraints: list[ConstraintEntry] = []
+        sink = ListSink()
+        self.extract_into(sink, method, source_code, class_name)
+        return sink.to_entries()
+
+    def extract_from_method_raw(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str = "",
+    ) -> list[ConstraintRow]:
+        """Extract constraints from a method as plain tuples.
+
+        Args:
+            method: Method symbol data
+            source_code: Method source code
+            class_name: Optional class name for context
+
+        Returns:
+            List of constraint rows
+        """
+        sink = ListSink()
+        self.extract_into(sink, method, source_code, class_name)
+        return sink.rows()
+
+    def extract_into(
+        self,
+        sink: ConstraintSink,
+        method: SymbolData,
+        source_code: str,
+        class_name: str = "",
+    ) -> int:
+        """Extract constraints from a method into a sink.
 
+        No ConstraintEntry objects are built for explicit constraints; a
+        SQLiteConstraintSink streams them straight into storage.
+
+        Args:
+            sink: Sink receiving the constraints
+            method: Method symbol data
+            source_code: Method source code
+            class_name: Optional class name for context
+
+        Returns:
+            Number of constraints appended to the sink
+        """
         # Extract explicit constraints from annotations
-        constraints.extend(self._extract_from_annotations(method, class_name))
+        rows = self._extract_from_annotations(method, class_name)
 
-        # Extract explicit constraints from asserts
-        constraints.extend(self._extract_from_asserts(method, source_code, class_name))
+        # Extract explicit constraints from asserts and guard checks
+        rows.extend(self._extract_from_source(method, source_code, class_name))
 
         # Extract implicit constraints using LLM
-        implicit = self._extract_implicit_constraints(method, source_code, class_name)
-        constraints.extend(implicit)
+        if self._needs_llm(method, source_code, len(rows)):
+            implicit = self._extract_implicit_constraints(method, source_code, class_name)
+            rows.extend(_entry_row(entry) for entry in implicit)
 
-        return constraints
+        sink.extend(rows)
+        return len(rows)
+
+    def _needs_llm(self, method: SymbolData, source_code: str, explicit_count: int) -> bool:
+        """Decide whether a method is worth an implicit-constraint LLM call.
+
+        Trivial methods (getters, setters, plain delegates) are skipped: the
+        source is too short, has no branching, or explicit constraints
+        already cover it.
+
+        Args:
+            method: Method symbol data
+            source_code: Method source code
+            explicit_count: Number of explicit constraints already extracted
+
+        Returns:
+            True if the LLM should be called
+        """
+        if len(source_code.strip()) < self.MIN_LLM_SOURCE_CHARS:
+            reason = "source too short"
+        elif explicit_count >= self.MAX_EXPLICIT_CONSTRAINTS:
+            reason = f"{explicit_count} explicit constraints"
+        elif _BRANCH_RE.search(source_code) is None:
+            reason = "no branching"
+        else:
+            return True
+
+        logger.debug(f"Skipping LLM constraint extraction for {method.fqn}: {reason}")
+        return False
 
     def _extract_from_annotations(
         self,
         method: SymbolData,
         class_name: str,
-    ) -> list[ConstraintEntry]:
+    ) -> list[ConstraintRow]:
         """Extract validation constraints from annotations.
 
         Args:
@@ -103,67 +321,309 @@ class BusinessConstraintExtractor:
             class_name: Class name for context
 
         Returns:
-            List of constraint entries
+            List of constraint rows
         """
-        constraints: list[ConstraintEntry] = []
+        if not method.annotations:
+            return []
+
+        templates = self._annotation_templates(tuple(method.annotations))
+        return [
+            (f"{method.name}_{suffix}", description, method.fqn, None, ctype)
+            for suffix, description, ctype in templates
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _annotation_templates(
+        cls,
+        annotations: tuple[str, ...],
+    ) -> tuple[tuple[str, str, ConstraintType], ...]:
+        """Parse an annotation list into method-independent constraint templates.
+
+        Methods across a codebase repeat the same annotation lists, so the
+        parse is memoized per list and only the method name is filled in.
+
+        Args:
+            annotations: Method annotations, in declaration order
+
+        Returns:
+            (name suffix, description, constraint type) per validation annotation
+        """
+        templates: list[tuple[str, str, ConstraintType]] = []
 
-        for annotation in method.annotations:
-            # Check for validation annotations
-            for valid_ann in self.VALIDATION_ANNOTATIONS:
+        for annotation in annotations:
+            # Cheap rejection of non-validation annotations in one startswith() call
+            if not annotation.startswith(cls.VALIDATION_ANNOTATIONS):
+                continue
+
+            for valid_ann in cls.VALIDATION_ANNOTATIONS:
                 if annotation.startswith(valid_ann):
-                    name = f"{method.name}_{valid_ann.replace('@', '')}"
                     description = f"参数验证: {annotation}"
 
                     # Determine constraint type
-                    if valid_ann in ["@NotNull", "@NotEmpty", "@NotBlank"]:
+                    if valid_ann in cls.NULL_VALIDATORS:
                         ctype = ConstraintType.VALIDATION
                     else:
                         ctype = ConstraintType.VALIDATION
 
-                    constraints.append(
-                        ConstraintEntry(
-                            name=name,
-                            description=description,
-                            source_fqn=method.fqn,
-                            constraint_type=ctype,
-                        )
-                    )
+                    templates.append((valid_ann.replace("@", ""), description, ctype))
 
-        return constraints
+        return tuple(templates)
 
-    def _extract_from_asserts(
+    def _extract_from_source(
         self,
         method: SymbolData,
         source_code: str,
         class_name: str,
-    ) -> list[ConstraintEntry]:
-        """Extract constraints from assert statements.
+    ) -> list[ConstraintRow]:
+        """Extract constraints from asserts and guard checks in one scan.
 
         Args:
             method: Method symbol data
             source_code: Method source code
             class_name: Class name for context
 
+        Returns:
+            List of constraint rows
+        """
+        rows: list[ConstraintRow] = []
+        assert_count = 0
+        check_count = 0
+
+        for match in self.EXPLICIT_PATTERN.finditer(source_code):
+            kind = match.lastgroup
+
+            if kind == "assert":
+                condition = match.group("condition").strip()
+                message = match.group("message")
+                name = f"{method.name}_assert_{assert_count}"
+                description = message or f"断言: {condition}"
+                assert_count += 1
+            else:
+                name = f"{method.name}_check_{check_count}"
+                description = f"{self.CONSTRAINT_CHECK_LABELS[kind]}: {match.group(0).strip()}"
+                check_count += 1
+
+            rows.append((name, description, method.fqn, None, self.EXPLICIT_TYPES[kind]))
+
+        return rows
+
+    def extract_batch(
+        self,
+        methods: list[tuple[SymbolData, str, str]],
+    ) -> dict[str, list[ConstraintEntry]]:
+        """Extract constraints from many methods with one LLM batch pass.
+
+        Explicit constraints are extracted locally; all implicit-constraint
+        prompts are submitted together through the provider Batch API when
+        available, otherwise fanned out concurrently over max_workers threads.
+
+        Args:
+            methods: List of (method_data, source_code, class_name) tuples
+
+        Returns:
+            Dict mapping method FQN to its constraint entries
+        """
+        results: dict[str, list[ConstraintEntry]] = {}
+        prompts: dict[str, str] = {}
+        by_fqn: dict[str, SymbolData] = {}
+
+        cache_keys: dict[str, str | None] = {}
+
+        for method, source_code, class_name in methods:
+            explicit = self._extract_from_annotations(method, class_name)
+            explicit.extend(self._extract_from_source(method, source_code, class_name))
+            constraints = results.setdefault(method.fqn, [])
+            constraints.extend(ConstraintEntry(*row) for row in explicit)
+
+            if not self._needs_llm(method, source_code, len(explicit)):
+                continue
+
+            key, prompt, cached = self._prepare_implicit(method, source_code, class_name)
+            if cached is not None:
+                constraints.extend(cached)
+                continue
+
+            cache_keys[method.fqn] = key
+            prompts[method.fqn] = prompt
+            by_fqn[method.fqn] = method
+
+        if not prompts:
+            return results
+
+        if self.llm_client.supports_batch_api():
+            try:
+                responses = self.llm_client.batch_generate_structured_responses(prompts)
+            except Exception as e:
+                logger.error(
+                    f"Batch implicit constraint extraction failed, falling back to online calls: {e}"
+                )
+                responses = self._generate_concurrently(prompts)
+        else:
+            responses = self._generate_concurrently(prompts)
+
+        for fqn, result in responses.items():
+            results[fqn].extend(self._finish_implicit(by_fqn[fqn], cache_keys[fqn], result))
+
+        return results
+
+    def _generate_concurrently(self, prompts: dict[str, str]) -> dict[str, dict[str, Any]]:
+        """Run structured LLM calls concurrently for providers without a Batch API.
+
+        Args:
+            prompts: Dict mapping method FQN to prompt
+
+        Returns:
+            Dict mapping method FQN to parsed JSON response (failures omitted)
+        """
+        responses: dict[str, dict[str, Any]] = {}
+        timeout = self.config.request_timeout
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = {
+                fqn: executor.submit(self.llm_client.generate_structured_response, prompt)
+                for fqn, prompt in prompts.items()
+            }
+            for fqn, future in futures.items():
+                try:
+                    responses[fqn] = future.result(timeout=timeout)
+                except Exception as e:
+                    logger.error(f"Failed to extract implicit constraints from {fqn}: {e}")
+
+        return responses
+
+    def _prepare_source(self, source_code: str, max_tokens: int = MAX_SOURCE_TOKENS) -> str:
+        """Strip noise from method source and cut it to the prompt budget.
+
+        License headers and runs of blank lines are dropped first, then the
+        source is truncated to max_tokens using the model's tokenizer, or to
+        MAX_SOURCE_CHARS characters when tiktoken is not installed or its
+        encoding cannot be loaded.
+
+        Args:
+            source_code: Method source code
+            max_tokens: Token budget for the source
+
+        Returns:
+            Source code ready to embed in a prompt
+        """
+        source = source_code
+        header = _LEADING_BLOCK_COMMENT_RE.match(source)
+        if header and _LICENSE_WORD_RE.search(header.group()):
+            source = source[header.end():]
+        source = _BLANK_LINES_RE.sub("\n", source).strip()
+
+        encoding = _get_encoding(self.config.model) if tiktoken is not None else None
+        if encoding is None:
+            return source[:MAX_SOURCE_CHARS]
+
+        tokens = encoding.encode(source, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return source
+        return encoding.decode(tokens[:max_tokens])
+
+    def _build_implicit_prompt(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str,
+    ) -> str:
+        """Build the implicit constraint extraction prompt for a method.
+
+        Args:
+            method: Method symbol data
+            source_code: Source already passed through _prepare_source()
+            class_name: Class name for context
+        """
+        return CONSTRAINT_EXTRACTION_PROMPT.format(
+            source_code=source_code,
+            class_name=class_name,
+            method_name=method.name,
+        )
+
+    def _parse_implicit_constraints(
+        self,
+        method: SymbolData,
+        result: dict[str, Any],
+    ) -> list[ConstraintEntry]:
+        """Convert an LLM constraint extraction response into constraint entries.
+
+        Args:
+            method: Method symbol data
+            result: Parsed JSON response from LLM
+
         Returns:
             List of constraint entries
         """
-        constraints: list[ConstraintEntry] = []
+        constraint_list = result.get("constraints", [])
 
-        for match in self.ASSERT_PATTERN.finditer(source_code):
-            condition = match.group(1).strip()
-            message = match.group(2)
+        constraints: list[ConstraintEntry] = []
+        for i, c in enumerate(constraint_list):
+            name = c.get("name", f"{method.name}_constraint_{i}")
+            description = c.get("description", "")
+            type_str = c.get("type", "business_rule")
+
+            # Map string to ConstraintType
+            if type_str == "validation":
+                ctype = ConstraintType.VALIDATION
+            elif type_str == "invariant":
+                ctype = ConstraintType.INVARIANT
+            else:
+                ctype = ConstraintType.BUSINESS_RULE
 
             constraints.append(
                 ConstraintEntry(
-                    name=f"{method.name}_assert_{len(constraints)}",
-                    description=message or f"断言: {condition}",
+                    name=name,
+                    description=description,
                     source_fqn=method.fqn,
-                    constraint_type=ConstraintType.BUSINESS_RULE,
+                    constraint_type=ctype,
                 )
             )
 
         return constraints
 
+    def _prepare_implicit(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str,
+    ) -> tuple[str | None, str, list[ConstraintEntry] | None]:
+        """Prepare an implicit constraint request and look it up in the cache.
+
+        Args:
+            method: Method symbol data
+            source_code: Method source code
+            class_name: Class name for context
+
+        Returns:
+            Tuple of (cache key or None, prompt, cached constraints or None)
+        """
+        source = self._prepare_source(source_code)
+        key = self._cache_key(method, source, class_name)
+        cached = self._load_cached(key, method) if key is not None else None
+        return key, self._build_implicit_prompt(method, source, class_name), cached
+
+    def _finish_implicit(
+        self,
+        method: SymbolData,
+        key: str | None,
+        result: dict[str, Any],
+    ) -> list[ConstraintEntry]:
+        """Parse an implicit constraint response and store it in the cache.
+
+        Args:
+            method: Method symbol data
+            key: Cache key from _prepare_implicit() (None if caching is off)
+            result: Parsed JSON response from LLM
+
+        Returns:
+            List of constraint entries
+        """
+        constraints = self._parse_implicit_constraints(method, result)
+        if key is not None:
+            self._store_cached(key, method.fqn, constraints)
+        return constraints
+
     def _extract_implicit_constraints(
         self,
         method: SymbolData,
@@ -180,46 +640,188 @@ class BusinessConstraintExtractor:
         Returns:
             List of constraint entries
         """
-        prompt = CONSTRAINT_EXTRACTION_PROMPT.format(
-            source_code=source_code[:2000],  # Limit to 2000 chars for LLM
-            class_name=class_name,
-            method_name=method.name,
-        )
+        key, prompt, cached = self._prepare_implicit(method, source_code, class_name)
+        if cached is not None:
+            return cached
 
         try:
             result = self.llm_client.generate_structured_response(prompt)
-            constraint_list = result.get("constraints", [])
+            return self._finish_implicit(method, key, result)
+        except Exception as e:
+            logger.error(f"Failed to extract implicit constraints from {method.name}: {e}")
+            return []
 
-            constraints: list[ConstraintEntry] = []
-            for i, c in enumerate(constraint_list):
-                name = c.get("name", f"{method.name}_constraint_{i}")
-                description = c.get("description", "")
-                type_str = c.get("type", "business_rule")
-
-                # Map string to ConstraintType
-                if type_str == "validation":
-                    ctype = ConstraintType.VALIDATION
-                elif type_str == "invariant":
-                    ctype = ConstraintType.INVARIANT
-                else:
-                    ctype = ConstraintType.BUSINESS_RULE
+    async def _extract_implicit_async(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str,
+    ) -> list[ConstraintEntry]:
+        """Async variant of _extract_implicit_constraints().
+
+        Args:
+            method: Method symbol data
+            source_code: Method source code
+            class_name: Class name for context
+
+        Returns:
+            List of constraint entries
+        """
+        key, prompt, cached = self._prepare_implicit(method, source_code, class_name)
+        if cached is not None:
+            return cached
+
+        try:
+            result = await self.llm_client.agenerate_structured_response(prompt)
+            return self._finish_implicit(method, key, result)
+        except Exception as e:
+            logger.error(f"Failed to extract implicit constraints from {method.name}: {e}")
+            return []
+
+    async def extract_from_method_async(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str = "",
+    ) -> list[ConstraintEntry]:
+        """Async variant of extract_from_method().
 
+        Args:
+            method: Method symbol data
+            source_code: Method source code
+            class_name: Optional class name for context
+
+        Returns:
+            List of constraint entries
+        """
+        rows = self._extract_from_annotations(method, class_name)
+        rows.extend(self._extract_from_source(method, source_code, class_name))
+        constraints = [ConstraintEntry(*row) for row in rows]
+        if self._needs_llm(method, source_code, len(rows)):
+            constraints.extend(await self._extract_implicit_async(method, source_code, class_name))
+        return constraints
+
+    async def aiter_extract_many(
+        self,
+        methods: list[tuple[SymbolData, str, str]],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[str, list[ConstraintEntry]]]:
+        """Extract constraints from many methods concurrently, yielding as each completes.
+
+        Lets callers persist results while slower LLM calls are still in flight.
+
+        Args:
+            methods: List of (method_data, source_code, class_name) tuples
+            concurrency: Maximum in-flight LLM calls (defaults to config.max_workers)
+
+        Yields:
+            (method FQN, constraint entries) in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.config.max_workers)
+
+        async def extract_one(
+            method: SymbolData, source_code: str, class_name: str
+        ) -> tuple[str, list[ConstraintEntry]]:
+            async with semaphore:
+                constraints = await self.extract_from_method_async(method, source_code, class_name)
+            return method.fqn, constraints
+
+        tasks = [asyncio.ensure_future(extract_one(*item)) for item in methods]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aextract_many(
+        self,
+        methods: list[tuple[SymbolData, str, str]],
+        concurrency: int | None = None,
+    ) -> dict[str, list[ConstraintEntry]]:
+        """Extract constraints from many methods concurrently.
+
+        Args:
+            methods: List of (method_data, source_code, class_name) tuples
+            concurrency: Maximum in-flight LLM calls (defaults to config.max_workers)
+
+        Returns:
+            Dict mapping method FQN to its constraint entries
+        """
+        return {
+            fqn: constraints
+            async for fqn, constraints in self.aiter_extract_many(methods, concurrency)
+        }
+
+    def _cache_key(
+        self,
+        method: SymbolData,
+        source_code: str,
+        class_name: str,
+    ) -> str | None:
+        """Build the extraction cache key for a method (None if caching is off).
+
+        source_code is the prepared prompt source, so whitespace-only and
+        license header edits still hit the cache.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.make_key(method.fqn, source_code, class_name, method.name)
+
+    def _load_cached(self, key: str, method: SymbolData) -> list[ConstraintEntry] | None:
+        """Load and revalidate cached implicit constraints.
+
+        Entries that no longer match the ConstraintEntry schema are evicted.
+
+        Args:
+            key: Cache key
+            method: Method symbol data
+
+        Returns:
+            Cached constraint entries, or None on miss
+        """
+        assert self.cache is not None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+
+        try:
+            constraints: list[ConstraintEntry] = []
+            for item in payload:
+                if not isinstance(item["name"], str) or not isinstance(item["description"], str):
+                    raise TypeError("name and description must be strings")
                 constraints.append(
                     ConstraintEntry(
-                        name=name,
-                        description=description,
+                        name=item["name"],
+                        description=item["description"],
                         source_fqn=method.fqn,
-                        constraint_type=ctype,
+                        constraint_type=ConstraintType(item["constraint_type"]),
                     )
                 )
-
             return constraints
-        except Exception as e:
-            logger.error(f"Failed to extract implicit constraints from {method.name}: {e}")
-            return []
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Evicting stale constraint cache entry for {method.fqn}: {e}")
+            self.cache.evict(key)
+            return None
+
+    def _store_cached(self, key: str, fqn: str, constraints: list[ConstraintEntry]) -> None:
+        """Write implicit constraints back to the extraction cache."""
+        assert self.cache is not None
+        payload = [
+            {
+                "name": c.name,
+                "description": c.description,
+                "constraint_type": c.constraint_type.value,
+            }
+            for c in constraints
+        ]
+        try:
+            self.cache.put(key, payload, fqn=fqn)
+        except OSError as e:
+            logger.warning(f"Failed to write constraint cache entry for {fqn}: {e}")
 
+    @staticmethod
     def extract_from_comments(
-        self,
         comments: list[tuple[int, str]],
         context_fqn: str,
     ) -> list[ConstraintEntry]:
@@ -232,31 +834,45 @@ class BusinessConstraintExtractor:
         Returns:
             List of constraint entries
         """
-        constraints: list[ConstraintEntry] = []
+        return [ConstraintEntry(*row) for row in _comment_rows(comments, context_fqn)]
 
-        # Patterns for constraint descriptions in comments
-        constraint_patterns = [
-            r"(必须|不能|不可|禁止|限制|要求|约束|规则)",
-            r"(should not|must not|required|mandatory)",
-        ]
+    @staticmethod
+    def extract_from_comments_many(
+        files_comments: list[tuple[list[tuple[int, str]], str]],
+        max_workers: int | None = None,
+    ) -> list[list[ConstraintEntry]]:
+        """Extract comment constraints for many files across worker processes.
 
-        for line_no, comment in comments:
-            # Check if comment contains constraint language
-            for pattern in constraint_patterns:
-                if re.search(pattern, comment, re.IGNORECASE):
-                    constraints.append(
-                        ConstraintEntry(
-                            name=f"constraint_line_{line_no}",
-                            description=comment.strip(),
-                            source_fqn=context_fqn,
-                            source_line=line_no,
-                            constraint_type=ConstraintType.BUSINESS_RULE,
-                        )
+        The comment scan is pure CPU, so it is spread over a process pool;
+        small inputs are scanned in-process to avoid pool start-up cost.
+
+        Args:
+            files_comments: List of (comments, context_fqn) tuples, one per file
+            max_workers: Worker processes (defaults to os.cpu_count())
+
+        Returns:
+            Constraint entries per file, in input order
+        """
+        if len(files_comments) < COMMENT_POOL_MIN_FILES or max_workers == 1:
+            per_file = [_comment_rows_for_file(item) for item in files_comments]
+        else:
+            # Workers return plain tuples, which pickle far cheaper than entries
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                per_file = list(
+                    executor.map(
+                        _comment_rows_for_file,
+                        files_comments,
+                        chunksize=COMMENT_POOL_CHUNKSIZE,
                     )
-                    break
+                )
 
-        return constraints
+        return [[ConstraintEntry(*row) for row in rows] for rows in per_file]
 
     def close(self) -> None:
         """Close the LLM client."""
         self.llm_client.close()
+
+    async def aclose(self) -> None:
+        """Close the LLM client, including its async connection pool."""
+        await self.llm_client.aclose()
+        self.llm_client.close()
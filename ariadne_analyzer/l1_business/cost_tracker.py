@@ -6,20 +6,59 @@ Tracks token usage and API costs for LLM operations.
 """
 
 import logging
+import threading
+from array import array
 from dataclasses import dataclass, field
-from threading import Lock
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _UsageShard:
+    """Per-thread request columns, written only by the owning thread."""
+
+    __slots__ = ("model_idx", "input_tokens", "output_tokens", "cached", "model_names", "model_lookup")
+
+    def __init__(self) -> None:
+        self.model_idx = array("i")
+        self.input_tokens = array("q")
+        self.output_tokens = array("q")
+        self.cached = array("b")
+        # Model name interner: index in model_idx -> model name
+        self.model_names: list[str] = []
+        self.model_lookup: dict[str, int] = {}
+
+    def snapshot(self) -> tuple[list[str], list[int], list[int], list[int], int]:
+        """Copy the completed records of this shard.
+
+        ``cached`` is appended last, so its length bounds the records that
+        are fully written even while the owner thread keeps appending.
+        """
+        n = len(self.cached)
+        return (
+            list(self.model_names),
+            self.model_idx[:n].tolist(),
+            self.input_tokens[:n].tolist(),
+            self.output_tokens[:n].tolist(),
+            sum(self.cached[:n]),
+        )
+
+
+@dataclass(slots=True)
 class LLMCostTracker:
     """Track LLM API usage and costs.
 
     Provides cost estimation based on token usage for different models.
+
+    Requests are recorded into compact struct-of-arrays columns (model index,
+    input tokens, output tokens, cached flag) held in per-thread shards, so
+    concurrent workers never contend on a lock when recording. Shards are
+    merged and costs aggregated only when a report or summary is requested.
     """
 
+    # Cost per 1K tokens for models missing from MODEL_COSTS
+    DEFAULT_COST_PER_1K = 0.001
+
     # Cost per 1K tokens (input + output)
     MODEL_COSTS: dict[str, float] = field(default_factory=lambda: {
         # OpenAI pricing (as of 2025)
@@ -38,14 +77,26 @@ class LLMCostTracker:
         "ollama": 0.0,
     })
 
-    usage: dict[str, Any] = field(default_factory=lambda: {
-        "total_tokens": 0,
-        "total_cost_usd": 0.0,
-        "requests_count": 0,
-        "cached_count": 0,
-        "model_costs": {},
-    })
-    _lock: Lock = field(default_factory=Lock)
+    _local: threading.local = field(default_factory=threading.local)
+    _shards: list[_UsageShard] = field(default_factory=list)
+    # Guards shard registration and merging only, never the record path
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _cost_per_token: dict[str, float] = field(init=False)
+    _default_cost_per_token: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Fold the per-1K division into a per-token rate once up front
+        self._cost_per_token = {model: cost / 1000.0 for model, cost in self.MODEL_COSTS.items()}
+        self._default_cost_per_token = self.DEFAULT_COST_PER_1K / 1000.0
+
+    def _shard(self) -> _UsageShard:
+        """Get the calling thread's shard, registering it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _UsageShard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
 
     def record_request(
         self,
@@ -62,27 +113,62 @@ class LLMCostTracker:
             output_tokens: Number of output tokens
             cached: Whether this was a cached response
         """
-        total_tokens = input_tokens + output_tokens
-
-        # Get cost per 1K tokens for this model
-        cost_per_1k = self.MODEL_COSTS.get(model, 0.001)
-        cost = total_tokens / 1000 * cost_per_1k
+        shard = self._shard()
 
-        # Thread-safe update of totals
-        with self._lock:
-            self.usage["total_tokens"] += total_tokens
-            self.usage["total_cost_usd"] += cost
-            self.usage["requests_count"] += 1
-            if cached:
-                self.usage["cached_count"] += 1
+        idx = shard.model_lookup.get(model)
+        if idx is None:
+            idx = shard.model_lookup[model] = len(shard.model_names)
+            shard.model_names.append(model)
 
-            # Track per-model costs
-            if model not in self.usage["model_costs"]:
-                self.usage["model_costs"][model] = {"tokens": 0, "cost": 0.0, "requests": 0}
+        shard.model_idx.append(idx)
+        shard.input_tokens.append(input_tokens)
+        shard.output_tokens.append(output_tokens)
+        shard.cached.append(cached)
 
-            self.usage["model_costs"][model]["tokens"] += total_tokens
-            self.usage["model_costs"][model]["cost"] += cost
-            self.usage["model_costs"][model]["requests"] += 1
+    @property
+    def usage(self) -> dict[str, Any]:
+        """Aggregated usage totals and per-model costs."""
+        with self._lock:
+            snapshots = [shard.snapshot() for shard in self._shards]
+
+        tokens_by_model: dict[str, int] = {}
+        requests_by_model: dict[str, int] = {}
+        requests_count = 0
+        cached_count = 0
+
+        for names, model_idx, input_tokens, output_tokens, cached in snapshots:
+            shard_tokens = [0] * len(names)
+            shard_requests = [0] * len(names)
+            for idx, tokens_in, tokens_out in zip(
+                model_idx, input_tokens, output_tokens, strict=True
+            ):
+                shard_tokens[idx] += tokens_in + tokens_out
+                shard_requests[idx] += 1
+
+            for idx, model in enumerate(names):
+                tokens_by_model[model] = tokens_by_model.get(model, 0) + shard_tokens[idx]
+                requests_by_model[model] = requests_by_model.get(model, 0) + shard_requests[idx]
+
+            requests_count += len(model_idx)
+            cached_count += cached
+
+        cost_per_token = self._cost_per_token
+        default_cost = self._default_cost_per_token
+        model_costs: dict[str, dict[str, Any]] = {}
+        for model, tokens in tokens_by_model.items():
+            model_costs[model] = {
+                "tokens": tokens,
+                "cost": tokens * cost_per_token.get(model, default_cost),
+                "requests": requests_by_model[model],
+            }
+
+        return {
+            "total_tokens": sum(tokens_by_model.values()),
+            "total_cost_usd": sum(stats["cost"] for stats in model_costs.values()),
+            "requests_count": requests_count,
+            "cached_count": cached_count,
+            "model_costs": model_costs,
+        }
 
     def get_report(self) -> str:
         """Generate a cost report string.
@@ -90,17 +176,18 @@ class LLMCostTracker:
         Returns:
             Formatted cost report
         """
+        usage = self.usage
         lines = [
             "LLM Usage Report:",
-            f"  Total Requests: {self.usage['requests_count']:,}",
-            f"  Cached: {self.usage['cached_count']:,}",
-            f"  Total Tokens: {self.usage['total_tokens']:,}",
-            f"  Total Cost: ${self.usage['total_cost_usd']:.4f}",
+            f"  Total Requests: {usage['requests_count']:,}",
+            f"  Cached: {usage['cached_count']:,}",
+            f"  Total Tokens: {usage['total_tokens']:,}",
+            f"  Total Cost: ${usage['total_cost_usd']:.4f}",
         ]
 
-        if self.usage["model_costs"]:
+        if usage["model_costs"]:
             lines.append("\n  By Model:")
-            for model, stats in self.usage["model_costs"].items():
+            for model, stats in usage["model_costs"].items():
                 lines.append(
                     f"    {model}: {stats['requests']:,} requests, "
                     f"{stats['tokens']:,} tokens, ${stats['cost']:.4f}"
@@ -114,15 +201,11 @@ class LLMCostTracker:
         Returns:
             Dict with usage statistics
         """
-        with self._lock:
-            return self.usage.copy()
+        return self.usage
 
     def reset(self) -> None:
         """Reset all tracking."""
-        self.usage = {
-            "total_tokens": 0,
-            "total_cost_usd": 0.0,
-            "requests_count": 0,
-            "cached_count": 0,
-            "model_costs": {},
-        }
+        with self._lock:
+            # Threads lazily register fresh shards on their next record
+            self._local = threading.local()
+            self._shards = []
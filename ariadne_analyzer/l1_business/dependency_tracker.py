@@ -15,7 +15,7 @@ from ariadne_core.storage.sqlite_store import SQLiteStore
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AffectedSymbols:
     """Result of dependency analysis for changed symbols.
 
@@ -33,8 +33,10 @@ class AffectedSymbols:
 
     def __post_init__(self) -> None:
         """Compute total and total_set from changed and dependents."""
-        self.total_set = set(self.changed) | set(self.dependents)
-        self.total = len(self.total_set)
+        total_set = set(self.changed)
+        total_set.update(self.dependents)
+        self.total_set = total_set
+        self.total = len(total_set)
 
 
 class DependencyTracker:
@@ -143,15 +145,7 @@ class DependencyTracker:
         Returns:
             Parent symbol dict or None if no parent
         """
-        symbol = self.store.get_symbol(fqn)
-        if not symbol:
-            return None
-
-        parent_fqn = symbol.get("parent_fqn")
-        if not parent_fqn:
-            return None
-
-        return self.store.get_symbol(parent_fqn)
+        return self.store.get_parent_symbol(fqn)
 
     def get_children_symbols(self, parent_fqn: str) -> list[dict[str, Any]]:
         """Get all child symbols contained in the given parent.
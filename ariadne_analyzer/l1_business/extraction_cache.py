@@ -0,0 +1,161 @@
+"""
+Extraction Cache
+================
+
+Content-addressable on-disk cache for LLM extraction results.
+
+Entries are plain JSON files named by a SHA-256 key derived from the
+provider, model, prompt version, symbol FQN and the exact prompt inputs,
+so unchanged code is never re-sent to the LLM and model or prompt
+upgrades invalidate old entries automatically.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_version(template: str) -> str:
+    """Derive a short version tag from a prompt template.
+
+    Args:
+        template: Prompt template text
+
+    Returns:
+        16-char hex digest that changes whenever the template changes
+    """
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+
+class ExtractionCache:
+    """Content-addressable JSON cache for LLM extraction results.
+
+    Each entry is stored as ``{cache_dir}/{key}.json`` and written atomically
+    via ``os.replace`` so concurrent runs never observe partial files.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        provider: str,
+        model: str,
+        prompt_version: str,
+        max_age: timedelta | None = None,
+    ) -> None:
+        """Initialize extraction cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            provider: LLM provider name
+            model: LLM model name
+            prompt_version: Version tag of the prompt template
+            max_age: Optional TTL; older entries are treated as misses and evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.provider = provider
+        self.model = model
+        self.prompt_version = prompt_version
+        self.max_age = max_age
+
+    def make_key(self, fqn: str, *parts: str) -> str:
+        """Build a cache key for a symbol and its prompt inputs.
+
+        Every component is prefixed with its 8-byte big-endian length so that
+        different splits of the same bytes can never collide.
+
+        Args:
+            fqn: Symbol FQN
+            *parts: Prompt inputs (source code, class name, method name, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in (self.provider, self.model, self.prompt_version, fqn, *parts):
+            data = part.encode("utf-8")
+            digest.update(struct.pack(">Q", len(data)))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Load a cached payload.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached payload or None on miss or unreadable entry
+        """
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Evicting unreadable cache entry {key}: {e}")
+            self.evict(key)
+            return None
+
+        if not isinstance(record, dict) or "payload" not in record:
+            self.evict(key)
+            return None
+        if self.max_age is not None and self._is_expired(record):
+            self.evict(key)
+            return None
+        return record["payload"]
+
+    def _is_expired(self, record: dict[str, Any]) -> bool:
+        """Check whether an entry is older than max_age (or has no valid timestamp)."""
+        try:
+            created_at = datetime.fromisoformat(record["created_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now(UTC) - created_at > self.max_age
+
+    def put(self, key: str, payload: Any, fqn: str | None = None) -> None:
+        """Store a payload atomically.
+
+        Args:
+            key: Cache key from make_key()
+            payload: JSON-serializable payload
+            fqn: Optional symbol FQN recorded for debugging
+        """
+        record = {
+            "key": key,
+            "fqn": fqn,
+            "provider": self.provider,
+            "model": self.model,
+            "prompt_version": self.prompt_version,
+            "created_at": datetime.now(UTC).isoformat(),
+            "payload": payload,
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def evict(self, key: str) -> None:
+        """Remove a cache entry if present.
+
+        Args:
+            key: Cache key from make_key()
+        """
+        self._path(key).unlink(missing_ok=True)
@@ -8,15 +8,70 @@ Extracts domain vocabulary from code and maps code terms to business meanings.
 import json
 import logging
 import re
+import string
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 from ariadne_core.models.types import GlossaryEntry, SymbolData, SymbolKind
 from ariadne_llm import LLMClient, LLMConfig
 
-from .prompts import GLOSSARY_TERM_PROMPT
+from .extraction_cache import ExtractionCache, prompt_version
+from .prompts import GLOSSARY_BATCH_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Version tag of the glossary prompt (part of the cache key)
+GLOSSARY_PROMPT_VERSION = prompt_version(GLOSSARY_BATCH_PROMPT)
+
+# Terms explained per multi-term LLM request
+GLOSSARY_BATCH_SIZE = 100
+
+# (term, context, source_fqn) awaiting a business meaning
+TermCandidate = tuple[str, dict[str, str], str]
+
+# camelCase word boundary: a space before every ASCII capital. str.translate()
+# applies the table in one C-level pass, without the regex engine.
+_CAMEL_SPLIT_TABLE = str.maketrans({c: " " + c for c in string.ascii_uppercase})
+
+
+def _split_camel(name: str) -> str:
+    """Split a camelCase identifier into lowercase words ("cancelOrder" -> "cancel order")."""
+    return name.translate(_CAMEL_SPLIT_TABLE).strip().lower()
+
+
+# Technical class name suffixes stripped from class terms. A tuple lets
+# str.endswith() test them all in one C-level call; the longest-first copy
+# finds which one matched.
+_CLASS_SUFFIXES = (
+    "Entity", "DTO", "VO", "Model", "Service",
+    "Repository", "Controller", "Manager", "Handler", "Processor",
+)
+_CLASS_SUFFIXES_LONGEST_FIRST = tuple(sorted(_CLASS_SUFFIXES, key=len, reverse=True))
+
+# Getters/setters and common Object methods, checked with plain string
+# operations instead of a regex: exact names, then an accessor prefix
+# followed by a capital letter
+_ACCESSOR_EXACT_NAMES = frozenset({"has", "contains", "equals", "hashCode", "toString"})
+_ACCESSOR_PREFIXES = ("get", "set", "is")
+
+
+def _is_accessor_name(name: str) -> bool:
+    """Check whether a method name is a getter/setter or common Object method."""
+    if name in _ACCESSOR_EXACT_NAMES:
+        return True
+    if not name.startswith(_ACCESSOR_PREFIXES):
+        return False
+    prefix_len = 2 if name[0] == "i" else 3
+    return len(name) > prefix_len and "A" <= name[prefix_len] <= "Z"
+
+
+# Business verbs anywhere in a method name (case-insensitive, single scan)
+_BUSINESS_VERB_RE = re.compile(
+    r"create|update|delete|save|find|validate|process|calculate|generate", re.IGNORECASE
+)
+
 
 class DomainGlossaryExtractor:
     """Extracts domain vocabulary from code.
@@ -28,28 +83,38 @@ class DomainGlossaryExtractor:
     - Business states from enum values
     """
 
-    # Patterns for identifying domain-relevant symbols
-    DOMAIN_CLASS_PATTERNS = [
-        r".*(Entity|DTO|VO|Model)$",  # Data model classes
-        r".*(Service|Repository|Controller)$",  # Layer classes
-        r".*(Manager|Handler|Processor)$",  # Processing classes
-    ]
-
-    GETTER_SETTER_PATTERNS = [
-        r"^(get|set|is)[A-Z].*$",
-        r"^(has|contains|equals|hashCode|toString)$",
-    ]
+    # Patterns for identifying domain-relevant symbols, compiled once
+    DOMAIN_CLASS_PATTERN = re.compile(
+        r".*(?:Entity|DTO|VO|Model"  # Data model classes
+        r"|Service|Repository|Controller"  # Layer classes
+        r"|Manager|Handler|Processor)$"  # Processing classes
+    )
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         """Initialize glossary extractor with LLM client.
 
         Args:
             config: Optional LLMConfig (uses env if not provided)
+            cache_dir: Optional directory for the persistent term meaning cache
         """
         if config is None:
             config = LLMConfig.from_env()
 
         self.llm_client = LLMClient(config)
+        self.config = config
+
+        self.cache: ExtractionCache | None = None
+        if cache_dir is not None:
+            self.cache = ExtractionCache(
+                cache_dir,
+                provider=config.provider.value,
+                model=config.model,
+                prompt_version=GLOSSARY_PROMPT_VERSION,
+            )
 
     def extract_terms_from_class(
         self,
@@ -67,22 +132,34 @@ class DomainGlossaryExtractor:
         Returns:
             List of glossary entries
         """
-        entries: list[GlossaryEntry] = []
+        return self.extract_terms_batch(self._collect_class_terms(class_data, methods, fields))
+
+    def _collect_class_terms(
+        self,
+        class_data: SymbolData,
+        methods: list[SymbolData] | None = None,
+        fields: list[SymbolData] | None = None,
+    ) -> list[TermCandidate]:
+        """Collect candidate terms from a class without calling the LLM.
+
+        Args:
+            class_data: Class symbol data
+            methods: Optional list of method symbols in the class
+            fields: Optional list of field symbols in the class
+
+        Returns:
+            List of (term, context, source_fqn) candidates
+        """
+        candidates: list[TermCandidate] = []
 
         # Extract class name as term
         class_term = self._extract_class_term(class_data.name)
         if class_term:
-            entry = self._generate_business_meaning(
-                term=class_term,
-                context={
-                    "class_name": class_data.name,
-                    "method_name": "",
-                    "comment": "",
-                },
-                source_fqn=class_data.fqn,
-            )
-            if entry:
-                entries.append(entry)
+            candidates.append((
+                class_term,
+                {"class_name": class_data.name, "method_name": "", "comment": ""},
+                class_data.fqn,
+            ))
 
         # Extract method names as terms
         if methods:
@@ -90,36 +167,28 @@ class DomainGlossaryExtractor:
                 if self._is_domain_relevant_method(method):
                     method_term = self._extract_method_term(method.name)
                     if method_term:
-                        entry = self._generate_business_meaning(
-                            term=method_term,
-                            context={
+                        candidates.append((
+                            method_term,
+                            {
                                 "class_name": class_data.name,
                                 "method_name": method.name,
                                 "comment": "",
                             },
-                            source_fqn=method.fqn,
-                        )
-                        if entry:
-                            entries.append(entry)
+                            method.fqn,
+                        ))
 
         # Extract field names as terms
         if fields:
             for field in fields:
                 field_term = self._extract_field_term(field.name)
                 if field_term:
-                    entry = self._generate_business_meaning(
-                        term=field_term,
-                        context={
-                            "class_name": class_data.name,
-                            "method_name": "",
-                            "comment": "",
-                        },
-                        source_fqn=field.fqn,
-                    )
-                    if entry:
-                        entries.append(entry)
+                    candidates.append((
+                        field_term,
+                        {"class_name": class_data.name, "method_name": "", "comment": ""},
+                        field.fqn,
+                    ))
 
-        return entries
+        return candidates
 
     def build_glossary(
         self,
@@ -128,6 +197,9 @@ class DomainGlossaryExtractor:
     ) -> list[GlossaryEntry]:
         """Build complete glossary from all symbols.
 
+        Candidate terms are collected from every class first, deduplicated
+        by code term, and then explained in multi-term LLM batches.
+
         Args:
             symbols: List of all symbols
             symbol_map: Optional map from FQN to symbol data
@@ -135,29 +207,190 @@ class DomainGlossaryExtractor:
         Returns:
             List of all glossary entries
         """
-        all_entries: list[GlossaryEntry] = []
         symbol_map = symbol_map or {}
 
-        # Group symbols by class
-        classes = [s for s in symbols if s.kind in (SymbolKind.CLASS, SymbolKind.INTERFACE)]
-
+        # Group symbols by class in a single pass
+        classes: list[SymbolData] = []
+        methods_by_parent: dict[str, list[SymbolData]] = defaultdict(list)
+        fields_by_parent: dict[str, list[SymbolData]] = defaultdict(list)
+        for s in symbols:
+            if s.kind in (SymbolKind.CLASS, SymbolKind.INTERFACE):
+                classes.append(s)
+            elif s.kind == SymbolKind.METHOD:
+                methods_by_parent[s.parent_fqn].append(s)
+            elif s.kind == SymbolKind.FIELD:
+                fields_by_parent[s.parent_fqn].append(s)
+
+        # Keep the first occurrence of each term so duplicates never reach the LLM
+        unique_terms: dict[str, TermCandidate] = {}
         for cls in classes:
             # Get methods and fields for this class
-            methods = [s for s in symbols if s.parent_fqn == cls.fqn and s.kind == SymbolKind.METHOD]
-            fields = [s for s in symbols if s.parent_fqn == cls.fqn and s.kind == SymbolKind.FIELD]
+            methods = methods_by_parent.get(cls.fqn, [])
+            fields = fields_by_parent.get(cls.fqn, [])
+
+            for candidate in self._collect_class_terms(cls, methods, fields):
+                unique_terms.setdefault(candidate[0], candidate)
+
+        return self.extract_terms_batch(list(unique_terms.values()))
+
+    def extract_terms_batch(
+        self,
+        terms: list[TermCandidate],
+        batch_size: int = GLOSSARY_BATCH_SIZE,
+    ) -> list[GlossaryEntry]:
+        """Generate business meanings for many terms with multi-term LLM requests.
+
+        Terms are split into chunks of batch_size, each explained by a single
+        LLM request; chunks run concurrently over max_workers threads.
+
+        Args:
+            terms: List of (term, context, source_fqn) candidates
+            batch_size: Terms per LLM request
+
+        Returns:
+            Glossary entries in input order (terms without a meaning are omitted)
+        """
+        if not terms:
+            return []
+
+        # Serve previously explained terms from the persistent cache
+        results: list[GlossaryEntry | None] = [None] * len(terms)
+        misses: list[int] = []
+        for i, candidate in enumerate(terms):
+            results[i] = self._load_cached(candidate)
+            if results[i] is None:
+                misses.append(i)
+
+        pending = [terms[i] for i in misses]
+        chunks = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+        generated: list[GlossaryEntry | None] = []
+        if len(chunks) == 1:
+            generated = self._generate_business_meanings(chunks[0])
+        elif chunks:
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                for chunk_entries in executor.map(self._generate_business_meanings, chunks):
+                    generated.extend(chunk_entries)
+
+        for i, entry in zip(misses, generated, strict=True):
+            results[i] = entry
+            if entry is not None:
+                self._store_cached(terms[i], entry)
+
+        return [entry for entry in results if entry is not None]
+
+    def _generate_business_meanings(
+        self,
+        terms: list[TermCandidate],
+    ) -> list[GlossaryEntry | None]:
+        """Generate business meanings for one chunk of terms in a single LLM call.
 
-            entries = self.extract_terms_from_class(cls, methods, fields)
-            all_entries.extend(entries)
+        Args:
+            terms: List of (term, context, source_fqn) candidates
+
+        Returns:
+            One entry per input term (None where no meaning was returned)
+        """
+        terms_json = json.dumps(
+            [
+                {
+                    "id": i,
+                    "term": term,
+                    "class_name": context.get("class_name", ""),
+                    "method_name": context.get("method_name", ""),
+                    "comment": context.get("comment", ""),
+                }
+                for i, (term, context, _) in enumerate(terms)
+            ],
+            ensure_ascii=False,
+        )
+        prompt = GLOSSARY_BATCH_PROMPT.format(terms_json=terms_json)
 
-        # Remove duplicates (by code_term)
-        seen_terms: set[str] = set()
-        unique_entries: list[GlossaryEntry] = []
-        for entry in all_entries:
-            if entry.code_term not in seen_terms:
-                seen_terms.add(entry.code_term)
-                unique_entries.append(entry)
+        try:
+            result = self.llm_client.generate_structured_response(prompt)
+        except Exception as e:
+            logger.error(f"Failed to generate business meanings for {len(terms)} terms: {e}")
+            return [None] * len(terms)
+
+        meanings: dict[int, dict[str, Any]] = {}
+        for item in result.get("terms", []):
+            if isinstance(item, dict) and isinstance(item.get("id"), int):
+                meanings[item["id"]] = item
+
+        entries: list[GlossaryEntry | None] = []
+        for i, (term, _, source_fqn) in enumerate(terms):
+            item = meanings.get(i)
+            if not item or not item.get("business_meaning"):
+                entries.append(None)
+                continue
+            entries.append(
+                GlossaryEntry(
+                    code_term=term,
+                    business_meaning=item["business_meaning"],
+                    synonyms=item.get("synonyms", []),
+                    source_fqn=source_fqn,
+                )
+            )
+        return entries
 
-        return unique_entries
+    def _cache_key(self, candidate: TermCandidate) -> str | None:
+        """Build the cache key for a term and its context (None if caching is off)."""
+        if self.cache is None:
+            return None
+        term, context, _ = candidate
+        return self.cache.make_key(
+            term,
+            context.get("class_name", ""),
+            context.get("method_name", ""),
+            context.get("comment", ""),
+        )
+
+    def _load_cached(self, candidate: TermCandidate) -> GlossaryEntry | None:
+        """Load a cached business meaning, evicting entries with an invalid shape.
+
+        Args:
+            candidate: (term, context, source_fqn) candidate
+
+        Returns:
+            Cached glossary entry, or None on miss
+        """
+        key = self._cache_key(candidate)
+        if key is None:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+
+        term, _, source_fqn = candidate
+        try:
+            meaning = payload["business_meaning"]
+            synonyms = payload["synonyms"]
+            if not isinstance(meaning, str) or not isinstance(synonyms, list):
+                raise TypeError("business_meaning must be a string and synonyms a list")
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Evicting invalid glossary cache entry for {term}: {e}")
+            self.cache.evict(key)
+            return None
+
+        return GlossaryEntry(
+            code_term=term,
+            business_meaning=meaning,
+            synonyms=synonyms,
+            source_fqn=source_fqn,
+        )
+
+    def _store_cached(self, candidate: TermCandidate, entry: GlossaryEntry) -> None:
+        """Persist a generated business meaning."""
+        key = self._cache_key(candidate)
+        if key is None:
+            return
+        try:
+            self.cache.put(
+                key,
+                {"business_meaning": entry.business_meaning, "synonyms": entry.synonyms},
+                fqn=entry.source_fqn,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to cache business meaning for {entry.code_term}: {e}")
 
     def _extract_class_term(self, class_name: str) -> str | None:
         """Extract domain term from class name.
@@ -169,15 +402,16 @@ class DomainGlossaryExtractor:
             Extracted term or None if not domain-relevant
         """
         # Skip generic test/mock classes
-        if class_name.startswith("Test") or class_name.startswith("Mock"):
+        if class_name.startswith(("Test", "Mock")):
             return None
 
         # Remove common suffixes
         base_name = class_name
-        for suffix in ["Entity", "DTO", "VO", "Model", "Service", "Repository", "Controller", "Manager", "Handler", "Processor"]:
-            if base_name.endswith(suffix):
-                base_name = base_name[: -len(suffix)]
-                break
+        if class_name.endswith(_CLASS_SUFFIXES):
+            for suffix in _CLASS_SUFFIXES_LONGEST_FIRST:
+                if class_name.endswith(suffix):
+                    base_name = class_name[: -len(suffix)]
+                    break
 
         # Skip if too short after removing suffix
         if len(base_name) < 3:
@@ -195,12 +429,11 @@ class DomainGlossaryExtractor:
             Extracted term or None if not domain-relevant
         """
         # Skip getters/setters and common methods
-        for pattern in self.GETTER_SETTER_PATTERNS:
-            if re.match(pattern, method_name):
-                return None
+        if _is_accessor_name(method_name):
+            return None
 
         # Convert camelCase to space-separated words
-        term = re.sub(r"([A-Z])", r" \1", method_name).strip().lower()
+        term = _split_camel(method_name)
 
         # Skip if too short
         if len(term) < 3:
@@ -222,7 +455,7 @@ class DomainGlossaryExtractor:
             return None
 
         # Convert camelCase to space-separated words
-        term = re.sub(r"([A-Z])", r" \1", field_name).strip().lower()
+        term = _split_camel(field_name)
 
         # Skip if too short
         if len(term) < 3:
@@ -242,54 +475,11 @@ class DomainGlossaryExtractor:
         name = method.name
 
         # Skip getters/setters
-        for pattern in self.GETTER_SETTER_PATTERNS:
-            if re.match(pattern, name):
-                return False
+        if _is_accessor_name(name):
+            return False
 
         # Include methods with business-related verbs
-        business_verbs = ["create", "update", "delete", "save", "find", "validate", "process", "calculate", "generate"]
-        return any(name.startswith(verb) or verb in name.lower() for verb in business_verbs)
-
-    def _generate_business_meaning(
-        self,
-        term: str,
-        context: dict[str, str],
-        source_fqn: str,
-    ) -> GlossaryEntry | None:
-        """Generate business meaning for a term using LLM.
-
-        Args:
-            term: Code term
-            context: Context (class_name, method_name, comment)
-            source_fqn: Source symbol FQN
-
-        Returns:
-            GlossaryEntry or None if generation failed
-        """
-        prompt = GLOSSARY_TERM_PROMPT.format(
-            term=term,
-            class_name=context.get("class_name", ""),
-            method_name=context.get("method_name", ""),
-            comment=context.get("comment", ""),
-        )
-
-        try:
-            result = self.llm_client.generate_structured_response(prompt)
-            business_meaning = result.get("business_meaning", "")
-            synonyms = result.get("synonyms", [])
-
-            if not business_meaning:
-                return None
-
-            return GlossaryEntry(
-                code_term=term,
-                business_meaning=business_meaning,
-                synonyms=synonyms,
-                source_fqn=source_fqn,
-            )
-        except Exception as e:
-            logger.error(f"Failed to generate business meaning for {term}: {e}")
-            return None
+        return _BUSINESS_VERB_RE.search(name) is not None
 
     def close(self) -> None:
         """Close the LLM client."""
@@ -6,23 +6,97 @@ Coordinates incremental summary updates using parallel processing
 and dependency tracking.
 """
 
+import json
 import logging
+import sqlite3
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
-from ariadne_core.models.types import SymbolData
+from ariadne_core.models.types import SummaryData, SummaryLevel, SymbolData, SymbolKind
 from ariadne_core.storage.sqlite_store import SQLiteStore
 from ariadne_llm import LLMClient
 
 from .cost_tracker import LLMCostTracker
 from .dependency_tracker import DependencyTracker
 from .parallel_summarizer import ParallelSummarizer
+from .semantic_cache import SemanticSummaryCache
 
 logger = logging.getLogger(__name__)
 
+# Symbol kind by stored value (plain dict lookup instead of Enum value resolution)
+_KIND_BY_VALUE = {kind.value: kind for kind in SymbolKind}
 
-@dataclass
+# Completed summaries are written in batches of this size, or after this many
+# seconds, whichever comes first
+SUMMARY_WRITE_BATCH_SIZE = 50
+SUMMARY_WRITE_INTERVAL = 5.0
+
+
+# Summary level by symbol kind; anything not listed is summarized as a method
+_LEVEL_BY_KIND = {
+    SymbolKind.METHOD: SummaryLevel.METHOD,
+    SymbolKind.CLASS: SummaryLevel.CLASS,
+    SymbolKind.INTERFACE: SummaryLevel.CLASS,
+}
+
+
+class _SummaryWriter:
+    """Buffers completed summaries and writes them on a single DB thread.
+
+    Batches are handed to the given single-worker executor, so writes overlap
+    with ongoing LLM calls and summaries already generated survive a crash
+    later in the run.
+    """
+
+    def __init__(self, store: SQLiteStore, executor: ThreadPoolExecutor) -> None:
+        self.store = store
+        self.executor = executor
+        self.buffer: list[SummaryData] = []
+        self.futures: list[Future[int]] = []
+        self.submitted = 0
+        self.write_time = 0.0
+        self._last_flush = time.time()
+
+    def add(self, summary: SummaryData) -> None:
+        """Buffer a summary, flushing when the batch is full or stale."""
+        self.buffer.append(summary)
+        if (
+            len(self.buffer) >= SUMMARY_WRITE_BATCH_SIZE
+            or time.time() - self._last_flush >= SUMMARY_WRITE_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the buffered summaries to the writer thread."""
+        if self.buffer:
+            self.submitted += len(self.buffer)
+            self.futures.append(self.executor.submit(self._write, self.buffer))
+            self.buffer = []
+        self._last_flush = time.time()
+
+    def _write(self, summaries: list[SummaryData]) -> int:
+        start = time.time()
+        # Fresh summaries were filtered out up front; the upsert also skips
+        # any that became fresh concurrently
+        created = self.store.batch_create_summaries(summaries, keep_fresh=True)
+        self.write_time += time.time() - start
+        return created
+
+    def close(self) -> int:
+        """Flush the remainder and wait for all writes.
+
+        Returns:
+            Number of summaries created/updated
+        """
+        self.flush()
+        return sum(future.result() for future in self.futures)
+
+
+@dataclass(slots=True)
 class IncrementalResult:
     """Result of incremental summary regeneration.
 
@@ -63,6 +137,7 @@ class IncrementalSummarizerCoordinator:
         llm_client: LLMClient,
         store: SQLiteStore,
         max_workers: int = 10,
+        semantic_cache: SemanticSummaryCache | None = None,
     ) -> None:
         """Initialize coordinator.
 
@@ -70,12 +145,18 @@ class IncrementalSummarizerCoordinator:
             llm_client: LLM client for generating summaries
             store: SQLiteStore for database access
             max_workers: Maximum concurrent workers
+            semantic_cache: Optional cache reusing summaries of near-duplicate methods
         """
         self.llm_client = llm_client
         self.store = store
-        self.parallel = ParallelSummarizer(llm_client, max_workers=max_workers)
+        self.parallel = ParallelSummarizer(
+            llm_client, max_workers=max_workers, semantic_cache=semantic_cache
+        )
         self.tracker = DependencyTracker(store)
         self.cost_tracker = LLMCostTracker()
+        # Single background reader so the cache-filter lookup overlaps symbol
+        # loading; its thread keeps one SQLite connection (WAL allows concurrent reads)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ariadne-io")
 
     def regenerate_incremental(
         self,
@@ -128,8 +209,6 @@ class IncrementalSummarizerCoordinator:
         )
 
         # 2. Load symbol data for affected symbols
-        symbols_data: list[tuple[SymbolData, str]] = []
-
         # Batch fetch: Get all symbols in one query
         if not affected.total_set:
             duration = time.time() - start_time
@@ -153,56 +232,64 @@ class IncrementalSummarizerCoordinator:
             )
 
         load_start = time.time()
-        placeholders = ",".join("?" * len(affected.total_set))
-        cursor = self.store.conn.cursor()
-        symbol_dicts = cursor.execute(
-            f"SELECT * FROM symbols WHERE fqn IN ({placeholders})",
-            list(affected.total_set)
-        ).fetchall()
-
-        for symbol_dict in [dict(row) for row in symbol_dicts]:
-            fqn = symbol_dict["fqn"]
-
-            # Get source code
-            source_code = ""
-            if symbol_source_map and fqn in symbol_source_map:
-                source_code = symbol_source_map[fqn]
-            elif symbol_dict.get("file_path"):
-                # Could read from file, but for now skip
-                logger.debug(f"No source code provided for {fqn}")
-                continue
-
-            if not source_code:
-                continue
-
-            # Convert to SymbolData
-            from ariadne_core.models.types import SymbolKind
-
-            kind_str = symbol_dict.get("kind", "")
-            try:
-                kind = SymbolKind(kind_str)
-            except ValueError:
-                logger.warning(f"Unknown symbol kind: {kind_str}")
-                continue
-
-            symbol = SymbolData(
-                fqn=symbol_dict["fqn"],
-                kind=kind,
-                name=symbol_dict["name"],
-                file_path=symbol_dict.get("file_path"),
-                line_number=symbol_dict.get("line_number"),
-                signature=symbol_dict.get("signature"),
-                parent_fqn=symbol_dict.get("parent_fqn"),
-                modifiers=symbol_dict.get("modifiers") or [],
-                annotations=symbol_dict.get("annotations") or [],
-            )
+        affected_fqns = list(affected.total_set)
+        fresh_future = self._io_pool.submit(
+            self.store.batch_get_fresh_summary_fqns, affected_fqns
+        )
+        hashes_future = self._io_pool.submit(
+            self.store.batch_get_summary_source_hashes, affected_fqns
+        )
+
+        # Pending symbols only (level and input hash); entries are dropped as
+        # their summaries are written
+        pending_by_fqn: dict[str, tuple[SummaryLevel, str]] = {}
+        # Stale summaries whose input is unchanged, to be marked fresh
+        unchanged_fqns: list[str] = []
+        loaded_count = 0
+        skipped_count = 0
+        to_process = 0
+        load_time = 0.0
+
+        def symbols_to_summarize() -> Iterator[tuple[SymbolData, str]]:
+            """Stream symbol rows and yield those without a fresh summary."""
+            nonlocal loaded_count, skipped_count, to_process, load_time
+            fresh_summaries: set[str] | None = None
+            stored_hashes: dict[str, str] = {}
+
+            for row in self.store.iter_symbols(affected_fqns):
+                symbol_with_source = self._symbol_from_row(row, symbol_source_map)
+                if symbol_with_source is None:
+                    continue
+                loaded_count += 1
+                symbol = symbol_with_source[0]
+
+                # 3. Filter out cached non-stale summaries (fetched alongside the symbols)
+                if fresh_summaries is None:
+                    fresh_summaries = fresh_future.result()
+                    stored_hashes = hashes_future.result()
+                if symbol.fqn in fresh_summaries:
+                    # Skip if we have a fresh cached summary
+                    skipped_count += 1
+                    continue
+
+                # Reuse stale summaries generated from identical input, e.g. by
+                # an interrupted earlier run over the same changes
+                source_hash = self.parallel.source_hash(*symbol_with_source)
+                if stored_hashes.get(symbol.fqn) == source_hash:
+                    unchanged_fqns.append(symbol.fqn)
+                    skipped_count += 1
+                    continue
 
-            symbols_data.append((symbol, source_code))
+                level = _LEVEL_BY_KIND.get(symbol.kind, SummaryLevel.METHOD)
+                pending_by_fqn[symbol.fqn] = (level, source_hash)
+                to_process += 1
+                yield symbol_with_source
 
-        load_time = time.time() - load_start
+            load_time = time.time() - load_start
 
-        # 3. Filter out cached non-stale summaries
-        if not symbols_data:
+        pending = symbols_to_summarize()
+        first = next(pending, None)
+        if first is None and not loaded_count:
             duration = time.time() - start_time
             logger.info(
                 f"No valid symbols with source code",
@@ -218,120 +305,80 @@ class IncrementalSummarizerCoordinator:
                 cost_report=self.cost_tracker.get_report(),
             )
 
-        # Check for existing non-stale summaries - batch fetch
-        filtered_symbols: list[tuple[SymbolData, str]] = []
-        skipped_count = 0
-
-        if symbols_data:
-            fqns = [s.fqn for s, _ in symbols_data]
-            placeholders = ",".join("?" * len(fqns))
-            summaries = cursor.execute(
-                f"SELECT target_fqn, is_stale FROM summaries WHERE target_fqn IN ({placeholders})",
-                fqns
-            ).fetchall()
-            fresh_summaries = {row[0]: row[1] for row in summaries if not row[1]}
+        # 4. Parallel summarization; symbols are dispatched as soon as they pass
+        # the cache filter, overlapping LLM calls with the remaining row reads
+        # 5. Each completed summary is queued for the DB writer thread
+        writer = _SummaryWriter(self.store, self._io_pool)
+
+        def write_summary(fqn: str, summary_text: str) -> None:
+            level, source_hash = pending_by_fqn.pop(fqn)
+            writer.add(
+                SummaryData(
+                    target_fqn=fqn,
+                    level=level,
+                    summary=summary_text,
+                    is_stale=False,  # Fresh summary
+                    # Fallbacks carry no hash so a later run retries the LLM
+                    source_hash=None if fqn in self.parallel.failed_fqns else source_hash,
+                )
+            )
 
-            for symbol, source_code in symbols_data:
-                if symbol.fqn in fresh_summaries:
-                    # Skip if we have a fresh cached summary
-                    skipped_count += 1
-                    continue
-                filtered_symbols.append((symbol, source_code))
+        sum_start = time.time()
+        try:
+            # Summaries go straight to the writer; none are kept in memory
+            self.parallel.summarize_symbols_batch(
+                chain([first], pending) if first is not None else [],
+                show_progress=show_progress,
+                on_complete=write_summary,
+                collect=False,
+            )
+        finally:
+            # Persist whatever completed, even if summarization failed midway
+            sum_time = time.time() - sum_start
+            created_count = writer.close()
+        db_time = writer.write_time
+        generated_count = writer.submitted
+
+        if unchanged_fqns:
+            reused_count = self._io_pool.submit(
+                self.store.mark_summaries_fresh, unchanged_fqns
+            ).result()
+            logger.info(f"Reused {reused_count} stale summaries with unchanged input")
 
         logger.info(
-            f"Filtered {len(filtered_symbols)} symbols to process, "
+            f"Filtered {to_process} symbols to process, "
             f"{skipped_count} cached",
             extra={
                 "event": "cache_filter_complete",
-                "to_process": len(filtered_symbols),
+                "to_process": to_process,
                 "cached": skipped_count,
             }
         )
-
-        # 4. Parallel summarization
-        sum_start = time.time()
-        summaries = self.parallel.summarize_symbols_batch(
-            filtered_symbols, show_progress=show_progress
-        )
-        sum_time = time.time() - sum_start
-
         logger.info(
-            f"Generated {len(summaries)} summaries in {sum_time:.2f}s",
+            f"Generated {generated_count} summaries in {sum_time:.2f}s",
             extra={
                 "event": "summarization_complete",
-                "generated": len(summaries),
+                "generated": generated_count,
                 "summarization_time": f"{sum_time:.2f}s",
-                "throughput": f"{len(summaries) / sum_time:.1f} summaries/sec",
+                "throughput": f"{generated_count / sum_time:.1f} summaries/sec",
             }
         )
 
-        # 5. Batch update database
-        db_start = time.time()
-
-        # Batch fetch all existing summaries to avoid N+1 queries
-        if summaries:
-            placeholders = ",".join("?" * len(summaries))
-            cursor = self.store.conn.cursor()
-            try:
-                existing_summaries = cursor.execute(
-                    f"SELECT target_fqn, is_stale FROM summaries WHERE target_fqn IN ({placeholders})",
-                    list(summaries.keys())
-                ).fetchall()
-                # Build lookup dict: FQN -> is_stale
-                fresh_summaries = {row[0]: row[1] for row in existing_summaries if not row[1]}
-            finally:
-                cursor.close()
-        else:
-            fresh_summaries = {}
-
-        from ariadne_core.models.types import SummaryData, SummaryLevel
-
-        # Build all SummaryData objects for batch insert
-        summaries_to_create: list[SummaryData] = []
-        skipped_concurrent = 0
-
-        for fqn, summary_text in summaries.items():
-            # Check if already fresh (O(1) lookup instead of DB query)
-            if fqn in fresh_summaries:
-                logger.info(f"Skipping {fqn} - no longer stale (concurrent update)")
-                skipped_concurrent += 1
-                continue
-
-            # Determine level
-            symbol = next((s for s, _ in filtered_symbols if s.fqn == fqn), None)
-            if symbol:
-                if symbol.kind.name == "METHOD":
-                    level = SummaryLevel.METHOD
-                elif symbol.kind.name in ("CLASS", "INTERFACE"):
-                    level = SummaryLevel.CLASS
-                else:
-                    level = SummaryLevel.METHOD
-
-                summaries_to_create.append(
-                    SummaryData(
-                        target_fqn=fqn,
-                        level=level,
-                        summary=summary_text,
-                        is_stale=False,  # Fresh summary
-                    )
-                )
-
-        # Batch create all summaries in one operation
-        if summaries_to_create:
-            created_count = self.store.batch_create_summaries(summaries_to_create)
+        skipped_concurrent = writer.submitted - created_count
+        if created_count:
             logger.info(f"Batch created {created_count} summaries")
-
-        db_time = time.time() - db_start
+        if skipped_concurrent:
+            logger.info(f"Skipped {skipped_concurrent} summaries - no longer stale (concurrent update)")
 
         duration = time.time() - start_time
-        throughput = len(summaries) / duration if duration > 0 else 0
+        throughput = generated_count / duration if duration > 0 else 0
 
         logger.info(
-            f"Incremental update complete: {len(summaries)} regenerated, "
+            f"Incremental update complete: {generated_count} regenerated, "
             f"{skipped_count} cached, {duration:.2f}s total",
             extra={
                 "event": "incremental_update_complete",
-                "regenerated": len(summaries),
+                "regenerated": generated_count,
                 "cached": skipped_count,
                 "duration": f"{duration:.2f}s",
                 "throughput": f"{throughput:.1f} summaries/sec",
@@ -346,7 +393,7 @@ class IncrementalSummarizerCoordinator:
         parallel_stats = self.parallel.get_stats()
 
         return IncrementalResult(
-            regenerated_count=len(summaries),
+            regenerated_count=generated_count,
             skipped_cached=skipped_count,
             duration_seconds=duration,
             cost_report=self.cost_tracker.get_report(),
@@ -364,6 +411,57 @@ class IncrementalSummarizerCoordinator:
             throughput_per_second=throughput,
         )
 
+    def _symbol_from_row(
+        self,
+        row: sqlite3.Row,
+        symbol_source_map: dict[str, str] | None,
+    ) -> tuple[SymbolData, str] | None:
+        """Convert a symbol row to SymbolData paired with its source code.
+
+        Args:
+            row: Row from the symbols table
+            symbol_source_map: Optional map from FQN to source code
+
+        Returns:
+            (symbol, source_code), or None if there is no source or the kind is unknown
+        """
+        fqn = row["fqn"]
+
+        # Get source code
+        source_code = ""
+        if symbol_source_map and fqn in symbol_source_map:
+            source_code = symbol_source_map[fqn]
+        elif row["file_path"]:
+            # Could read from file, but for now skip
+            logger.debug(f"No source code provided for {fqn}")
+            return None
+
+        if not source_code:
+            return None
+
+        # Convert to SymbolData
+        kind = _KIND_BY_VALUE.get(row["kind"])
+        if kind is None:
+            logger.warning(f"Unknown symbol kind: {row['kind']}")
+            return None
+
+        symbol = SymbolData(
+            fqn=fqn,
+            kind=kind,
+            name=row["name"],
+            file_path=row["file_path"],
+            line_number=row["line_number"],
+            signature=row["signature"],
+            parent_fqn=row["parent_fqn"],
+            modifiers=json.loads(row["modifiers"]),
+            annotations=json.loads(row["annotations"]),
+        )
+        return symbol, source_code
+
     def close(self) -> None:
         """Clean up resources."""
+        # Close the reader thread's own connection before stopping it
+        self._io_pool.submit(self.store.close).result()
+        self._io_pool.shutdown()
+        self.parallel.close()
         self.llm_client.close()
@@ -2,23 +2,57 @@
 Parallel LLM Summarizer
 ========================
 
-High-performance parallel summarizer using ThreadPoolExecutor.
+High-performance parallel summarizer running concurrent LLM calls on asyncio.
 Processes multiple symbols concurrently with progress tracking and error isolation.
 """
 
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from threading import Lock
 from typing import Any
 
-from ariadne_core.models.types import SymbolData
+from ariadne_core.models.types import SymbolData, SymbolKind
 from ariadne_llm import LLMClient
+from ariadne_llm.client import SUMMARY_SYSTEM_PROMPT
+
+from .extraction_cache import ExtractionCache, prompt_version
+from .semantic_cache import SemanticSummaryCache, normalize_source
 
 logger = logging.getLogger(__name__)
 
+# Runs with more uncached symbols than this go through the provider Batch API
+BATCH_API_THRESHOLD = 100
+
+# Version tag of the method summary prompt (part of source_hash())
+METHOD_PROMPT_VERSION = prompt_version(SUMMARY_SYSTEM_PROMPT)
+
+# Name prefixes that mark accessors in fallback summaries
+_GETTER_PREFIXES = ("get", "is")
+_SETTER_PREFIX = "set"
+
+# Object methods the summary prompt answers with "N/A" regardless of body
+_TRIVIAL_METHOD_NAMES = frozenset({"toString", "equals", "hashCode"})
+
+# Longest normalized source still checked against the accessor pattern
+_TRIVIAL_MAX_SOURCE_CHARS = 200
+
+# Single-statement getter/setter: "return field;" or "this.field = value;"
+_TRIVIAL_ACCESSOR_PATTERN = re.compile(
+    r"(?:@\w+ )*(?:(?:public|protected|private|static|final) )*[\w<>\[\]?,. ]+ "
+    r"(?:get|is|set)\w* ?\([^)]*\) ?\{ ?"
+    r"(?:return (?:this\.)?\w+;|this\.\w+ ?= ?\w+;) ?\}"
+)
+
 
 class ParallelSummarizer:
-    """Parallel summarizer using ThreadPoolExecutor for concurrent LLM calls.
+    """Parallel summarizer using asyncio for concurrent LLM calls.
 
     Features:
     - Concurrent processing with configurable worker count
@@ -27,104 +61,418 @@ class ParallelSummarizer:
     - Fallback summaries for failed items
     """
 
-    def __init__(self, llm_client: LLMClient, max_workers: int = 10) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        max_workers: int = 10,
+        cache: ExtractionCache | None = None,
+        semantic_cache: SemanticSummaryCache | None = None,
+        batch_threshold: int | None = BATCH_API_THRESHOLD,
+    ) -> None:
         """Initialize parallel summarizer.
 
         Args:
             llm_client: LLM client for generating summaries
             max_workers: Maximum concurrent workers (defaults to 10)
+            cache: Optional persistent summary cache consulted before each LLM call
+            semantic_cache: Optional similarity cache consulted on exact-cache misses
+            batch_threshold: Runs larger than this use the provider Batch API when
+                available (None always uses concurrent online calls)
         """
         self.llm_client = llm_client
         self.max_workers = max_workers
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.batch_threshold = batch_threshold
         self.stats: dict[str, int] = {
             "total": 0,
             "success": 0,
             "failed": 0,
             "skipped": 0,
+            "cache_hits": 0,
+            "semantic_hits": 0,
+            "trivial_skipped": 0,
         }
         self._stats_lock = Lock()
+        # Event loop for the sync API, created on first use
+        self._runner: asyncio.Runner | None = None
+        # Symbols of the current batch that got a fallback instead of an LLM summary
+        self.failed_fqns: set[str] = set()
 
     def summarize_symbols_batch(
         self,
-        symbols: list[tuple[SymbolData, str]],
+        symbols: Iterable[tuple[SymbolData, str]],
         show_progress: bool = True,
+        on_complete: Callable[[str, str], None] | None = None,
+        collect: bool = True,
     ) -> dict[str, str]:
         """Summarize multiple symbols in parallel.
 
+        Runs asummarize_symbols_batch() on a private event loop that is kept
+        across batches, so the LLM client's async connection pool (and its
+        keep-alive connections) is reused until close(). Must not be called
+        from a thread that is already running an event loop.
+
         Args:
-            symbols: List of (symbol_data, source_code) tuples
+            symbols: Iterable of (symbol_data, source_code) tuples
             show_progress: Whether to show progress bar
+            on_complete: Optional callback invoked with (fqn, summary) as each
+                summary (or fallback) completes, in the calling thread
+            collect: Keep summaries for the returned dict; pass False when
+                on_complete persists them, so each one can be freed right away
 
         Returns:
-            Dict mapping FQN to generated summary
+            Dict mapping FQN to generated summary (empty if collect is False)
         """
-        if not symbols:
-            return {}
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(
+            self.asummarize_symbols_batch(symbols, show_progress, on_complete, collect)
+        )
+
+    async def asummarize_symbols_batch(
+        self,
+        symbols: Iterable[tuple[SymbolData, str]],
+        show_progress: bool = True,
+        on_complete: Callable[[str, str], None] | None = None,
+        collect: bool = True,
+    ) -> dict[str, str]:
+        """Summarize multiple symbols concurrently on the running event loop.
 
-        self.stats["total"] = len(symbols)
+        At most max_workers LLM calls run at once (an asyncio.Semaphore, no
+        worker threads when the client has agenerate_summary()). Symbols are
+        pulled from the iterable as calls complete, with at most
+        max_workers * 2 pending, so a generator can keep producing work while
+        the first summaries are being generated. Trivial accessors and
+        Object methods get their "N/A" summary without an LLM call.
+
+        When the provider has a Batch API and more than batch_threshold
+        symbols arrive, the whole worklist is submitted as one batch job
+        instead; symbols the batch does not return are summarized online.
+
+        Args:
+            symbols: Iterable of (symbol_data, source_code) tuples
+            show_progress: Whether to show progress bar
+            on_complete: Optional callback invoked with (fqn, summary) as each
+                summary (or fallback) completes
+            collect: Keep summaries for the returned dict (see summarize_symbols_batch)
+
+        Returns:
+            Dict mapping FQN to generated summary (empty if collect is False)
+        """
+        symbol_iter = iter(symbols)
+        max_in_flight = self.max_workers * 2
+        semaphore = asyncio.Semaphore(self.max_workers)
+        timeout = self.llm_client.config.request_timeout
+
+        # Counters describe this batch only
+        self.reset_stats()
+        self.failed_fqns = set()
         results: dict[str, str] = {}
 
-        # Prepare items with context
-        items = []
-        for symbol, source_code in symbols:
-            class_name = symbol.parent_fqn or ""
-            context = {
-                "class_name": class_name,
-                "method_name": symbol.name,
-                "signature": symbol.signature or "",
-                "modifiers": symbol.modifiers or [],
-                "annotations": symbol.annotations or [],
-            }
-            items.append((symbol.fqn, source_code, context))
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            futures = {
-                executor.submit(self._summarize_single, fqn, code, ctx): (fqn, code, ctx)
-                for fqn, code, ctx in items
-            }
-
-            # Process completed futures
-            pbar = None
-            if show_progress:
-                try:
-                    from tqdm import tqdm
-                    pbar = tqdm(total=len(items), desc="Summarizing")
-                except ImportError:
-                    pass  # tqdm not available, continue without progress bar
-
-            for future in as_completed(futures):
-                fqn, _, context = futures[future]
-                try:
-                    summary = future.result(timeout=self.llm_client.config.request_timeout)
-                    results[fqn] = summary
-                except Exception as e:
-                    logger.error(f"Failed to summarize {fqn}: {e}")
-                    fallback = self._fallback_summary(fqn, context)
-                    results[fqn] = fallback
-                    self._increment_failed()
-                finally:
+        pbar = None
+        if show_progress:
+            try:
+                from tqdm import tqdm
+                # Total is unknown for generators; tqdm then just counts up
+                total = len(symbols) if isinstance(symbols, Sized) else None
+                # Throttle redraws; completions can arrive hundreds per second
+                pbar = tqdm(total=total, desc="Summarizing", mininterval=0.5, smoothing=0.1)
+            except ImportError:
+                pass  # tqdm not available, continue without progress bar
+
+        def skip_trivial(
+            items: Iterator[tuple[SymbolData, str]],
+        ) -> Iterator[tuple[SymbolData, str]]:
+            # Accessors and Object methods never reach the LLM
+            for symbol, source_code in items:
+                trivial = self._trivial_summary(symbol, source_code)
+                if trivial is None:
+                    yield symbol, source_code
+                    continue
+                with self._stats_lock:
+                    self.stats["trivial_skipped"] += 1
+                if pbar:
+                    pbar.update(1)
+                if collect:
+                    results[symbol.fqn] = trivial
+                if on_complete:
+                    on_complete(symbol.fqn, trivial)
+
+        symbol_iter = skip_trivial(symbol_iter)
+
+        if self._use_batch_api():
+            # Peek one past the threshold before committing to a batch job
+            head = list(islice(symbol_iter, self.batch_threshold + 1))
+            if len(head) > self.batch_threshold:
+                pending = head + list(symbol_iter)
+                batch_results = await asyncio.to_thread(self._summarize_via_batch_api, pending)
+                with self._stats_lock:
+                    self.stats["total"] += len(batch_results)
+                    self.stats["success"] += len(batch_results)
+                for fqn, summary in batch_results.items():
+                    if collect:
+                        results[fqn] = summary
                     if pbar:
                         pbar.update(1)
-
+                    if on_complete:
+                        on_complete(fqn, summary)
+                # Whatever the batch did not return falls back to online calls
+                head = [item for item in pending if item[0].fqn not in batch_results]
+            symbol_iter = chain(head, symbol_iter)
+
+        # Sync-only clients run on dedicated threads, sized like the semaphore
+        executor = None
+        if not inspect.iscoroutinefunction(getattr(self.llm_client, "agenerate_summary", None)):
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        async def summarize_one(fqn: str, code: str, context: dict[str, Any]) -> str:
+            key = self._cache_key(fqn, code, context)
+            cached = self._load_cached(key)
+            if cached is not None:
+                with self._stats_lock:
+                    self.stats["cache_hits"] += 1
+                return cached
+
+            vector = None
+            if self.semantic_cache is not None:
+                # Embedding is a blocking HTTP call; keep it off the event loop
+                vector = await asyncio.to_thread(self.semantic_cache.embed, code, context)
+                hit = self.semantic_cache.lookup(vector) if vector is not None else None
+                if hit is not None:
+                    source_fqn, summary, score = hit
+                    logger.debug(f"Semantic cache hit for {fqn} ({source_fqn}, {score:.3f})")
+                    with self._stats_lock:
+                        self.stats["semantic_hits"] += 1
+                    return summary
+
+            async with semaphore:
+                summary = await asyncio.wait_for(
+                    self._summarize_single_async(fqn, code, context, executor), timeout
+                )
+            # "N/A" may be a failed call, so only real summaries are cached
+            if summary != "N/A":
+                self._store_cached(key, fqn, summary)
+                if vector is not None:
+                    self.semantic_cache.add(vector, fqn, summary)
+            return summary
+
+        # Only the symbol is kept per task; its context is rebuilt on failure
+        tasks: dict[asyncio.Task[str], SymbolData] = {}
+
+        def submit_next() -> bool:
+            item = next(symbol_iter, None)
+            if item is None:
+                return False
+            symbol, source_code = item
+            context = self._build_context(symbol)
+            task = asyncio.ensure_future(summarize_one(symbol.fqn, source_code, context))
+            tasks[task] = symbol
+            with self._stats_lock:
+                self.stats["total"] += 1
+            return True
+
+        try:
+            # Prime the window, then refill one slot per completed request
+            while len(tasks) < max_in_flight and submit_next():
+                pass
+
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    symbol = tasks.pop(task)
+                    fqn = symbol.fqn
+                    try:
+                        summary = task.result()
+                        self._increment_success()
+                    except Exception as e:
+                        logger.error(f"Failed to summarize {fqn}: {e}")
+                        summary = self._fallback_summary(fqn, self._build_context(symbol))
+                        self.failed_fqns.add(fqn)
+                        self._increment_failed()
+                    finally:
+                        if pbar:
+                            pbar.update(1)
+                    if collect:
+                        results[fqn] = summary
+                    if on_complete:
+                        on_complete(fqn, summary)
+                    submit_next()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
             if pbar:
                 pbar.close()
 
-        # Calculate success count (safe to do outside the thread pool)
-        with self._stats_lock:
-            self.stats["success"] = self.stats["total"] - self.stats["failed"]
+        stats = self.get_stats()
         logger.info(
-            f"Summarization complete: {self.stats['success']} succeeded, "
-            f"{self.stats['failed']} failed"
+            f"Summarization complete: {stats['success']} succeeded, {stats['failed']} failed"
         )
 
         return results
 
+    def source_hash(self, symbol: SymbolData, source_code: str) -> str:
+        """Hash the LLM input a summary of this symbol is generated from.
+
+        Covers the model, prompt version, source and context, so two equal
+        hashes mean the summary would be regenerated from identical input.
+
+        Args:
+            symbol: Symbol to summarize
+            source_code: Symbol source code
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (
+            self.llm_client.config.model,
+            METHOD_PROMPT_VERSION,
+            source_code,
+            json.dumps(self._build_context(symbol), sort_keys=True),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _build_context(self, symbol: SymbolData) -> dict[str, Any]:
+        """Build the summarization context for a symbol.
+
+        Args:
+            symbol: Symbol to summarize
+
+        Returns:
+            Context dict (class_name, method_name, signature, etc.)
+        """
+        return {
+            "class_name": symbol.parent_fqn or "",
+            "method_name": symbol.name,
+            "signature": symbol.signature or "",
+            "modifiers": symbol.modifiers or [],
+            "annotations": symbol.annotations or [],
+        }
+
+    def _increment_success(self) -> None:
+        """Thread-safe increment of success counter."""
+        with self._stats_lock:
+            self.stats["success"] += 1
+
     def _increment_failed(self) -> None:
         """Thread-safe increment of failed counter."""
         with self._stats_lock:
             self.stats["failed"] += 1
 
+    async def _summarize_single_async(
+        self,
+        fqn: str,
+        source_code: str,
+        context: dict[str, Any],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> str:
+        """Summarize a single symbol without blocking the event loop.
+
+        Uses the client's native async call when available, otherwise runs
+        the sync call on the given executor.
+
+        Args:
+            fqn: Fully qualified name of the symbol
+            source_code: Source code to summarize
+            context: Context dict (class_name, method_name, signature, etc.)
+            executor: Executor for sync-only clients (None uses the loop default)
+
+        Returns:
+            Generated summary text
+        """
+        agenerate = getattr(self.llm_client, "agenerate_summary", None)
+        if inspect.iscoroutinefunction(agenerate):
+            return await agenerate(source_code, context)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, self._summarize_single, fqn, source_code, context
+        )
+
+    def _use_batch_api(self) -> bool:
+        """Check whether large runs should go through the provider Batch API."""
+        return self.batch_threshold is not None and self.llm_client.supports_batch_api()
+
+    def _summarize_via_batch_api(self, items: list[tuple[SymbolData, str]]) -> dict[str, str]:
+        """Summarize symbols with one Batch API job.
+
+        Cached summaries are served first. If the remaining symbols are still
+        above batch_threshold they are submitted together (50% cheaper than
+        online calls, but may take hours); otherwise, or if the job fails,
+        they are left for the concurrent path.
+
+        Args:
+            items: List of (symbol_data, source_code) tuples
+
+        Returns:
+            Dict mapping FQN to summary for cached and batch-completed symbols
+        """
+        results: dict[str, str] = {}
+        requests: dict[str, dict[str, Any]] = {}
+        keys: dict[str, str | None] = {}
+
+        for symbol, source_code in items:
+            context = self._build_context(symbol)
+            key = self._cache_key(symbol.fqn, source_code, context)
+            cached = self._load_cached(key)
+            if cached is not None:
+                results[symbol.fqn] = cached
+                with self._stats_lock:
+                    self.stats["cache_hits"] += 1
+                continue
+            keys[symbol.fqn] = key
+            requests[symbol.fqn] = {"code": source_code, "context": context}
+
+        if len(requests) <= self.batch_threshold:
+            return results
+
+        try:
+            summaries = self.llm_client.batch_api_generate_summaries(requests)
+        except Exception as e:
+            logger.error(f"Batch summarization failed, falling back to online calls: {e}")
+            return results
+
+        for fqn, summary in summaries.items():
+            if fqn not in requests:
+                continue
+            results[fqn] = summary
+            if summary != "N/A":
+                self._store_cached(keys[fqn], fqn, summary)
+        logger.info(f"Batch API returned {len(summaries)}/{len(requests)} summaries")
+        return results
+
+    def _cache_key(self, fqn: str, source_code: str, context: dict[str, Any]) -> str | None:
+        """Build the summary cache key (None if caching is off)."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(fqn, source_code, json.dumps(context, sort_keys=True))
+
+    def _load_cached(self, key: str | None) -> str | None:
+        """Load a cached summary, evicting entries with an invalid shape."""
+        if key is None:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        summary = payload.get("summary") if isinstance(payload, dict) else None
+        if not isinstance(summary, str):
+            self.cache.evict(key)
+            return None
+        return summary
+
+    def _store_cached(self, key: str | None, fqn: str, summary: str) -> None:
+        """Persist a generated summary."""
+        if key is None:
+            return
+        try:
+            self.cache.put(key, {"summary": summary}, fqn=fqn)
+        except OSError as e:
+            logger.warning(f"Failed to cache summary for {fqn}: {e}")
+
     def _summarize_single(self, fqn: str, source_code: str, context: dict[str, Any]) -> str:
         """Summarize a single symbol (runs in worker thread).
 
@@ -138,6 +486,29 @@ class ParallelSummarizer:
         """
         return self.llm_client.generate_summary(source_code, context)
 
+    def _trivial_summary(self, symbol: SymbolData, source_code: str) -> str | None:
+        """Classify methods the LLM would answer with "N/A" anyway.
+
+        Args:
+            symbol: Symbol to summarize
+            source_code: Symbol source code
+
+        Returns:
+            Summary for a trivial method, or None if it needs the LLM
+        """
+        if symbol.kind != SymbolKind.METHOD:
+            return None
+        if symbol.name in _TRIVIAL_METHOD_NAMES:
+            return "N/A"
+        if len(source_code) > _TRIVIAL_MAX_SOURCE_CHARS * 4:
+            return None
+        code = normalize_source(source_code)
+        if len(code) > _TRIVIAL_MAX_SOURCE_CHARS:
+            return None
+        if not _TRIVIAL_ACCESSOR_PATTERN.fullmatch(code):
+            return None
+        return self._fallback_summary(symbol.fqn, self._build_context(symbol))
+
     def _fallback_summary(self, fqn: str, context: dict[str, Any]) -> str:
         """Generate fallback summary based on signature.
 
@@ -153,9 +524,9 @@ class ParallelSummarizer:
 
         # Check if it's likely a getter/setter
         signature = context.get("signature", "")
-        if name.startswith("get") or name.startswith("is") or "return" in signature.lower():
+        if name.startswith(_GETTER_PREFIXES) or "return" in signature.lower():
             return "N/A (getter/accessor)"
-        if name.startswith("set"):
+        if name.startswith(_SETTER_PREFIX):
             return "N/A (setter/mutator)"
 
         # Generate generic fallback
@@ -169,11 +540,24 @@ class ParallelSummarizer:
         """Get statistics from last batch operation.
 
         Returns:
-            Dict with total, success, failed, skipped counts
+            Dict with total, success, failed, skipped, cache_hits, semantic_hits
+            and trivial_skipped counts
         """
         with self._stats_lock:
             return self.stats.copy()
 
+    def close(self) -> None:
+        """Close the private event loop and the async HTTP client bound to it."""
+        if self._runner is None:
+            return
+        aclose = getattr(self.llm_client, "aclose", None)
+        if inspect.iscoroutinefunction(aclose):
+            self._runner.run(aclose())
+        self._runner.close()
+        self._runner = None
+
     def reset_stats(self) -> None:
         """Reset statistics counters."""
-        self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0}
+        with self._stats_lock:
+            for key in self.stats:
+                self.stats[key] = 0
@@ -0,0 +1,149 @@
+"""
+Semantic Summary Cache
+======================
+
+Embedding-similarity cache for near-duplicate method summaries.
+
+Java code is repetitive: overloads, boilerplate CRUD and generated
+accessors often differ only in formatting or comments, so the exact
+content-hash cache misses them. This cache embeds normalized source plus
+signature and reuses the summary of the most similar method summarized so
+far when cosine similarity clears a threshold.
+"""
+
+import logging
+import re
+import threading
+from typing import Any
+
+import numpy as np
+
+from ariadne_llm.embedder import Embedder
+
+logger = logging.getLogger(__name__)
+
+# Minimum cosine similarity for reusing a cached summary
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+# Initial number of vector rows allocated (doubled as the cache grows)
+INITIAL_CAPACITY = 256
+
+_COMMENT_PATTERN = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_source(source_code: str) -> str:
+    """Strip comments and collapse whitespace.
+
+    Args:
+        source_code: Java source code
+
+    Returns:
+        Normalized source on a single line
+    """
+    code = _COMMENT_PATTERN.sub(" ", source_code)
+    return _WHITESPACE_PATTERN.sub(" ", code).strip()
+
+
+class SemanticSummaryCache:
+    """In-memory nearest-neighbour cache of summaries keyed by embeddings.
+
+    Vectors are L2-normalized and kept in one contiguous matrix, so a
+    top-1 lookup is a single matrix-vector product (exact cosine search).
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            embedder: Embedder used to vectorize method source
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self._vectors: np.ndarray | None = None
+        self._entries: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed(self, source_code: str, context: dict[str, Any]) -> np.ndarray | None:
+        """Embed a method for lookup.
+
+        Args:
+            source_code: Method source code
+            context: Summarization context (signature is included in the text)
+
+        Returns:
+            Unit-length embedding, or None if the method cannot be embedded
+        """
+        text = normalize_source(source_code)
+        signature = context.get("signature") or context.get("method_name") or ""
+        if signature:
+            text = f"{signature}\n{text}"
+        if not text.strip():
+            return None
+
+        try:
+            vector = np.asarray(self.embedder.embed_text(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed method for semantic cache: {e}")
+            return None
+
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def lookup(self, vector: np.ndarray) -> tuple[str, str, float] | None:
+        """Find the most similar cached summary.
+
+        Args:
+            vector: Unit-length embedding from embed()
+
+        Returns:
+            (source_fqn, summary, similarity) of the best match, or None if
+            nothing clears the threshold
+        """
+        with self._lock:
+            count = len(self._entries)
+            if count == 0:
+                return None
+            scores = self._vectors[:count] @ vector
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            fqn, summary = self._entries[best]
+
+        if score < self.threshold:
+            return None
+        return fqn, summary, score
+
+    def add(self, vector: np.ndarray, fqn: str, summary: str) -> None:
+        """Index a generated summary.
+
+        Args:
+            vector: Unit-length embedding from embed()
+            fqn: Symbol the summary was generated for
+            summary: Generated summary
+        """
+        with self._lock:
+            count = len(self._entries)
+            if self._vectors is None:
+                self._vectors = np.empty((INITIAL_CAPACITY, vector.shape[0]), dtype=np.float32)
+            elif count == self._vectors.shape[0]:
+                grown = np.empty((count * 2, self._vectors.shape[1]), dtype=np.float32)
+                grown[:count] = self._vectors
+                self._vectors = grown
+            self._vectors[count] = vector
+            self._entries.append((fqn, summary))
+
+    def clear(self) -> None:
+        """Drop all cached summaries."""
+        with self._lock:
+            self._vectors = None
+            self._entries = []
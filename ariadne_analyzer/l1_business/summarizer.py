@@ -6,25 +6,44 @@ Implements bottom-up hierarchical summarization:
 Method → Class → Package → Module
 """
 
+import json
 import logging
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
 from typing import Any
 
 from ariadne_core.models.types import SummaryData, SummaryLevel, SymbolData, SymbolKind
 from ariadne_core.storage.sqlite_store import SQLiteStore
 from ariadne_llm import LLMClient, LLMConfig
+from ariadne_llm.client import SUMMARY_SYSTEM_PROMPT, sanitize_code_for_llm
 from ariadne_llm.config import LLMProvider
 
 from .dependency_tracker import DependencyTracker
+from .extraction_cache import ExtractionCache, prompt_version
 from .parallel_summarizer import ParallelSummarizer
 from .prompts import (
+    CLASS_SUMMARY_PROMPT,
     format_class_prompt,
-    format_method_prompt,
+    format_fused_class_prompt,
     format_module_prompt,
     format_package_prompt,
 )
 
 logger = logging.getLogger(__name__)
 
+# Version tag of the method and class summary prompts (part of the cache key)
+SUMMARY_PROMPT_VERSION = prompt_version(SUMMARY_SYSTEM_PROMPT + CLASS_SUMMARY_PROMPT)
+
+# Classes with more methods than this are summarized one method per call
+FUSED_MAX_METHODS = 20
+
+# Context window assumed for fused prompts (smallest default model window)
+FUSED_CONTEXT_WINDOW_TOKENS = 64_000
+
+# Conservative characters-per-token ratio for prompt size estimates
+CHARS_PER_TOKEN = 3
+
 
 class HierarchicalSummarizer:
     """Hierarchical LLM-based code summarizer.
@@ -36,11 +55,18 @@ class HierarchicalSummarizer:
     4. Module level: Aggregate package summaries into module summary
     """
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        cache_dir: str | Path | None = None,
+        cache_ttl: timedelta | None = None,
+    ) -> None:
         """Initialize summarizer with LLM client.
 
         Args:
             config: Optional LLMConfig (uses env if not provided)
+            cache_dir: Optional directory for the persistent summary cache
+            cache_ttl: Optional maximum age of cached summaries
         """
         if config is None:
             config = LLMConfig.from_env()
@@ -48,6 +74,16 @@ class HierarchicalSummarizer:
         self.llm_client = LLMClient(config)
         self.config = config
 
+        self.cache: ExtractionCache | None = None
+        if cache_dir is not None:
+            self.cache = ExtractionCache(
+                cache_dir,
+                provider=config.provider.value,
+                model=config.model,
+                prompt_version=SUMMARY_PROMPT_VERSION,
+                max_age=cache_ttl,
+            )
+
     def __enter__(self) -> "HierarchicalSummarizer":
         """Context manager entry."""
         return self
@@ -80,16 +116,13 @@ class HierarchicalSummarizer:
             "annotations": method.annotations or [],
         }
 
-        prompt = format_method_prompt(
-            class_name=context["class_name"],
-            method_name=context["method_name"],
-            signature=context["signature"],
-            modifiers=context["modifiers"],
-            annotations=context["annotations"],
-            source_code=source_code,
-        )
-
-        summary = self.llm_client.generate_summary(source_code, context)
+        key = self._cache_key(method.fqn, source_code, json.dumps(context, sort_keys=True))
+        summary = self._load_cached(key)
+        if summary is None:
+            summary = self.llm_client.generate_summary(source_code, context)
+            # "N/A" may be a failed call, so only real summaries are cached
+            if summary != "N/A":
+                self._store_cached(key, method.fqn, summary)
         return summary
 
     def summarize_class(
@@ -122,12 +155,106 @@ class HierarchicalSummarizer:
             method_summaries=valid_summaries,
         )
 
+        key = self._cache_key(class_data.fqn, prompt)
+        cached = self._load_cached(key)
+        if cached is not None:
+            return cached
+
         try:
-            summary = self.llm_client._call_llm(prompt)
-            return summary.strip()
+            summary = self.llm_client._call_llm(prompt).strip()
         except Exception as e:
             logger.error(f"Failed to summarize class {class_data.name}: {e}")
             return f"{class_data.name} ({class_type})"
+        self._store_cached(key, class_data.fqn, summary)
+        return summary
+
+    def summarize_class_fused(
+        self,
+        class_data: SymbolData,
+        methods: list[tuple[SymbolData, str]],
+        class_type: str = "class",
+    ) -> list[SummaryData] | None:
+        """Summarize a small class and all of its methods in one LLM call.
+
+        Saves the per-method roundtrips of summarize_method() plus the
+        summarize_class() call. Only used when the class has at most
+        FUSED_MAX_METHODS methods and the prompt fits in half the context
+        window.
+
+        Args:
+            class_data: Class symbol data
+            methods: List of (method_data, source_code) tuples of the class
+            class_type: Type of class (class, interface, enum, etc.)
+
+        Returns:
+            Method summaries followed by the class summary, or None if the
+            class is too large or the response is unusable (callers then
+            fall back to per-method summaries)
+        """
+        if not methods or len(methods) > FUSED_MAX_METHODS:
+            return None
+
+        prompt = format_fused_class_prompt(
+            class_name=class_data.name,
+            class_type=class_type,
+            annotations=class_data.annotations or [],
+            methods=[
+                {
+                    "signature": method.signature or method.name,
+                    "code": sanitize_code_for_llm(source_code),
+                }
+                for method, source_code in methods
+            ],
+        )
+        if len(prompt) // CHARS_PER_TOKEN >= FUSED_CONTEXT_WINDOW_TOKENS // 2:
+            return None
+
+        key = self._cache_key(class_data.fqn, prompt)
+        payload = self.cache.get(key) if key is not None else None
+        if payload is None:
+            try:
+                payload = self.llm_client.generate_structured_response(prompt)
+            except Exception as e:
+                logger.error(f"Failed fused summary of class {class_data.name}: {e}")
+                return None
+
+        method_summaries = payload.get("methods") if isinstance(payload, dict) else None
+        class_summary = payload.get("class") if isinstance(payload, dict) else None
+        if not isinstance(method_summaries, dict) or not isinstance(class_summary, str):
+            logger.warning(f"Unusable fused summary of class {class_data.name}")
+            if key is not None:
+                self.cache.evict(key)
+            return None
+
+        summaries: list[SummaryData] = []
+        for i, (method, _) in enumerate(methods):
+            summary = method_summaries.get(str(i))
+            if not isinstance(summary, str) or not summary.strip():
+                logger.warning(f"Fused summary of class {class_data.name} missed {method.fqn}")
+                if key is not None:
+                    self.cache.evict(key)
+                return None
+            summaries.append(
+                SummaryData(
+                    target_fqn=method.fqn, level=SummaryLevel.METHOD, summary=summary.strip()
+                )
+            )
+        summaries.append(
+            SummaryData(
+                target_fqn=class_data.fqn,
+                level=SummaryLevel.CLASS,
+                summary=class_summary.strip() or f"{class_data.name} ({class_type})",
+            )
+        )
+
+        if key is not None:
+            try:
+                self.cache.put(
+                    key, {"methods": method_summaries, "class": class_summary}, fqn=class_data.fqn
+                )
+            except OSError as e:
+                logger.warning(f"Failed to cache fused summary for {class_data.fqn}: {e}")
+        return summaries
 
     def summarize_package(
         self,
@@ -222,29 +349,26 @@ class HierarchicalSummarizer:
 
             # Get all affected symbols
             affected_symbols = []
-            for fqn in affected.total_set:
-                symbol = store.get_symbol(fqn)
-                if symbol:
-                    from ariadne_core.models.types import SymbolKind
-
-                    kind_str = symbol.get("kind", "")
-                    try:
-                        kind = SymbolKind(kind_str)
-                    except ValueError:
-                        continue
+            symbol_rows = store.batch_get_symbols(list(affected.total_set))
+            for symbol in symbol_rows.values():
+                kind_str = symbol.get("kind", "")
+                try:
+                    kind = SymbolKind(kind_str)
+                except ValueError:
+                    continue
 
-                    symbol_data = SymbolData(
-                        fqn=symbol["fqn"],
-                        kind=kind,
-                        name=symbol["name"],
-                        file_path=symbol.get("file_path"),
-                        line_number=symbol.get("line_number"),
-                        signature=symbol.get("signature"),
-                        parent_fqn=symbol.get("parent_fqn"),
-                        modifiers=symbol.get("modifiers") or [],
-                        annotations=symbol.get("annotations") or [],
-                    )
-                    affected_symbols.append(symbol_data)
+                symbol_data = SymbolData(
+                    fqn=symbol["fqn"],
+                    kind=kind,
+                    name=symbol["name"],
+                    file_path=symbol.get("file_path"),
+                    line_number=symbol.get("line_number"),
+                    signature=symbol.get("signature"),
+                    parent_fqn=symbol.get("parent_fqn"),
+                    modifiers=symbol.get("modifiers") or [],
+                    annotations=symbol.get("annotations") or [],
+                )
+                affected_symbols.append(symbol_data)
 
             logger.info(
                 f"Incremental update: {len(changed_symbols)} changed -> "
@@ -252,7 +376,9 @@ class HierarchicalSummarizer:
             )
 
             # Use parallel summarizer for affected symbols
-            parallel = ParallelSummarizer(self.llm_client, max_workers=self.config.max_workers)
+            parallel = ParallelSummarizer(
+                self.llm_client, max_workers=self.config.max_workers, cache=self.cache
+            )
 
             items = []
             for symbol in affected_symbols:
@@ -262,11 +388,15 @@ class HierarchicalSummarizer:
                 items.append((symbol, source_code))
 
             if items:
-                summary_results = parallel.summarize_symbols_batch(items, show_progress=True)
+                try:
+                    summary_results = parallel.summarize_symbols_batch(items, show_progress=True)
+                finally:
+                    parallel.close()
 
+                symbol_by_fqn = {symbol.fqn: symbol for symbol in affected_symbols}
                 for fqn, summary_text in summary_results.items():
                     # Determine summary level
-                    symbol = next((s for s in affected_symbols if s.fqn == fqn), None)
+                    symbol = symbol_by_fqn.get(fqn)
                     if not symbol:
                         continue
 
@@ -295,8 +425,30 @@ class HierarchicalSummarizer:
                 if s.kind in (SymbolKind.CLASS, SymbolKind.INTERFACE)
             ]
 
+            # Bucket methods by declaring class once
+            methods_by_class: dict[str, list[SymbolData]] = defaultdict(list)
+            for method in methods:
+                if method.parent_fqn:
+                    methods_by_class[method.parent_fqn].append(method)
+
+            # Small classes get their method and class summaries in one call
+            fused_fqns: set[str] = set()
+            for cls in classes:
+                class_methods = [
+                    (method, symbol_source_map[method.fqn])
+                    for method in methods_by_class.get(cls.fqn, [])
+                    if symbol_source_map.get(method.fqn)
+                ]
+                fused = self.summarize_class_fused(cls, class_methods)
+                if fused:
+                    summaries.extend(fused)
+                    fused_fqns.update(s.target_fqn for s in fused)
+
             # Generate method summaries
+            method_summary_by_fqn: dict[str, str] = {}
             for method in methods:
+                if method.fqn in fused_fqns:
+                    continue
                 source_code = symbol_source_map.get(method.fqn, "")
                 if not source_code:
                     continue
@@ -305,6 +457,7 @@ class HierarchicalSummarizer:
                 summary_text = self.summarize_method(
                     method, source_code, {"class_name": class_name}
                 )
+                method_summary_by_fqn[method.fqn] = summary_text
 
                 summaries.append(
                     SummaryData(
@@ -316,11 +469,14 @@ class HierarchicalSummarizer:
 
             # Generate class summaries (aggregating method summaries)
             for cls in classes:
+                if cls.fqn in fused_fqns:
+                    continue
                 # Get method summaries for this class
-                class_methods = [
-                    s for s in summaries if s.target_fqn.startswith(cls.fqn)
+                method_summaries = [
+                    (method.fqn, method_summary_by_fqn[method.fqn])
+                    for method in methods_by_class.get(cls.fqn, [])
+                    if method.fqn in method_summary_by_fqn
                 ]
-                method_summaries = [(s.target_fqn, s.summary) for s in class_methods]
 
                 if not method_summaries:
                     continue
@@ -351,6 +507,8 @@ class HierarchicalSummarizer:
         Returns:
             List of (fqn, summary) tuples
         """
+        summaries: list[str | None] = []
+        keys: list[str | None] = []
         items = []
         for method, source_code in methods:
             class_name = method.parent_fqn or ""
@@ -361,11 +519,50 @@ class HierarchicalSummarizer:
                 "modifiers": method.modifiers or [],
                 "annotations": method.annotations or [],
             }
-            items.append({"code": source_code, "context": context})
-
-        summaries = self.llm_client.batch_generate_summaries(items, concurrent_limit)
+            key = self._cache_key(method.fqn, source_code, json.dumps(context, sort_keys=True))
+            keys.append(key)
+            summaries.append(self._load_cached(key))
+            if summaries[-1] is None:
+                items.append({"code": source_code, "context": context})
+
+        # Only cache misses go to the LLM; fill them back in input order
+        generated = iter(self.llm_client.batch_generate_summaries(items, concurrent_limit))
+        results = []
+        for (method, _), key, summary in zip(methods, keys, summaries):
+            if summary is None:
+                summary = next(generated)
+                if summary != "N/A":
+                    self._store_cached(key, method.fqn, summary)
+            results.append((method.fqn, summary))
+        return results
+
+    def _cache_key(self, fqn: str, *parts: str) -> str | None:
+        """Build the summary cache key (None if caching is off)."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(fqn, *parts)
+
+    def _load_cached(self, key: str | None) -> str | None:
+        """Load a cached summary, evicting entries with an invalid shape."""
+        if key is None:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        summary = payload.get("summary") if isinstance(payload, dict) else None
+        if not isinstance(summary, str):
+            self.cache.evict(key)
+            return None
+        return summary
 
-        return [(method.fqn, summary) for (method, _), summary in zip(methods, summaries)]
+    def _store_cached(self, key: str | None, fqn: str, summary: str) -> None:
+        """Persist a generated summary."""
+        if key is None:
+            return
+        try:
+            self.cache.put(key, {"summary": summary}, fqn=fqn)
+        except OSError as e:
+            logger.warning(f"Failed to cache summary for {fqn}: {e}")
 
     def close(self) -> None:
         """Close the LLM client."""
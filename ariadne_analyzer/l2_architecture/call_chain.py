@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import re
+from functools import lru_cache
 from typing import Any
 
 from ariadne_core.models.types import CallChainResult
 from ariadne_core.storage.sqlite_store import SQLiteStore
+from ariadne_core.utils.layer import infer_layer
+
+# 缓存的追踪结果数量（热点入口反复追踪时直接命中）
+TRACE_CACHE_SIZE = 256
+
+# HTTP 入口模式: "GET /api/users"，一次匹配同时取出方法和路径
+_HTTP_ENTRY_PATTERN = re.compile(r"(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS) (.*)", re.DOTALL)
 
 
 class CallChainTracer:
-    """从入口点追踪完整调用链。"""
+    """从入口点追踪完整调用链。
 
-    def __init__(self, store: SQLiteStore):
+    追踪结果按 (入口, 最大深度, 数据库版本) 做 LRU 缓存；任何写入都会改变
+    store.data_version，旧结果随之失效。返回的是缓存结果的深拷贝。
+    """
+
+    def __init__(self, store: SQLiteStore, cache_size: int = TRACE_CACHE_SIZE):
         self.store = store
+        self._cached_trace = lru_cache(maxsize=cache_size)(self._trace)
+        # HTTP 入口索引: (data_version, 入口列表, {(method, path): entry})
+        self._http_index: tuple[tuple[int, int, int], list[dict], dict[tuple, dict]] | None = None
 
     def trace_from_entry(
         self,
@@ -31,6 +47,43 @@ class CallChainTracer:
         Returns:
             CallChainResult 包含调用链和外部依赖
         """
+        return self._trace_cached("entry", entry_pattern, max_depth)
+
+    def trace_from_fqn(
+        self,
+        fqn: str,
+        max_depth: int = 10,
+    ) -> CallChainResult:
+        """从 FQN 直接追踪调用链（不需要入口点表）。
+
+        Args:
+            fqn: 符号的完全限定名
+            max_depth: 最大追踪深度
+
+        Returns:
+            CallChainResult
+        """
+        return self._trace_cached("fqn", fqn, max_depth)
+
+    def _trace_cached(self, mode: str, target: str, max_depth: int) -> CallChainResult:
+        """查缓存并返回深拷贝，调用方修改结果不会污染缓存。"""
+        result = self._cached_trace(mode, target, max_depth, self.store.data_version)
+        return copy.deepcopy(result)
+
+    def _trace(
+        self,
+        mode: str,
+        target: str,
+        max_depth: int,
+        data_version: tuple[int, int, int],
+    ) -> CallChainResult:
+        """实际执行追踪；data_version 只参与缓存键。"""
+        if mode == "entry":
+            return self._trace_from_entry(target, max_depth)
+        return self._trace_from_fqn(target, max_depth)
+
+    def _trace_from_entry(self, entry_pattern: str, max_depth: int) -> CallChainResult:
+        """解析入口模式后追踪调用链。"""
         # 1. 解析入口模式
         entry = self._resolve_entry(entry_pattern)
         if not entry:
@@ -53,20 +106,8 @@ class CallChainTracer:
             depth=max(c["depth"] for c in chain) if chain else 0,
         )
 
-    def trace_from_fqn(
-        self,
-        fqn: str,
-        max_depth: int = 10,
-    ) -> CallChainResult:
-        """从 FQN 直接追踪调用链（不需要入口点表）。
-
-        Args:
-            fqn: 符号的完全限定名
-            max_depth: 最大追踪深度
-
-        Returns:
-            CallChainResult
-        """
+    def _trace_from_fqn(self, fqn: str, max_depth: int) -> CallChainResult:
+        """从符号 FQN 追踪调用链。"""
         symbol = self.store.get_symbol(fqn)
         if not symbol:
             raise ValueError(f"Symbol not found: {fqn}")
@@ -85,21 +126,19 @@ class CallChainTracer:
     def _resolve_entry(self, pattern: str) -> dict[str, Any] | None:
         """解析入口模式。"""
         # HTTP 模式: "GET /api/users" 或 "POST /api/orders"
-        http_methods = ("GET ", "POST ", "PUT ", "DELETE ", "PATCH ", "HEAD ", "OPTIONS ")
-        if pattern.startswith(http_methods):
-            parts = pattern.split(" ", 1)
-            if len(parts) == 2:
-                method, path = parts
-                entries = self.store.get_entry_points("http_api")
-                for e in entries:
-                    if e.get("http_method") == method and e.get("http_path") == path:
-                        return e
-                # 尝试路径前缀匹配
-                for e in entries:
-                    if e.get("http_method") == method and path.startswith(
-                        e.get("http_path", "").rstrip("/")
-                    ):
-                        return e
+        match = _HTTP_ENTRY_PATTERN.fullmatch(pattern)
+        if match:
+            method, path = match.groups()
+            entries, exact = self._http_entries()
+            entry = exact.get((method, path))
+            if entry:
+                return entry
+            # 尝试路径前缀匹配
+            for e in entries:
+                if e.get("http_method") == method and path.startswith(
+                    e.get("http_path", "").rstrip("/")
+                ):
+                    return e
             return None
 
         # FQN 模式: 直接查找符号
@@ -115,82 +154,60 @@ class CallChainTracer:
 
         return None
 
+    def _http_entries(self) -> tuple[list[dict], dict[tuple, dict]]:
+        """获取 HTTP 入口列表及 (method, path) 精确匹配索引。
+
+        索引按 store.data_version 缓存，数据库写入后下次解析时重建。
+        """
+        version = self.store.data_version
+        if self._http_index is None or self._http_index[0] != version:
+            entries = self.store.get_entry_points("http_api")
+            exact: dict[tuple, dict] = {}
+            for e in entries:
+                # 与线性查找一致：同一 (method, path) 取第一个入口
+                exact.setdefault((e.get("http_method"), e.get("http_path")), e)
+            self._http_index = (version, entries, exact)
+        return self._http_index[1], self._http_index[2]
+
     def _annotate_layers(self, chain: list[dict]) -> list[dict]:
-        """为调用链标注层级（Controller/Service/Repository）。"""
+        """为调用链标注层级（Controller/Service/Repository）。
+
+        每个目标符号只查询和判断一次：符号一次批量读取，层级按 FQN 缓存。
+        """
+        to_fqns = list(dict.fromkeys(item.get("to_fqn", "") for item in chain))
+        symbols = self.store.batch_get_symbols(to_fqns)
+        layer_cache = {fqn: self._detect_layer(fqn, symbols.get(fqn)) for fqn in to_fqns}
         for item in chain:
-            to_fqn = item.get("to_fqn", "")
-            layer = self._detect_layer(to_fqn)
-            item["layer"] = layer
+            item["layer"] = layer_cache[item.get("to_fqn", "")]
         return chain
 
-    def _detect_layer(self, fqn: str) -> str:
-        """检测符号所属的架构层级。"""
-        symbol = self.store.get_symbol(fqn)
+    def _detect_layer(self, fqn: str, symbol: dict[str, Any] | None = None) -> str:
+        """检测符号所属的架构层级。
+
+        层级在写入符号时已计算并存入 symbols.layer，这里直接读取；
+        不在符号表中的 FQN 按命名约定推断。
+
+        Args:
+            fqn: 符号的完全限定名
+            symbol: 已读取的符号数据（为 None 时按 FQN 推断）
+        """
         if not symbol:
-            # 尝试从 FQN 推断 - 检查完整的 FQN 而不只是最后一部分
-            if "Controller" in fqn:
-                return "controller"
-            elif "Service" in fqn:
-                return "service"
-            elif "Mapper" in fqn or "Dao" in fqn or "Repository" in fqn:
-                return "repository"
-            return "unknown"
-
-        # 从注解推断
-        annotations_str = symbol.get("annotations", "")
-        try:
-            annotations = json.loads(annotations_str) if annotations_str else []
-        except json.JSONDecodeError:
-            annotations = []
-
-        if any("RestController" in a or "Controller" in a for a in annotations):
-            return "controller"
-        elif any("Service" in a for a in annotations):
-            return "service"
-        elif any("Repository" in a or "Mapper" in a for a in annotations):
-            return "repository"
-
-        # 从符号名称推断
-        name = symbol.get("name", "")
-        if "Controller" in name:
-            return "controller"
-        elif "Service" in name and "Impl" not in name:
-            return "service"
-        elif "ServiceImpl" in name:
-            return "service"
-        elif "Mapper" in name or "Dao" in name or "Repository" in name:
-            return "repository"
-
-        # 从 FQN 推断（包括方法所在的类名）
-        if "Controller" in fqn:
-            return "controller"
-        elif "Service" in fqn:
-            return "service"
-        elif "Mapper" in fqn or "Dao" in fqn or "Repository" in fqn:
-            return "repository"
-
-        return "unknown"
+            return infer_layer(fqn)
+        return symbol.get("layer") or infer_layer(
+            fqn, symbol.get("name", ""), symbol.get("annotations")
+        )
 
     def _extract_dependencies(self, chain: list[dict]) -> list[dict]:
         """从调用链中提取外部依赖。"""
-        deps: list[dict] = []
-        seen_targets: set[str] = set()
+        # 收集调用链中所有方法的 FQN（去重并保持顺序）
+        method_fqns = dict.fromkeys(
+            fqn
+            for item in chain
+            for fqn in (item.get("from_fqn"), item.get("to_fqn"))
+            if fqn
+        )
+        if not method_fqns:
+            return []
 
-        # 收集调用链中所有方法的 FQN
-        method_fqns: set[str] = set()
-        for item in chain:
-            method_fqns.add(item.get("from_fqn", ""))
-            method_fqns.add(item.get("to_fqn", ""))
-
-        # 查询这些方法的外部依赖
-        for fqn in method_fqns:
-            if not fqn:
-                continue
-            ext_deps = self.store.get_external_dependencies(caller_fqn=fqn)
-            for dep in ext_deps:
-                target = dep.get("target", "")
-                if target not in seen_targets:
-                    seen_targets.add(target)
-                    deps.append(dep)
-
-        return deps
+        # 一次查询取出这些方法的外部依赖，按 target 去重由 SQL 分组完成
+        return self.store.batch_get_external_dependencies(list(method_fqns))
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import json
-
 from ariadne_core.models.types import AntiPatternData, Severity
 from ariadne_core.storage.sqlite_store import SQLiteStore
 
@@ -30,102 +28,68 @@ class ControllerDaoRule(AntiPatternRule):
         return "Controller 不应直接调用 DAO/Mapper，请通过 Service 层中转"
 
     def detect(self, store: SQLiteStore) -> list[AntiPatternData]:
-        """检测 Controller 直接调用 DAO 的情况。"""
+        """检测 Controller 直接调用 DAO 的情况。
+
+        Controller 方法的全部调用由一次 JOIN 查询取出，被调用类直接读取写入边时
+        解析好的 edges.callee_class_fqn；每个被调用类只判断一次，按类名无法判断的
+        类再一次批量读取注解，避免逐个 Controller/方法/调用访问数据库。
+        """
         results: list[AntiPatternData] = []
 
-        # 获取所有类
-        all_classes = store.get_symbols_by_kind("class")
-
-        # 筛选 Controller 类
-        controllers = []
-        for cls in all_classes:
-            if self._is_controller(cls):
-                controllers.append(cls)
-
-        # 检查每个 Controller 的方法
-        for controller in controllers:
-            # 获取 Controller 中的方法
-            methods = store.get_symbols_by_parent(controller["fqn"])
-
-            for method in methods:
-                if method["kind"] != "method":
-                    continue
-
-                # 获取方法的所有调用
-                calls = store.get_edges_from(method["fqn"], "calls")
-
-                for call in calls:
-                    to_fqn = call.get("to_fqn", "")
-
-                    # 检查是否调用了 DAO/Mapper
-                    if self._is_dao_call(to_fqn, store):
-                        results.append(
-                            AntiPatternData(
-                                rule_id=self.rule_id,
-                                from_fqn=method["fqn"],
-                                to_fqn=to_fqn,
-                                severity=Severity.ERROR,
-                                message=self.description,
-                            )
-                        )
+        # 一次查询：Controller 类（名称或注解含 Controller，区分大小写）中方法的所有调用
+        calls = store.conn.execute(
+            """
+            SELECT m.fqn AS from_fqn, e.to_fqn, e.callee_class_fqn
+            FROM symbols c
+            JOIN symbols m ON m.parent_fqn = c.fqn AND m.kind = 'method'
+            JOIN edges e ON e.from_fqn = m.fqn AND e.relation = 'calls'
+            WHERE c.kind = 'class'
+              AND (instr(c.name, 'Controller') > 0 OR instr(c.annotations, 'Controller') > 0)
+            ORDER BY c.id, m.id, e.id
+            """
+        ).fetchall()
+
+        # 先按类名判断，剩余的类统一批量读取注解
+        is_dao_class = {
+            class_fqn: self._is_dao_class_name(class_fqn)
+            for class_fqn in dict.fromkeys(call["callee_class_fqn"] for call in calls)
+            if class_fqn
+        }
+        unresolved = [class_fqn for class_fqn, is_dao in is_dao_class.items() if is_dao is None]
+        if unresolved:
+            class_symbols = store.batch_get_symbols(unresolved)
+            for class_fqn in unresolved:
+                is_dao_class[class_fqn] = self._has_dao_annotation(class_symbols.get(class_fqn))
+
+        for call in calls:
+            # 检查是否调用了 DAO/Mapper
+            if is_dao_class.get(call["callee_class_fqn"]):
+                results.append(
+                    AntiPatternData(
+                        rule_id=self.rule_id,
+                        from_fqn=call["from_fqn"],
+                        to_fqn=call["to_fqn"],
+                        severity=Severity.ERROR,
+                        message=self.description,
+                    )
+                )
 
         return results
 
-    def _is_controller(self, symbol: dict) -> bool:
-        """判断是否是 Controller 类。"""
-        name = symbol.get("name", "")
-        annotations_str = symbol.get("annotations", "")
-
-        # 从注解判断
-        try:
-            annotations = json.loads(annotations_str) if annotations_str else []
-        except json.JSONDecodeError:
-            annotations = []
+    @staticmethod
+    def _is_dao_class_name(class_fqn: str) -> bool | None:
+        """按类名判断是否是 DAO/Mapper（名称无法判断时返回 None）。"""
+        class_name = class_fqn.rsplit(".", 1)[-1]
 
-        for ann in annotations:
-            if "RestController" in ann or "Controller" in ann:
-                return True
-
-        # 从名称判断
-        return "Controller" in name
-
-    def _is_dao_call(self, fqn: str, store: SQLiteStore) -> bool:
-        """判断是否是 DAO/Mapper 调用。"""
-        if not fqn:
-            return False
-
-        # 提取类名部分
-        if "(" in fqn:
-            fqn = fqn.split("(")[0]
+        if any(pattern in class_name for pattern in ("Mapper", "Dao", "Repository")):
+            # 排除 Base 类
+            return not class_name.startswith("Base")
+        return None
 
-        if "." not in fqn:
+    @staticmethod
+    def _has_dao_annotation(class_symbol: dict | None) -> bool:
+        """按注解判断类是否是 DAO/Mapper（JSON 文本子串匹配）。"""
+        if not class_symbol:
             return False
-
-        # 获取方法所属的类
-        class_fqn = fqn.rsplit(".", 1)[0]
-        class_name = class_fqn.rsplit(".", 1)[-1] if "." in class_fqn else class_fqn
-
-        # 从名称判断
-        if any(
-            pattern in class_name
-            for pattern in ("Mapper", "Dao", "Repository")
-        ):
-            # 排除 Base 类
-            if class_name.startswith("Base"):
-                return False
-            return True
-
-        # 尝试查询符号
-        class_symbol = store.get_symbol(class_fqn)
-        if class_symbol:
-            annotations_str = class_symbol.get("annotations", "")
-            try:
-                annotations = json.loads(annotations_str) if annotations_str else []
-            except json.JSONDecodeError:
-                annotations = []
-
-            for ann in annotations:
-                if "Repository" in ann or "Mapper" in ann:
-                    return True
-
-        return False
+        annotations = class_symbol.get("annotations") or ""
+        return "Repository" in annotations or "Mapper" in annotations
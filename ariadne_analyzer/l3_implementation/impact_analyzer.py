@@ -1,11 +1,29 @@
 """L3 Impact Analyzer - Reverse call graph traversal for change impact analysis."""
 
+import json
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
 from ariadne_core.storage.sqlite_store import SQLiteStore
 from ariadne_core.utils.layer import determine_layer_or_unknown
 
+# Bound on caller rows generated by the reverse traversal. Risk and confidence
+# saturate after a few dozen callers, so deeper fan-out only costs time; the
+# traversal is breadth-first, so the deepest callers are the ones dropped.
+MAX_CALLER_ROWS = 1000
+
+# Leading columns of each _find_callers_with_symbols() row; the rest is the symbol
+_CALLER_COLUMNS = (
+    "depth",
+    "target_fqn",
+    "from_fqn",
+    "to_fqn",
+    "from_kind",
+    "from_name",
+    "generated_rows",
+)
+
 
 @dataclass
 class ImpactResult:
@@ -19,6 +37,7 @@ class ImpactResult:
         missing_test_coverage: List of affected symbols without test coverage
         risk_level: Overall risk level (LOW, MEDIUM, HIGH, CRITICAL)
         confidence: Confidence score (0-1)
+        truncated: Whether the caller traversal stopped at max_callers rows
     """
 
     target_fqn: str
@@ -28,6 +47,7 @@ class ImpactResult:
     missing_test_coverage: list[dict[str, Any]]
     risk_level: str
     confidence: float
+    truncated: bool = False
 
 
 class ImpactAnalyzer:
@@ -51,6 +71,7 @@ class ImpactAnalyzer:
         depth: int = 5,
         include_tests: bool = True,
         include_transitive: bool = False,
+        max_callers: int = MAX_CALLER_ROWS,
     ) -> ImpactResult:
         """Analyze impact of changing a symbol.
 
@@ -59,6 +80,7 @@ class ImpactAnalyzer:
             depth: Maximum reverse traversal depth
             include_tests: Whether to include test mapping
             include_transitive: Whether to include N-order dependencies
+            max_callers: Maximum caller rows the reverse traversal generates
 
         Returns:
             ImpactResult with analysis results
@@ -69,9 +91,10 @@ class ImpactAnalyzer:
             raise ValueError(f"Symbol not found: {target_fqn}")
 
         # 1. Find all callers via reverse traversal
-        # Returns (callers, symbol_map) tuple to avoid N+1 queries
-        result = self._find_callers_with_symbols(target_fqn, depth)
-        callers, symbol_map = result
+        # Returns callers with their symbol_map to avoid N+1 queries
+        callers, symbol_map, truncated = self._find_callers_with_symbols(
+            [target_fqn], depth, max_callers
+        )
 
         # 2. Map callers to entry points
         entry_points = self._map_to_entry_points(callers)
@@ -100,73 +123,90 @@ class ImpactAnalyzer:
             missing_test_coverage=missing_coverage,
             risk_level=risk_level,
             confidence=confidence,
+            truncated=truncated,
         )
 
     def _find_callers_with_symbols(
         self,
-        target_fqn: str,
+        target_fqns: list[str],
         max_depth: int,
-    ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
-        """Find all callers of target_fqn using reverse traversal.
+        max_callers: int = MAX_CALLER_ROWS,
+    ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]], bool]:
+        """Find all callers of target_fqns using reverse traversal.
+
+        Uses one recursive CTE seeded with every target (passed as a JSON
+        array, so there is no bound-parameter limit) and joins the caller
+        symbols into the same query for layer determination. The LIMIT
+        inside the CTE stops the recursion once max_callers rows exist, so
+        wide or cyclic graphs cost bounded work.
 
-        Uses recursive CTE to fetch entire call tree in a single query,
-        then batch fetches symbols for layer determination to avoid N+1 queries.
+        Args:
+            target_fqns: Symbols whose callers to find
+            max_depth: Maximum reverse traversal depth
+            max_callers: Maximum caller rows (paths) the traversal generates
 
         Returns:
-            Tuple of (callers list, symbol_map dict) for reuse in other methods
+            Tuple of (callers list, symbol_map dict, truncated flag). The symbol
+            map is for reuse in other methods; each caller carries the target_fqn
+            it was reached from. truncated is set when the traversal generated
+            max_callers rows, counted before DISTINCT folds duplicate paths.
         """
         cursor = self.store.conn.cursor()
 
         cursor.execute(
             """
-            WITH RECURSIVE callers(depth, from_fqn, to_fqn, from_kind, from_name) AS (
-                SELECT 0, e.from_fqn, e.to_fqn, s.kind, s.name
+            WITH RECURSIVE callers(depth, target_fqn, from_fqn, to_fqn) AS (
+                SELECT 0, e.to_fqn, e.from_fqn, e.to_fqn
                 FROM edges e
                 JOIN symbols s ON e.from_fqn = s.fqn
-                WHERE e.to_fqn = ? AND e.relation = 'calls'
+                WHERE e.to_fqn IN (SELECT value FROM json_each(?)) AND e.relation = 'calls'
 
                 UNION ALL
 
-                SELECT c.depth + 1, e.from_fqn, e.to_fqn, s.kind, s.name
+                SELECT c.depth + 1, c.target_fqn, e.from_fqn, e.to_fqn
                 FROM edges e
                 JOIN callers c ON e.to_fqn = c.from_fqn
                 JOIN symbols s ON e.from_fqn = s.fqn
                 WHERE c.depth < ? AND e.relation = 'calls'
+                LIMIT ?
             )
-            SELECT DISTINCT * FROM callers ORDER BY depth
+            SELECT DISTINCT c.depth, c.target_fqn, c.from_fqn, c.to_fqn,
+                   s.kind AS from_kind, s.name AS from_name,
+                   COUNT(*) OVER () AS generated_rows, s.*
+            FROM callers c
+            JOIN symbols s ON c.from_fqn = s.fqn
+            ORDER BY c.depth
             """,
-            (target_fqn, max_depth),
+            (json.dumps(target_fqns), max_depth, max_callers),
         )
 
+        # Caller fields are read straight off the row; the symbol part is only
+        # materialized the first time a caller FQN is seen
+        split = len(_CALLER_COLUMNS)
+        symbol_columns = [column[0] for column in cursor.description[split:]]
         callers = []
-        caller_fqns = []
-
-        # First pass: collect all callers and their FQNs
-        for row in cursor.fetchall():
-            caller = dict(row)
-            caller["layer"] = None  # Will be filled in batch
-            callers.append(caller)
-            caller_fqns.append(caller["from_fqn"])
-
-        # Batch fetch: Get all symbols for layer determination in ONE query
         symbol_map: dict[str, dict[str, Any]] = {}
-        if caller_fqns:
-            placeholders = ",".join("?" * len(caller_fqns))
-            symbols = cursor.execute(
-                f"SELECT * FROM symbols WHERE fqn IN ({placeholders})",
-                caller_fqns
-            ).fetchall()
-
-            # Build lookup map
-            symbol_map = {row["fqn"]: dict(row) for row in symbols}
-
-            # Second pass: attach layer information from map
-            for caller in callers:
-                symbol = symbol_map.get(caller["from_fqn"])
-                if symbol:
-                    caller["layer"] = determine_layer_or_unknown(symbol)
+        generated_rows = 0
+        for row in cursor:
+            generated_rows = row["generated_rows"]
+            from_fqn = row["from_fqn"]
+            symbol = symbol_map.get(from_fqn)
+            if symbol is None:
+                symbol = dict(zip(symbol_columns, tuple(row)[split:], strict=True))
+                symbol_map[from_fqn] = symbol
+            callers.append(
+                {
+                    "depth": row["depth"],
+                    "target_fqn": row["target_fqn"],
+                    "from_fqn": from_fqn,
+                    "to_fqn": row["to_fqn"],
+                    "from_kind": row["from_kind"],
+                    "from_name": row["from_name"],
+                    "layer": determine_layer_or_unknown(symbol),
+                }
+            )
 
-        return callers, symbol_map
+        return callers, symbol_map, generated_rows >= max_callers
 
     def _map_to_entry_points(self, callers: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Map callers to entry points."""
@@ -176,35 +216,32 @@ class ImpactAnalyzer:
         cursor = self.store.conn.cursor()
 
         # Get all caller FQNs
-        caller_fqns = [c["from_fqn"] for c in callers]
-        placeholders = ",".join("?" * len(caller_fqns))
+        caller_fqns = list(dict.fromkeys(c["from_fqn"] for c in callers))
 
-        # Find entry points for callers
+        # Find entry points for callers; constant SQL text keeps the
+        # connection's prepared statement cache hitting
         cursor.execute(
-            f"""
-            SELECT ep.*, s.kind as symbol_kind
+            """
+            SELECT ep.symbol_fqn, ep.entry_type, ep.http_method, ep.http_path,
+                   ep.cron_expression, ep.mq_queue
             FROM entry_points ep
             JOIN symbols s ON ep.symbol_fqn = s.fqn
-            WHERE ep.symbol_fqn IN ({placeholders})
+            WHERE ep.symbol_fqn IN (SELECT value FROM json_each(?))
             """,
-            caller_fqns,
+            (json.dumps(caller_fqns),),
         )
 
-        entry_points = []
-        for row in cursor.fetchall():
-            ep = dict(row)
-            entry_points.append(
-                {
-                    "fqn": ep["symbol_fqn"],
-                    "entry_type": ep["entry_type"],
-                    "http_method": ep.get("http_method"),
-                    "http_path": ep.get("http_path"),
-                    "cron_expression": ep.get("cron_expression"),
-                    "mq_queue": ep.get("mq_queue"),
-                }
-            )
-
-        return entry_points
+        return [
+            {
+                "fqn": row["symbol_fqn"],
+                "entry_type": row["entry_type"],
+                "http_method": row["http_method"],
+                "http_path": row["http_path"],
+                "cron_expression": row["cron_expression"],
+                "mq_queue": row["mq_queue"],
+            }
+            for row in cursor
+        ]
 
     def _find_related_tests(
         self,
@@ -223,24 +260,21 @@ class ImpactAnalyzer:
         test_mapper = TestMapper(self.store)
         tests = []
 
-        # Group callers by file path to batch process
-        file_path_to_callers: dict[str, list[str]] = {}
-        for caller in callers:
-            caller_fqn = caller["from_fqn"]
-
-            # Use pre-fetched symbol data if available
-            if symbol_map and caller_fqn in symbol_map:
-                symbol = symbol_map[caller_fqn]
-            else:
-                symbol = self.store.get_symbol(caller_fqn)
-
-            if not symbol or not symbol.get("file_path"):
-                continue
-
-            file_path = symbol["file_path"]
-            if file_path not in file_path_to_callers:
-                file_path_to_callers[file_path] = []
-            file_path_to_callers[file_path].append(caller_fqn)
+        # Callers reached at several depths appear once per depth
+        caller_fqns = list(dict.fromkeys(c["from_fqn"] for c in callers))
+
+        # Symbols missing from the pre-fetched map are loaded in one batch
+        symbols = symbol_map or {}
+        missing = [fqn for fqn in caller_fqns if fqn not in symbols]
+        if missing:
+            symbols = {**symbols, **self.store.batch_get_symbols(missing)}
+
+        # Group callers by file path so each file is checked once
+        file_path_to_callers: dict[str, list[str]] = defaultdict(list)
+        for caller_fqn in caller_fqns:
+            symbol = symbols.get(caller_fqn)
+            if symbol and symbol.get("file_path"):
+                file_path_to_callers[symbol["file_path"]].append(caller_fqn)
 
         # Find tests for each unique file path
         for file_path, fqns in file_path_to_callers.items():
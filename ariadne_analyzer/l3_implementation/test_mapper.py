@@ -8,6 +8,9 @@ from ariadne_core.storage.sqlite_store import SQLiteStore
 
 logger = logging.getLogger(__name__)
 
+# Sorts after any character, so [prefix, prefix + _MAX_CHAR) covers every FQN with the prefix
+_MAX_CHAR = "\U0010ffff"
+
 
 class TestMapper:
     """Maps source code symbols to their corresponding test files.
@@ -25,6 +28,9 @@ class TestMapper:
             store: SQLite database store
         """
         self.store = store
+        # Directory listings, so candidate test files cost one listdir per
+        # directory instead of one stat() per candidate
+        self._dir_cache: dict[str, frozenset[str]] = {}
 
     def find_tests_for_symbol(self, fqn: str) -> dict[str, object] | None:
         """Find test files for a given symbol FQN.
@@ -48,7 +54,7 @@ class TestMapper:
         # Check which test files exist
         existing_tests = []
         for test_path in test_paths:
-            if test_path.exists():
+            if self._path_exists(test_path):
                 existing_tests.append(test_path)
 
         if not existing_tests:
@@ -86,7 +92,7 @@ class TestMapper:
         # Check which test files exist
         existing_tests = []
         for test_path in test_paths:
-            if test_path.exists():
+            if self._path_exists(test_path):
                 existing_tests.append(test_path)
 
         if not existing_tests:
@@ -99,6 +105,22 @@ class TestMapper:
             "additional_tests": [str(p) for p in existing_tests[1:]],
         }
 
+    def _path_exists(self, path: Path) -> bool:
+        """Check whether a path exists using the cached listing of its directory.
+
+        Listings are taken once per TestMapper, so files created afterwards
+        are not seen; create a new mapper per analysis.
+        """
+        directory = os.fspath(path.parent)
+        entries = self._dir_cache.get(directory)
+        if entries is None:
+            try:
+                entries = frozenset(os.listdir(directory))
+            except OSError:
+                entries = frozenset()
+            self._dir_cache[directory] = entries
+        return path.name in entries
+
     def _generate_test_paths(self, source_path: Path) -> list[Path]:
         """Generate possible test file paths from source path.
 
@@ -118,7 +140,7 @@ class TestMapper:
             # No standard Maven/Gradle structure, try sibling directory
             parent = source_path.parent.parent
             test_dir = parent / "test"
-            if test_dir.exists():
+            if self._path_exists(test_dir):
                 test_base = str(test_dir / source_path.name)
             else:
                 return []
@@ -153,14 +175,15 @@ class TestMapper:
         """
         cursor = self.store.conn.cursor()
 
-        # Find all symbols in package
+        # Find all symbols in package; a prefix range uses the fqn index,
+        # unlike LIKE (case-insensitive, and "_" in a package is a wildcard)
         cursor.execute(
             """
             SELECT DISTINCT file_path FROM symbols
-            WHERE fqn LIKE ?
+            WHERE fqn >= ? AND fqn < ?
             AND file_path IS NOT NULL
             """,
-            (f"{package_fqn}%",),
+            (package_fqn, package_fqn + _MAX_CHAR),
         )
 
         test_files = []
@@ -177,7 +200,7 @@ class TestMapper:
             test_paths = self._generate_test_paths(source_path)
 
             for test_path in test_paths:
-                if test_path.exists() and str(test_path) not in seen_paths:
+                if self._path_exists(test_path) and str(test_path) not in seen_paths:
                     test_files.append(
                         {
                             "path": str(test_path),
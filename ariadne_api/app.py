@@ -6,10 +6,17 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from ariadne_api.middleware import RequestContextMiddleware, TracingMiddleware, setup_logging
+from ariadne_api.middleware import (
+    RequestContextMiddleware,
+    TracingMiddleware,
+    create_error_response,
+    setup_logging,
+)
 from ariadne_api.rate_limiter import RateLimitConfig, RateLimitMiddleware, get_rate_limiter
 from ariadne_api.routes.check import router as check_router
 from ariadne_api.routes.constraints import router as constraints_router
@@ -32,6 +39,10 @@ ARIADNE_LOG_FORMAT = os.environ.get("ARIADNE_LOG_FORMAT", "json") == "json"
 
 # API versioning configuration
 API_VERSION = os.environ.get("ARIADNE_API_VERSION", "v1")
+API_PREFIX = f"/api/{API_VERSION}"
+
+# Legacy unversioned endpoints for backward compatibility (deprecated)
+LEGACY_ENDPOINTS = os.environ.get("ARIADNE_LEGACY_ENDPOINTS", "true").lower() == "true"
 
 # Rate limiting configuration
 # Can be overridden via environment variables
@@ -39,6 +50,12 @@ RATE_LIMIT_PER_MINUTE = int(os.environ.get("ARIADNE_RATE_LIMIT_MINUTE", "60"))
 RATE_LIMIT_PER_HOUR = int(os.environ.get("ARIADNE_RATE_LIMIT_HOUR", "1000"))
 RATE_LIMIT_BURST = int(os.environ.get("ARIADNE_RATE_LIMIT_BURST", "10"))
 
+# Worker threads for the sync, SQLite-backed route handlers (anyio's default is 40).
+# FastAPI runs plain `def` endpoints in this pool, keeping the event loop free.
+API_THREAD_LIMIT = int(
+    os.environ.get("ARIADNE_API_THREADS", str(min(32, (os.cpu_count() or 1) + 4)))
+)
+
 # Set up logging
 setup_logging(level=ARIADNE_LOG_LEVEL, json_format=ARIADNE_LOG_FORMAT)
 logger = logging.getLogger(__name__)
@@ -52,6 +69,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     logger.info("Starting Ariadne API server")
 
+    # Bound concurrent handler threads (and thus SQLite connections in use)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREAD_LIMIT
+
     # Validate database path
     db_path = Path(ARIADNE_DB_PATH)
     if not db_path.exists():
@@ -100,31 +120,34 @@ app.add_middleware(TracingMiddleware, service_name="ariadne-api")
 # Health check endpoint is unversioned (always available)
 app.include_router(health_router, tags=["health"])
 
-# Versioned API endpoints
-app.include_router(search_router, prefix=f"/api/{API_VERSION}", tags=["search"])
-app.include_router(graph_router, prefix=f"/api/{API_VERSION}", tags=["graph"])
-app.include_router(symbol_router, prefix=f"/api/{API_VERSION}", tags=["symbol"])
-app.include_router(impact_router, prefix=f"/api/{API_VERSION}", tags=["impact"])
-app.include_router(rebuild_router, prefix=f"/api/{API_VERSION}", tags=["rebuild"])
-app.include_router(jobs_router, prefix=f"/api/{API_VERSION}", tags=["jobs"])
-app.include_router(constraints_router, prefix=f"/api/{API_VERSION}", tags=["constraints"])
-app.include_router(check_router, prefix=f"/api/{API_VERSION}", tags=["check"])
-app.include_router(glossary_router, prefix=f"/api/{API_VERSION}/knowledge", tags=["glossary"])
-app.include_router(tests_router.router, prefix=f"/api/{API_VERSION}/knowledge", tags=["tests"])
-app.include_router(metrics_router, prefix=f"/api/{API_VERSION}", tags=["metrics"])
-
-# Legacy unversioned endpoints for backward compatibility (deprecated)
-# TODO: Add deprecation warning headers
-_app_include_legacy = os.environ.get("ARIADNE_LEGACY_ENDPOINTS", "true").lower() == "true"
-if _app_include_legacy:
-    app.include_router(search_router, tags=["search (deprecated)"])
-    app.include_router(graph_router, tags=["graph (deprecated)"])
-    app.include_router(symbol_router, tags=["symbol (deprecated)"])
-    app.include_router(impact_router, tags=["impact (deprecated)"])
-    app.include_router(rebuild_router, tags=["rebuild (deprecated)"])
-    app.include_router(jobs_router, tags=["jobs (deprecated)"])
-    app.include_router(constraints_router, tags=["constraints (deprecated)"])
-    app.include_router(check_router, tags=["check (deprecated)"])
+# Versioned API endpoints: (router, path under API_PREFIX, tag)
+_VERSIONED_ROUTERS = [
+    (search_router, "", "search"),
+    (graph_router, "", "graph"),
+    (symbol_router, "", "symbol"),
+    (impact_router, "", "impact"),
+    (rebuild_router, "", "rebuild"),
+    (jobs_router, "", "jobs"),
+    (constraints_router, "", "constraints"),
+    (check_router, "", "check"),
+    (glossary_router, "/knowledge", "glossary"),
+    (tests_router.router, "/knowledge", "tests"),
+    (metrics_router, "", "metrics"),
+]
+for _router, _path, _tag in _VERSIONED_ROUTERS:
+    app.include_router(_router, prefix=API_PREFIX + _path, tags=[_tag])
+
+# Routers also served without the version prefix when LEGACY_ENDPOINTS is on
+_LEGACY_ROUTERS = [
+    (search_router, "search"),
+    (graph_router, "graph"),
+    (symbol_router, "symbol"),
+    (impact_router, "impact"),
+    (rebuild_router, "rebuild"),
+    (jobs_router, "jobs"),
+    (constraints_router, "constraints"),
+    (check_router, "check"),
+]
 
 
 @app.get("/", tags=["root"])
@@ -137,13 +160,13 @@ async def root() -> dict[str, Any]:
         "docs": "/docs",
         "api_version": API_VERSION,
         "endpoints": {
-            "current": f"/api/{API_VERSION}",
+            "current": API_PREFIX,
             "health": "/health",
         },
     }
 
 
-@app.get(f"/api/{API_VERSION}", tags=["root"])
+@app.get(API_PREFIX, tags=["root"])
 async def api_root() -> dict[str, str]:
     """API v1 root endpoint."""
     return {
@@ -156,10 +179,8 @@ async def api_root() -> dict[str, str]:
 
 # Global exception handler
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request, exc: HTTPException) -> dict[str, Any]:
+async def http_exception_handler(request, exc: HTTPException) -> JSONResponse:
     """Handle HTTP exceptions with structured error responses."""
-    from ariadne_api.middleware import create_error_response
-
     request_id = getattr(request.state, "request_id", None)
     return create_error_response(
         status_code=exc.status_code,
@@ -170,10 +191,8 @@ async def http_exception_handler(request, exc: HTTPException) -> dict[str, Any]:
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request, exc: Exception) -> dict[str, Any]:
+async def general_exception_handler(request, exc: Exception) -> JSONResponse:
     """Handle uncaught exceptions."""
-    from ariadne_api.middleware import create_error_response
-
     logger.exception(f"Unhandled exception: {exc}")
     request_id = getattr(request.state, "request_id", None)
     return create_error_response(
@@ -184,6 +203,18 @@ async def general_exception_handler(request, exc: Exception) -> dict[str, Any]:
     )
 
 
+# Legacy endpoints live in a sub-application mounted last, so the main router
+# only scans the versioned routes plus one catch-all mount per request.
+# TODO: Add deprecation warning headers
+if LEGACY_ENDPOINTS:
+    legacy_app = FastAPI(openapi_url=None)
+    for _router, _tag in _LEGACY_ROUTERS:
+        legacy_app.include_router(_router, tags=[f"{_tag} (deprecated)"])
+    legacy_app.add_exception_handler(HTTPException, http_exception_handler)
+    legacy_app.add_exception_handler(Exception, general_exception_handler)
+    app.mount("", legacy_app)
+
+
 def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
     """Run the FastAPI server with uvicorn.
 
@@ -1,25 +1,54 @@
 """Shared dependencies for API routes.
 
-Provides context-managed database connections to prevent connection leaks.
+Provides context-managed database access that reuses warm connections
+and never leaks a transaction into the next request.
 Uses dependency injection for improved testability.
 """
 
 import os
+import threading
 from contextlib import contextmanager
 
 from fastapi import HTTPException
 
 from ariadne_core.container import get_container
 from ariadne_core.storage.sqlite_store import SQLiteStore
+from ariadne_core.storage.vector_store import ChromaVectorStore
+
+# Shared store per database path. SQLiteStore keeps one connection per
+# thread, so the handler threadpool doubles as a connection pool: each
+# worker thread reuses its open, schema-checked connection and warm
+# statement cache instead of paying for setup on every request.
+_stores: dict[str, SQLiteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_shared_store(db_path: str) -> SQLiteStore:
+    """Get the shared store for db_path, creating it on first use."""
+    store = _stores.get(db_path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(db_path)
+            if store is None:
+                store = SQLiteStore(db_path)
+                _stores[db_path] = store
+    return store
+
+
+def _release(store: SQLiteStore) -> None:
+    """Roll back anything a request left uncommitted on this thread's connection."""
+    conn = store.conn
+    if conn.in_transaction:
+        conn.rollback()
 
 
 @contextmanager
 def get_store():
-    """Get a SQLite store with automatic cleanup.
+    """Get a SQLite store for the current request.
 
-    Creates a new store instance for each request to ensure
-    proper connection lifecycle management. The container
-    is used for configuration, but each request gets its own store.
+    The store is shared across requests (see _stores); its connection for
+    the calling thread is kept open and any uncommitted transaction is
+    rolled back when the request is done.
 
     Yields:
         SQLiteStore: Database store
@@ -29,27 +58,26 @@ def get_store():
         def endpoint():
             with get_store() as store:
                 return store.get_data()
-            # Connection automatically closed
+            # Open transaction rolled back, connection kept warm
     """
     db_path = os.environ.get("ARIADNE_DB_PATH", "ariadne.db")
     if not os.path.exists(db_path):
         raise HTTPException(status_code=503, detail="Database not available")
 
-    store = SQLiteStore(db_path)
+    store = _get_shared_store(db_path)
     try:
         yield store
     finally:
-        # Always close the connection to prevent leaks
-        if store.conn:
-            store.conn.close()
+        _release(store)
 
 
 @contextmanager
 def get_store_from_container():
-    """Get a SQLite store from the DI container with automatic cleanup.
+    """Get the SQLite store from the DI container.
 
-    Uses the singleton store from the container for cases where
-    sharing state across requests is desired (with proper cleanup).
+    Uses the singleton store from the container when one is registered,
+    otherwise the shared store for ARIADNE_DB_PATH. As with get_store(),
+    the connection stays open and uncommitted work is rolled back.
 
     Yields:
         SQLiteStore: Database store from container
@@ -59,7 +87,6 @@ def get_store_from_container():
         def endpoint():
             with get_store_from_container() as store:
                 return store.get_data()
-            # Connection automatically closed
     """
     container = get_container()
     store = container.get_store()
@@ -68,31 +95,28 @@ def get_store_from_container():
         db_path = os.environ.get("ARIADNE_DB_PATH", "ariadne.db")
         if not os.path.exists(db_path):
             raise HTTPException(status_code=503, detail="Database not available")
-        store = SQLiteStore(db_path)
+        store = _get_shared_store(db_path)
 
     try:
         yield store
     finally:
-        # Always close the connection to prevent leaks
-        if store and store.conn:
-            store.conn.close()
+        _release(store)
 
 
-@contextmanager
-def get_vector_store():
-    """Get the vector store with automatic cleanup.
+def get_vector_store() -> ChromaVectorStore | None:
+    """Get the shared vector store.
 
-    Yields:
+    A plain function rather than a context manager: the container owns the
+    store and nothing needs releasing per request.
+
+    Returns:
         ChromaVectorStore | None: Vector store (may be None if unavailable)
 
     Example:
         @router.get("/endpoint")
         def endpoint():
-            with get_vector_store() as vector_store:
-                if vector_store:
-                    return vector_store.search(query)
-            # Connection automatically closed
+            vector_store = get_vector_store()
+            if vector_store:
+                return vector_store.search(query)
     """
-    container = get_container()
-    vector_store = container.get_vector_store()
-    yield vector_store
+    return get_container().get_vector_store()
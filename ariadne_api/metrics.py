@@ -8,12 +8,16 @@ Collects and aggregates metrics from various system components:
 - System resource metrics
 """
 
+import contextlib
 import logging
+import math
 import os
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from threading import Lock
+from itertools import accumulate
+from threading import Lock, local
 from typing import Any
 
 import psutil
@@ -24,6 +28,55 @@ logger = logging.getLogger(__name__)
 _start_time = time.time()
 _process = psutil.Process()
 
+# How long a resident memory reading is reused before asking the OS again
+MEMORY_SAMPLE_TTL_SECONDS = 0.5
+# Last reading: [rss_mb, monotonic expiry]
+_memory_cache = [0.0, 0.0]
+
+# Request duration histogram: log2 buckets, 8 per octave (~9% relative error),
+# 128 buckets cover 1 ms .. 65 s; slower requests land in the last bucket
+HISTOGRAM_BUCKETS = 128
+HISTOGRAM_BUCKETS_PER_OCTAVE = 8
+
+# Maximum number of distinct endpoints tracked; least recently used are evicted
+MAX_TRACKED_ENDPOINTS = 1024
+
+# Path segments that look like IDs (numbers, UUIDs, hashes) for unrouted requests
+_ID_SEGMENT_PATTERN = re.compile(r"(?<=/)(?:\d+|[0-9a-fA-F-]{8,})(?=/|$)")
+
+
+def normalize_endpoint_path(path: str) -> str:
+    """Collapse ID-like path segments to ``:id``.
+
+    Fallback for requests that did not match a route template, so that
+    URLs embedding identifiers share one per-endpoint entry.
+
+    Args:
+        path: Raw request path
+
+    Returns:
+        Path with numeric/hex segments replaced by ``:id``
+    """
+    return _ID_SEGMENT_PATTERN.sub(":id", path)
+
+
+def _memory_usage_mb() -> float:
+    """Resident memory of this process in MB, sampled at most every TTL."""
+    now = time.monotonic()
+    if now >= _memory_cache[1]:
+        try:
+            _memory_cache[0] = _process.memory_info().rss / 1024 / 1024
+        except Exception:
+            _memory_cache[0] = 0.0
+        _memory_cache[1] = now + MEMORY_SAMPLE_TTL_SECONDS
+    return _memory_cache[0]
+
+
+def _bucket_index(duration_ms: float) -> int:
+    """Map a duration to its log2 histogram bucket."""
+    scaled = math.log2(max(duration_ms, 1.0)) * HISTOGRAM_BUCKETS_PER_OCTAVE
+    return min(HISTOGRAM_BUCKETS - 1, max(0, int(scaled)))
+
 
 @dataclass
 class RequestMetrics:
@@ -33,20 +86,43 @@ class RequestMetrics:
     active_requests: int = 0
     total_duration_ms: float = 0.0
     error_count: int = 0
-    durations: list[float] = field(default_factory=list)
+    min_duration_ms: float = math.inf
+    max_duration_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_BUCKETS)
+    # Guards updates when one instance is shared between threads
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    @classmethod
+    def merged(cls, parts: list["RequestMetrics"]) -> "RequestMetrics":
+        """Combine several metrics (e.g. per-thread shards) into one snapshot.
+
+        Args:
+            parts: Metrics to combine
+
+        Returns:
+            New RequestMetrics with summed counters and histograms
+        """
+        result = cls()
+        for part in parts:
+            result.total_requests += part.total_requests
+            result.active_requests += part.active_requests
+            result.total_duration_ms += part.total_duration_ms
+            result.error_count += part.error_count
+            result.min_duration_ms = min(result.min_duration_ms, part.min_duration_ms)
+            result.max_duration_ms = max(result.max_duration_ms, part.max_duration_ms)
+            result.buckets = [a + b for a, b in zip(result.buckets, part.buckets, strict=True)]
+        return result
 
     def record_request(self, duration_ms: float, is_error: bool = False) -> None:
         """Record a completed request."""
         self.total_requests += 1
         self.total_duration_ms += duration_ms
-        self.durations.append(duration_ms)
+        self.buckets[_bucket_index(duration_ms)] += 1
+        self.min_duration_ms = min(self.min_duration_ms, duration_ms)
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
         if is_error:
             self.error_count += 1
 
-        # Keep only last 1000 durations for percentile calculation
-        if len(self.durations) > 1000:
-            self.durations = self.durations[-1000:]
-
     def increment_active(self) -> None:
         """Increment active request count."""
         self.active_requests += 1
@@ -65,20 +141,32 @@ class RequestMetrics:
     @property
     def p95_duration_ms(self) -> float:
         """95th percentile request duration."""
-        if not self.durations:
-            return 0.0
-        sorted_durations = sorted(self.durations)
-        idx = int(len(sorted_durations) * 0.95)
-        return sorted_durations[min(idx, len(sorted_durations) - 1)]
+        return self.percentile(0.95)
 
     @property
     def p99_duration_ms(self) -> float:
         """99th percentile request duration."""
-        if not self.durations:
+        return self.percentile(0.99)
+
+    def percentile(self, q: float) -> float:
+        """Estimate a duration percentile from the histogram.
+
+        Walks the buckets once and returns the upper edge of the bucket
+        holding the sample at rank ``int(n * q)``, clamped to the observed
+        min/max so small samples report exact extremes.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated duration in milliseconds (0.0 if nothing recorded)
+        """
+        if self.total_requests == 0:
             return 0.0
-        sorted_durations = sorted(self.durations)
-        idx = int(len(sorted_durations) * 0.99)
-        return sorted_durations[min(idx, len(sorted_durations) - 1)]
+        rank = min(int(self.total_requests * q), self.total_requests - 1)
+        idx = next(i for i, seen in enumerate(accumulate(self.buckets)) if seen > rank)
+        upper = 2 ** ((idx + 1) / HISTOGRAM_BUCKETS_PER_OCTAVE)
+        return min(max(upper, self.min_duration_ms), self.max_duration_ms)
 
     @property
     def error_rate(self) -> float:
@@ -158,41 +246,62 @@ class MetricsCollector:
     """Central metrics collector for the Ariadne API.
 
     Thread-safe singleton that collects metrics from all system components.
+    The instance is created once at import time; ``MetricsCollector()`` and
+    ``get_metrics_collector()`` both return it without locking or
+    re-running initialization.
+
+    Request metrics are recorded without a shared lock: each thread writes
+    to its own RequestMetrics shard and shards are merged when read.
+    Per-endpoint updates take only that endpoint's lock. The middleware
+    increments and decrements active requests on the same thread, so each
+    shard's active count stays balanced.
     """
 
-    _instance: "MetricsCollector | None" = None
-    _lock: Lock = Lock()
-
     def __new__(cls) -> "MetricsCollector":
-        """Get or create the singleton instance."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self) -> None:
+        """Return the module-level instance (created on first import)."""
+        if _collector is not None:
+            return _collector
+        instance = super().__new__(cls)
+        instance._setup()
+        return instance
+
+    def _setup(self) -> None:
         """Initialize the metrics collector."""
-        if self._initialized:
-            return
-
-        self._initialized = True
         self._lock = Lock()
 
+        # Per-thread request metrics shards, merged by the request_metrics property
+        self._local = local()
+        self._shards: list[RequestMetrics] = []
+        self._generation = 0
+
         # Metrics storage
-        self.request_metrics = RequestMetrics()
         self.db_metrics = DatabaseMetrics()
         self.llm_metrics = LLMMetrics()
         self.job_metrics = JobMetrics()
 
-        # Per-endpoint metrics
-        self.endpoint_metrics: dict[str, RequestMetrics] = defaultdict(
-            lambda: RequestMetrics()
-        )
+        # Per-endpoint metrics, kept in LRU order and capped at MAX_TRACKED_ENDPOINTS;
+        # each entry is updated under its own lock
+        self.endpoint_metrics: OrderedDict[str, RequestMetrics] = OrderedDict()
 
         logger.info("MetricsCollector initialized")
 
+    @property
+    def request_metrics(self) -> RequestMetrics:
+        """Snapshot of request metrics merged across all thread shards."""
+        with self._lock:
+            shards = list(self._shards)
+        return RequestMetrics.merged(shards)
+
+    def _shard(self) -> RequestMetrics:
+        """Get the calling thread's request metrics shard, registering it on first use."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.shard = RequestMetrics()
+            local.generation = self._generation
+            with self._lock:
+                self._shards.append(local.shard)
+        return local.shard
+
     def record_request(
         self,
         method: str,
@@ -204,27 +313,37 @@ class MetricsCollector:
 
         Args:
             method: HTTP method
-            path: Request path
+            path: Route template (e.g. ``/api/v1/symbol/{fqn}``) or request path;
+                ID-like segments of raw paths are collapsed to ``:id``
             duration_ms: Request duration in milliseconds
             status_code: HTTP status code
         """
-        with self._lock:
-            is_error = status_code >= 400
-            self.request_metrics.record_request(duration_ms, is_error)
-
-            # Track per-endpoint metrics
-            endpoint = f"{method} {path}"
-            self.endpoint_metrics[endpoint].record_request(duration_ms, is_error)
+        is_error = status_code >= 400
+        self._shard().record_request(duration_ms, is_error)
+
+        # Track per-endpoint metrics. OrderedDict operations are atomic C calls,
+        # so only creating (and evicting) an entry takes the collector lock.
+        endpoint = f"{method} {normalize_endpoint_path(path)}"
+        metrics = self.endpoint_metrics.get(endpoint)
+        if metrics is None:
+            with self._lock:
+                metrics = self.endpoint_metrics.setdefault(endpoint, RequestMetrics())
+                if len(self.endpoint_metrics) > MAX_TRACKED_ENDPOINTS:
+                    self.endpoint_metrics.popitem(last=False)
+        else:
+            # KeyError: evicted by another thread since the lookup
+            with contextlib.suppress(KeyError):
+                self.endpoint_metrics.move_to_end(endpoint)
+        with metrics.lock:
+            metrics.record_request(duration_ms, is_error)
 
     def increment_active_requests(self) -> None:
         """Increment active request count."""
-        with self._lock:
-            self.request_metrics.increment_active()
+        self._shard().increment_active()
 
     def decrement_active_requests(self) -> None:
         """Decrement active request count."""
-        with self._lock:
-            self.request_metrics.decrement_active()
+        self._shard().decrement_active()
 
     def record_db_query(self, duration_ms: float) -> None:
         """Record a database query.
@@ -273,21 +392,19 @@ class MetricsCollector:
         Returns:
             Dictionary of current metrics
         """
-        with self._lock:
-            try:
-                memory_info = _process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024
-            except Exception:
-                memory_mb = 0.0
+        # Sampled outside the lock so scrapes don't hold up request recording
+        memory_mb = _memory_usage_mb()
+        requests = self.request_metrics
 
+        with self._lock:
             return {
-                "total_requests": self.request_metrics.total_requests,
-                "active_requests": self.request_metrics.active_requests,
-                "avg_request_duration_ms": self.request_metrics.avg_duration_ms,
-                "p95_request_duration_ms": self.request_metrics.p95_duration_ms,
-                "p99_request_duration_ms": self.request_metrics.p99_duration_ms,
-                "error_rate": self.request_metrics.error_rate,
-                "total_errors": self.request_metrics.error_count,
+                "total_requests": requests.total_requests,
+                "active_requests": requests.active_requests,
+                "avg_request_duration_ms": requests.avg_duration_ms,
+                "p95_request_duration_ms": requests.p95_duration_ms,
+                "p99_request_duration_ms": requests.p99_duration_ms,
+                "error_rate": requests.error_rate,
+                "total_errors": requests.error_count,
                 "db_connection_pool_size": 1,  # SQLite uses single connection
                 "db_avg_query_duration_ms": self.db_metrics.avg_query_duration_ms,
                 "llm_total_requests": self.llm_metrics.total_requests,
@@ -307,22 +424,24 @@ class MetricsCollector:
         Returns:
             Dictionary mapping endpoint names to their metrics
         """
-        with self._lock:
-            return {
-                endpoint: {
+        result = {}
+        for endpoint, m in list(self.endpoint_metrics.items()):
+            with m.lock:
+                result[endpoint] = {
                     "total_requests": m.total_requests,
                     "avg_duration_ms": m.avg_duration_ms,
                     "p95_duration_ms": m.p95_duration_ms,
                     "p99_duration_ms": m.p99_duration_ms,
                     "error_rate": m.error_rate,
                 }
-                for endpoint, m in self.endpoint_metrics.items()
-            }
+        return result
 
     def reset(self) -> None:
         """Reset all metrics (useful for testing)."""
         with self._lock:
-            self.request_metrics = RequestMetrics()
+            # Threads register a fresh shard on their next request
+            self._generation += 1
+            self._shards.clear()
             self.db_metrics = DatabaseMetrics()
             self.llm_metrics = LLMMetrics()
             self.job_metrics = JobMetrics()
@@ -330,7 +449,10 @@ class MetricsCollector:
             logger.info("Metrics reset")
 
 
-# Singleton instance
+_collector: MetricsCollector | None = None
+_collector = MetricsCollector()
+
+
 def get_metrics_collector() -> MetricsCollector:
     """Get the singleton MetricsCollector instance."""
-    return MetricsCollector()
+    return _collector
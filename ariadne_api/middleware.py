@@ -3,62 +3,90 @@
 import logging
 import time
 import uuid
-from typing import Any, Callable
+from typing import Any
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-
-from ariadne_api.schemas.common import ErrorResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+def _route_path(scope: Scope) -> str:
+    """Return the request path with matched path parameters replaced by ``{name}``.
+
+    Metrics are keyed by this template so ``/api/v1/knowledge/symbol/{fqn}``
+    is one endpoint rather than one entry per symbol. Built from the router's
+    ``path_params`` rather than ``scope["route"].path``, which omits the
+    ``include_router`` prefix on some FastAPI versions.
+    """
+    path = scope["path"]
+    for name, value in reversed(list(scope.get("path_params", {}).items())):
+        value = str(value)
+        if value:
+            path = f"{{{name}}}".join(path.rsplit(value, 1))
+    return path
+
+
+class RequestContextMiddleware:
     """Add request ID and structured logging to all requests.
 
     Provides distributed tracing capabilities with:
     - Correlation/request ID for tracking across services
     - Request timing for performance monitoring
     - Structured logging with context for observability
+
+    Implemented as pure ASGI middleware: headers are added by wrapping
+    ``send`` instead of going through BaseHTTPMiddleware, which runs the
+    downstream app in a separate task and streams the body through a
+    memory channel on every request.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.logger = logging.getLogger("ariadne.api")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        headers = connection.headers
+
         # Generate/request ID - support external correlation IDs
         request_id = (
-            request.headers.get("X-Request-ID") or
-            request.headers.get("X-Correlation-ID") or
+            headers.get("X-Request-ID") or
+            headers.get("X-Correlation-ID") or
             str(uuid.uuid4())
         )
-        request.state.request_id = request_id
+        # Exposed to handlers as request.state.request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
         # Get client info
-        client_host = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent", "unknown")
+        client_host = connection.client.host if connection.client else None
+        user_agent = headers.get("user-agent", "unknown")
+        method = scope["method"]
+        path = scope["path"]
 
         # Start timing
         start_time = time.time()
 
-        # Extract additional context
-        path_params = dict(request.path_params)
-        query_params = dict(request.query_params)
+        # Extract additional context (path params are only known after routing)
+        query_params = dict(connection.query_params)
 
         # Log request with enhanced context
         self.logger.info(
             "request_start",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
+                "method": method,
+                "url": str(connection.url),
+                "path": path,
                 "client": client_host,
                 "user_agent": user_agent,
-                "path_params": path_params if path_params else None,
+                "path_params": None,
                 "query_params": query_params if query_params else None,
             },
         )
@@ -68,57 +96,65 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         metrics_collector = get_metrics_collector()
         metrics_collector.increment_active_requests()
 
+        response_started = False
+
+        async def send_with_context(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+
+                # Calculate duration
+                duration_ms = (time.time() - start_time) * 1000
+
+                # Record metrics
+                metrics_collector.record_request(
+                    method=method,
+                    path=_route_path(scope),
+                    duration_ms=duration_ms,
+                    status_code=status_code,
+                )
+
+                # Log response with timing
+                self.logger.info(
+                    "request_complete",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "status_code": status_code,
+                        "duration_ms": f"{duration_ms:.2f}",
+                        "client": client_host,
+                    },
+                )
+
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Request-ID"] = request_id
+                # Add timing header for debugging
+                response_headers["X-Process-Time-ms"] = f"{duration_ms:.2f}"
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Record metrics
-            metrics_collector.record_request(
-                method=request.method,
-                path=request.url.path,
-                duration_ms=duration_ms,
-                status_code=response.status_code,
-            )
-
-            # Log response with timing
-            self.logger.info(
-                "request_complete",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": f"{duration_ms:.2f}",
-                    "client": client_host,
-                },
-            )
-
-            # Add timing header for debugging
-            response.headers["X-Process-Time-ms"] = f"{duration_ms:.2f}"
-
-            return response
-
+            await self.app(scope, receive, send_with_context)
         except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
 
-            # Record error metrics
-            metrics_collector.record_request(
-                method=request.method,
-                path=request.url.path,
-                duration_ms=duration_ms,
-                status_code=500,
-            )
+            # Record error metrics (unless the response was already recorded)
+            if not response_started:
+                metrics_collector.record_request(
+                    method=method,
+                    path=_route_path(scope),
+                    duration_ms=duration_ms,
+                    status_code=500,
+                )
 
             self.logger.exception(
                 "request_error",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "client": client_host,
                     "error": str(e),
                     "duration_ms": f"{duration_ms:.2f}",
@@ -130,20 +166,24 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
             metrics_collector.decrement_active_requests()
 
 
-class TracingMiddleware(BaseHTTPMiddleware):
+class TracingMiddleware:
     """Middleware for distributed tracing support.
 
     Adds W3C trace context headers for integration with tracing systems.
+    Pure ASGI middleware, like RequestContextMiddleware.
     """
 
     def __init__(self, app: ASGIApp, service_name: str = "ariadne-api") -> None:
-        super().__init__(app)
+        self.app = app
         self.service_name = service_name
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract traceparent header (W3C Trace Context)
-        traceparent = request.headers.get("traceparent")
-        tracestate = request.headers.get("tracestate")
+        traceparent = Headers(scope=scope).get("traceparent")
 
         # Generate new trace ID if not provided
         if not traceparent:
@@ -151,14 +191,16 @@ class TracingMiddleware(BaseHTTPMiddleware):
             span_id = uuid.uuid4().hex[:8]
             traceparent = f"00-{trace_id}-{span_id}-01"
 
-        # Pass through trace headers
-        response = await call_next(request)
+        parts = traceparent.split("-")
+        trace_header = parts[1] if len(parts) > 1 else traceparent
 
-        # Add trace context to response for debugging
-        if traceparent:
-            response.headers["X-Trace-Id"] = traceparent.split("-")[1] if len(traceparent.split("-")) > 1 else traceparent
+        async def send_with_trace(message: Message) -> None:
+            # Add trace context to response for debugging
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Trace-Id"] = trace_header
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_trace)
 
 
 def create_error_response(
@@ -167,17 +209,24 @@ def create_error_response(
     detail: str | None = None,
     request_id: str | None = None,
 ) -> JSONResponse:
-    """Create RFC 7807 Problem Details error response."""
-    error = ErrorResponse(
-        type=f"https://httpstatuses.com/{status_code}",
-        title=title,
-        status=status_code,
-        detail=detail,
-        instance=request_id,
-    )
+    """Create RFC 7807 Problem Details error response.
+
+    The body has the shape of ``schemas.common.ErrorResponse`` with unset
+    fields omitted; it is built as a plain dict so the error path skips
+    Pydantic validation and serialization.
+    """
+    content: dict[str, Any] = {
+        "type": f"https://httpstatuses.com/{status_code}",
+        "title": title,
+        "status": status_code,
+    }
+    if detail is not None:
+        content["detail"] = detail
+    if request_id is not None:
+        content["instance"] = request_id
     return JSONResponse(
         status_code=status_code,
-        content=error.model_dump(exclude_none=True),
+        content=content,
         headers={"X-Request-ID": request_id} if request_id else {},
     )
 
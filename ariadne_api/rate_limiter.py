@@ -8,10 +8,11 @@ import logging
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Awaitable, Callable
 
-from fastapi import HTTPException, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ class InMemoryRateLimiter:
         self._cleanup_interval = 300  # Cleanup every 5 minutes
         self._lock = asyncio.Lock()
 
-    def _get_client_key(self, request: Request) -> str:
+    def _get_client_key(self, request: HTTPConnection) -> str:
         """Get a unique identifier for the client.
 
         Uses X-Forwarded-For header if present (for proxied requests),
@@ -111,12 +112,12 @@ class InMemoryRateLimiter:
         return requests_in_window < limit
 
     async def is_allowed(
-        self, request: Request, config: RateLimitConfig | None = None
+        self, request: HTTPConnection, config: RateLimitConfig | None = None
     ) -> tuple[bool, str]:
         """Check if a request should be allowed.
 
         Args:
-            request: The incoming request
+            request: The incoming request (or its HTTPConnection)
             config: Optional override config (uses default if not provided)
 
         Returns:
@@ -185,22 +186,26 @@ class InMemoryRateLimiter:
             return True, ""
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting.
+class RateLimitMiddleware:
+    """ASGI middleware for rate limiting.
 
     Applies rate limiting to all requests. Exempts health check endpoints.
     Can be disabled via ARIADNE_RATE_LIMIT_ENABLED environment variable.
+
+    Implemented as pure ASGI middleware (no BaseHTTPMiddleware task and
+    body channel per request); the client is read from a lightweight
+    HTTPConnection over the scope.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         limiter: InMemoryRateLimiter | None = None,
         config: RateLimitConfig | None = None,
         exempt_paths: set[str] | None = None,
         enabled: bool | None = None,
     ):
-        super().__init__(app)
+        self.app = app
         self._limiter = limiter or InMemoryRateLimiter(config)
         self._exempt_paths = exempt_paths or {"/health", "/docs", "/openapi.json", "/"}
         # Allow disabling rate limiting via environment variable or parameter
@@ -209,56 +214,57 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             enabled = os.environ.get("ARIADNE_RATE_LIMIT_ENABLED", "true").lower() == "true"
         self._enabled = enabled
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting.
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
-
-        Returns:
-            Response or raises HTTPException if rate limited
-
-        Raises:
-            HTTPException: 429 Too Many Requests if rate limit exceeded
+        Rate-limited requests get a 429 JSON response with a Retry-After
+        header; allowed requests get X-RateLimit-* headers added.
         """
-        # Skip rate limiting if disabled
-        if not self._enabled:
-            return await call_next(request)
-
-        # Skip rate limiting for exempt paths
-        if request.url.path in self._exempt_paths:
-            return await call_next(request)
+        # Skip rate limiting if disabled, for non-HTTP traffic and for exempt paths
+        if (
+            not self._enabled
+            or scope["type"] != "http"
+            or scope["path"] in self._exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
 
         # Check rate limit
-        allowed, error_message = await self._limiter.is_allowed(request)
+        connection = HTTPConnection(scope)
+        allowed, error_message = await self._limiter.is_allowed(connection)
+        limit = self._limiter._config.requests_per_minute
 
         if not allowed:
-            raise HTTPException(
+            response = JSONResponse(
                 status_code=429,
-                detail=error_message,
+                content={"detail": error_message},
                 headers={
                     "Retry-After": "60",
-                    "X-RateLimit-Limit": str(self._limiter._config.requests_per_minute),
+                    "X-RateLimit-Limit": str(limit),
                     "X-RateLimit-Remaining": "0",
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(self._limiter._config.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(
-            max(0, self._limiter._config.requests_per_minute - len(self._limiter._clients.get(self._limiter._get_client_key(request), ClientRequestHistory()).timestamps))
+        history = self._limiter._clients.get(
+            self._limiter._get_client_key(connection), ClientRequestHistory()
         )
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
-
-        return response
+        rate_limit_headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(0, limit - len(history.timestamps))),
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+        }
+
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers to response
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # Global rate limiter instance
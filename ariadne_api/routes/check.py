@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/knowledge/check", response_model=CheckResult, tags=["check"])
-async def check_code(request: CheckRequest) -> CheckResult:
+def check_code(request: CheckRequest) -> CheckResult:
     """Perform live anti-pattern detection on code changes.
 
     Analyzes the provided code changes for architectural violations and
@@ -19,7 +19,7 @@ ALLOWED_SEVERITIES = {"error", "warning", "info", "critical"}
 
 
 @router.get("/knowledge/constraints", response_model=ConstraintsResponse, tags=["constraints"])
-async def get_constraints(
+def get_constraints(
     context: str | None = Query(None, description="Filter by file path or FQN"),
     severity: str | None = Query(None, description="Filter by severity (error, warning, info, critical)"),
 ) -> ConstraintsResponse:
@@ -72,7 +72,7 @@ def parse_synonyms(synonyms_json: Any) -> list[str]:
 
 
 @router.get("", response_model=GlossaryTermList, tags=["glossary"])
-async def list_glossary_terms(
+def list_glossary_terms(
     prefix: str = Query(None, description="Filter by code_term prefix"),
     limit: int = Query(100, ge=1, le=1000, description="Max results (1-1000)"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
@@ -114,7 +114,7 @@ async def list_glossary_terms(
 
 
 @router.get("/{code_term}", response_model=GlossaryTerm, tags=["glossary"])
-async def get_glossary_term(code_term: str) -> GlossaryTerm:
+def get_glossary_term(code_term: str) -> GlossaryTerm:
     """Get specific glossary term with business meaning.
 
     Returns detailed business meaning for a specific code term,
@@ -143,7 +143,7 @@ async def get_glossary_term(code_term: str) -> GlossaryTerm:
 
 
 @router.get("/search/{query}", response_model=GlossarySearchResponse, tags=["glossary"])
-async def search_glossary(
+def search_glossary(
     query: str,
     num_results: int = Query(10, ge=1, le=100, description="Number of results"),
 ) -> GlossarySearchResponse:
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/knowledge/graph/query", response_model=GraphResponse, tags=["graph"])
-async def query_graph(request: GraphQueryRequest) -> GraphResponse:
+def query_graph(request: GraphQueryRequest) -> GraphResponse:
     """Query the call graph with bidirectional traversal.
 
     Supports:
@@ -132,7 +132,7 @@ def _traverse_outgoing(
     nodes: dict[str, GraphNode] = {}
     edges: list[GraphEdge] = []
 
-    for row in cursor.fetchall():
+    for row in cursor:
         edge_data = dict(row)
 
         # Add nodes if not already present
@@ -209,7 +209,7 @@ def _traverse_incoming(
     nodes: dict[str, GraphNode] = {}
     edges: list[GraphEdge] = []
 
-    for row in cursor.fetchall():
+    for row in cursor:
         edge_data = dict(row)
 
         # Add nodes if not already present
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/knowledge/impact", response_model=ImpactResponse, tags=["impact"])
-async def analyze_impact(
+def analyze_impact(
     target: str = Query(..., description="Symbol FQN to analyze"),
     depth: int = Query(5, ge=1, le=20, description="Reverse traversal depth"),
     include_tests: bool = Query(True, description="Include test mapping"),
@@ -74,6 +74,7 @@ async def analyze_impact(
                 missing_test_coverage=[],
                 risk_level="low",
                 confidence=result.confidence,
+                truncated=result.truncated,
             )
 
         # Convert domain models to response models
@@ -129,4 +130,5 @@ async def analyze_impact(
             missing_test_coverage=missing_coverage,
             risk_level=result.risk_level,
             confidence=result.confidence,
+            truncated=result.truncated,
         )
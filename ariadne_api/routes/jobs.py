@@ -27,7 +27,7 @@ def _get_job_queue():
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse, tags=["jobs"])
-async def get_job_status(job_id: str) -> JobResponse:
+def get_job_status(job_id: str) -> JobResponse:
     """Get the status of a rebuild job.
 
     Returns the current status, progress, and other metadata for a job.
@@ -54,7 +54,7 @@ async def get_job_status(job_id: str) -> JobResponse:
 
 
 @router.get("/jobs", tags=["jobs"])
-async def list_jobs(
+def list_jobs(
     status: str | None = None,
     limit: int = 50,
 ) -> dict[str, list[JobResponse]]:
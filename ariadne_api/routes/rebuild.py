@@ -53,7 +53,7 @@ def _get_job_queue():
 
 
 @router.post("/knowledge/rebuild", response_model=RebuildResponse, tags=["rebuild"])
-async def trigger_rebuild(request: RebuildRequest) -> RebuildResponse:
+def trigger_rebuild(request: RebuildRequest) -> RebuildResponse:
     """Trigger a codebase rebuild (full or incremental).
 
     Creates a job to rebuild the code knowledge graph. The rebuild can be:
@@ -1,6 +1,5 @@
 """Search endpoint for semantic + keyword search."""
 
-import asyncio
 import logging
 import os
 from collections import defaultdict
@@ -9,26 +8,15 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import ValidationError
 
-from ariadne_api.dependencies import get_store
+from ariadne_api.dependencies import get_store, get_vector_store
 from ariadne_api.schemas.search import SearchRequest, SearchResponse, SearchResultItem, SymbolRef, EntryPointRef
-from ariadne_core.storage.vector_store import ChromaVectorStore
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def get_vector_store() -> ChromaVectorStore | None:
-    """Dependency to get vector store (returns None if unavailable)."""
-    try:
-        vector_path = os.environ.get("ARIADNE_VECTOR_PATH", "ariadne_vectors")
-        return ChromaVectorStore(vector_path)
-    except Exception as e:
-        logger.warning(f"Vector store unavailable: {e}")
-        return None
-
-
 @router.get("/knowledge/search", response_model=SearchResponse, tags=["search"])
-async def search_knowledge(
+def search_knowledge(
     query: str = Query(..., description="Search query", min_length=1),
     num_results: int = Query(10, ge=1, le=100),
     level: list[str] = Query(["method", "class", "package"]),
@@ -66,8 +54,8 @@ async def search_knowledge(
                     )
 
                     with create_embedder(config) as embedder:
-                        # Generate embedding for query (run in thread pool to avoid blocking event loop)
-                        query_embedding = await asyncio.to_thread(embedder.embed_text, query)
+                        # Generate embedding for query (the handler already runs in the threadpool)
+                        query_embedding = embedder.embed_text(query)
 
                         # Search in vector store
                         search_result = vector_store.search_summaries(
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/knowledge/symbol/{fqn}", response_model=SymbolDetail, tags=["symbol"])
-async def get_symbol_detail(
+def get_symbol_detail(
     fqn: str = Path(..., description="Fully qualified symbol name"),
 ) -> SymbolDetail:
     """Get detailed information about a specific symbol.
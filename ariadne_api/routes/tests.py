@@ -24,7 +24,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/knowledge/tests/{fqn:path}", response_model=TestMappingResponse, tags=["tests"])
-async def get_test_mapping(fqn: str) -> TestMappingResponse:
+def get_test_mapping(fqn: str) -> TestMappingResponse:
     """Get test file mappings for a source symbol.
 
     Uses Maven Surefire test naming conventions to find test files:
@@ -67,7 +67,7 @@ async def get_test_mapping(fqn: str) -> TestMappingResponse:
 
 
 @router.get("/knowledge/coverage", response_model=CoverageAnalysisResponse, tags=["tests"])
-async def get_coverage_analysis(
+def get_coverage_analysis(
     target: str = Query(..., description="Target symbol FQN to analyze"),
 ) -> CoverageAnalysisResponse:
     """Analyze test coverage for a target symbol.
@@ -128,7 +128,7 @@ async def get_coverage_analysis(
 # ========================
 
 @router.post("/knowledge/tests/batch", response_model=BatchTestMappingResponse, tags=["tests"])
-async def get_test_mappings_batch(request: BatchTestMappingRequest) -> BatchTestMappingResponse:
+def get_test_mappings_batch(request: BatchTestMappingRequest) -> BatchTestMappingResponse:
     """Get test file mappings for multiple source symbols in one request.
 
     This endpoint enables efficient batch processing for agents analyzing
@@ -186,7 +186,7 @@ async def get_test_mappings_batch(request: BatchTestMappingRequest) -> BatchTest
 
 
 @router.post("/knowledge/coverage/batch", response_model=BatchCoverageResponse, tags=["tests"])
-async def get_coverage_batch(request: BatchCoverageRequest) -> BatchCoverageResponse:
+def get_coverage_batch(request: BatchCoverageRequest) -> BatchCoverageResponse:
     """Analyze test coverage for multiple target symbols in one request.
 
     This endpoint enables efficient batch processing for agents analyzing
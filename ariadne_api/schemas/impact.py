@@ -64,3 +64,6 @@ class ImpactResponse(BaseModel):
     missing_test_coverage: list[MissingCoverage] = Field(description="Missing test coverage")
     risk_level: str = Field(description="Overall risk level (LOW, MEDIUM, HIGH, CRITICAL)")
     confidence: float = Field(description="Confidence score (0-1)")
+    truncated: bool = Field(
+        default=False, description="Whether the caller traversal stopped at its row limit"
+    )
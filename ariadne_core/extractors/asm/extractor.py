@@ -89,6 +89,10 @@ class Extractor:
                 total_entries += result.get("entries", 0)
                 total_deps += result.get("deps", 0)
 
+        # 批量写入后刷新统计信息，让查询规划器选用复合索引
+        if total_symbols or total_edges:
+            self.store.analyze()
+
         print(f"[Ariadne] Extraction complete: {total_symbols} symbols, {total_edges} edges")
         print(f"[Ariadne] L2 analysis: {total_entries} entry points, {total_deps} external dependencies")
 
@@ -25,7 +25,7 @@ class RelationKind(str, Enum):
     MEMBER_OF = "member_of"
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolData:
     """A symbol (class, interface, method, field) in the knowledge graph."""
 
@@ -238,6 +238,8 @@ class SummaryData:
     is_stale: bool = False
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Hash of the LLM input the summary was generated from
+    source_hash: Optional[str] = None
 
     def to_row(self) -> tuple:
         """Convert to SQLite row tuple."""
@@ -249,10 +251,11 @@ class SummaryData:
             self.is_stale,
             self.created_at,
             self.updated_at,
+            self.source_hash,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GlossaryEntry:
     """领域词汇表条目（L1 层）。"""
 
@@ -275,7 +278,7 @@ class GlossaryEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintEntry:
     """业务约束条目（L1 层）。"""
 
@@ -1,9 +1,15 @@
 """Database migrations for Ariadne knowledge graph."""
 
 from .migration_001_cascade_deletes import migration_001_cascade_deletes
+from .migration_002_summary_source_hash import migration_002_summary_source_hash
+from .migration_003_symbol_layer import migration_003_symbol_layer
+from .migration_004_edge_callee_class import migration_004_edge_callee_class
 
 ALL_MIGRATIONS = [
     migration_001_cascade_deletes,
+    migration_002_summary_source_hash,
+    migration_003_symbol_layer,
+    migration_004_edge_callee_class,
 ]
 
 __all__ = ["ALL_MIGRATIONS"]
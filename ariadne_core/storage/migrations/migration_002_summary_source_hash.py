@@ -0,0 +1,49 @@
+"""Migration 002: Add summaries.source_hash.
+
+Stores a hash of the LLM input each summary was generated from, so an
+interrupted incremental run can resume without regenerating summaries
+whose input has not changed.
+
+Additive and idempotent; applied automatically when a store opens.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Migration metadata
+version = "002"
+name = "summary_source_hash"
+description = "Add source_hash column to summaries"
+
+
+def upgrade(conn: Any, dry_run: bool = False) -> dict[str, int]:
+    """Add the source_hash column if it is missing.
+
+    Args:
+        conn: SQLite connection object
+        dry_run: If True, only report whether the column would be added
+
+    Returns:
+        Dictionary with the number of columns added
+    """
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(summaries)")}
+    if not columns or "source_hash" in columns:
+        return {"columns_added": 0}
+
+    if not dry_run:
+        cursor.execute("ALTER TABLE summaries ADD COLUMN source_hash TEXT")
+        conn.commit()
+        logger.info(f"Migration {version}: added summaries.source_hash")
+    return {"columns_added": 1}
+
+
+# Export migration metadata
+migration_002_summary_source_hash = {
+    "version": version,
+    "name": name,
+    "description": description,
+    "upgrade": upgrade,
+}
@@ -0,0 +1,71 @@
+"""Migration 003: Add symbols.layer.
+
+Materializes the call-chain layer (controller/service/repository/unknown)
+of each symbol, so call chain tracing reads a column instead of
+re-classifying annotations and names on every request, and queries can
+filter by layer.
+
+Additive and idempotent; applied automatically when a store opens.
+Rows written before the column existed are backfilled.
+"""
+
+import logging
+from typing import Any
+
+from ariadne_core.utils.layer import infer_layer
+
+logger = logging.getLogger(__name__)
+
+# Migration metadata
+version = "003"
+name = "symbol_layer"
+description = "Add indexed layer column to symbols"
+
+
+def upgrade(conn: Any, dry_run: bool = False) -> dict[str, int]:
+    """Add and backfill the layer column if needed.
+
+    Args:
+        conn: SQLite connection object
+        dry_run: If True, only report what would change
+
+    Returns:
+        Dictionary with the number of columns added and rows backfilled
+    """
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(symbols)")}
+    if not columns:
+        return {"columns_added": 0, "rows_backfilled": 0}
+
+    columns_added = 0 if "layer" in columns else 1
+    if dry_run:
+        return {"columns_added": columns_added, "rows_backfilled": 0}
+
+    if columns_added:
+        cursor.execute("ALTER TABLE symbols ADD COLUMN layer TEXT")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_symbols_layer ON symbols(layer)")
+
+    rows = cursor.execute(
+        "SELECT id, fqn, name, annotations FROM symbols WHERE layer IS NULL"
+    ).fetchall()
+    cursor.executemany(
+        "UPDATE symbols SET layer = ? WHERE id = ?",
+        [
+            (infer_layer(fqn, symbol_name, annotations), row_id)
+            for row_id, fqn, symbol_name, annotations in rows
+        ],
+    )
+    conn.commit()
+
+    if columns_added or rows:
+        logger.info(f"Migration {version}: added symbols.layer, backfilled {len(rows)} rows")
+    return {"columns_added": columns_added, "rows_backfilled": len(rows)}
+
+
+# Export migration metadata
+migration_003_symbol_layer = {
+    "version": version,
+    "name": name,
+    "description": description,
+    "upgrade": upgrade,
+}
@@ -0,0 +1,60 @@
+"""Migration 004: Add edges.callee_class_fqn.
+
+Stores the class part of each edge's to_fqn, so rules that classify the
+callee's class (e.g. Controller-DAO detection) read a column instead of
+parsing the FQN of every edge on each run.
+
+Additive and idempotent; applied automatically when a store opens.
+Existing rows are backfilled when the column is added.
+"""
+
+import logging
+from typing import Any
+
+from ariadne_core.utils.fqn import class_fqn_of
+
+logger = logging.getLogger(__name__)
+
+# Migration metadata
+version = "004"
+name = "edge_callee_class"
+description = "Add callee_class_fqn column to edges"
+
+
+def upgrade(conn: Any, dry_run: bool = False) -> dict[str, int]:
+    """Add and backfill the callee_class_fqn column if it is missing.
+
+    Args:
+        conn: SQLite connection object
+        dry_run: If True, only report whether the column would be added
+
+    Returns:
+        Dictionary with the number of columns added and rows backfilled
+    """
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(edges)")}
+    if not columns or "callee_class_fqn" in columns:
+        return {"columns_added": 0, "rows_backfilled": 0}
+
+    if dry_run:
+        return {"columns_added": 1, "rows_backfilled": 0}
+
+    cursor.execute("ALTER TABLE edges ADD COLUMN callee_class_fqn TEXT")
+    rows = cursor.execute("SELECT id, to_fqn FROM edges").fetchall()
+    cursor.executemany(
+        "UPDATE edges SET callee_class_fqn = ? WHERE id = ?",
+        [(class_fqn_of(to_fqn), row_id) for row_id, to_fqn in rows],
+    )
+    conn.commit()
+
+    logger.info(f"Migration {version}: added edges.callee_class_fqn, backfilled {len(rows)} rows")
+    return {"columns_added": 1, "rows_backfilled": len(rows)}
+
+
+# Export migration metadata
+migration_004_edge_callee_class = {
+    "version": version,
+    "name": name,
+    "description": description,
+    "upgrade": upgrade,
+}
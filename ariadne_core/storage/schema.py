@@ -15,6 +15,7 @@ CREATE TABLE IF NOT EXISTS symbols (
     parent_fqn TEXT,
     annotations TEXT,
     file_hash TEXT,
+    layer TEXT,  -- call-chain layer, indexed by migration 003
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -30,7 +31,8 @@ CREATE TABLE IF NOT EXISTS edges (
     from_fqn TEXT NOT NULL,
     to_fqn TEXT NOT NULL,
     relation TEXT NOT NULL,
-    metadata TEXT
+    metadata TEXT,
+    callee_class_fqn TEXT  -- class part of to_fqn, added by migration 004
 );
 
 CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_fqn);
@@ -116,6 +118,7 @@ CREATE TABLE IF NOT EXISTS summaries (
     is_stale BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    source_hash TEXT,
     FOREIGN KEY (target_fqn) REFERENCES symbols(fqn) ON DELETE CASCADE
 );
 
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import itertools
 import logging
 import os
 import re
 import sqlite3
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from threading import local
 from typing import Any
 
-logger = logging.getLogger(__name__)
-
 from ariadne_core.models.types import (
     AntiPatternData,
     ConstraintEntry,
+    ConstraintType,
     EdgeData,
     EntryPointData,
     ExternalDependencyData,
@@ -22,7 +24,48 @@ from ariadne_core.models.types import (
     SummaryData,
     SymbolData,
 )
+from ariadne_core.storage.migrations.migration_002_summary_source_hash import (
+    upgrade as add_summary_source_hash,
+)
+from ariadne_core.storage.migrations.migration_003_symbol_layer import (
+    upgrade as add_symbol_layer,
+)
+from ariadne_core.storage.migrations.migration_004_edge_callee_class import (
+    upgrade as add_edge_callee_class,
+)
 from ariadne_core.storage.schema import ALL_SCHEMAS
+from ariadne_core.utils.fqn import class_fqn_of
+from ariadne_core.utils.layer import infer_layer
+
+logger = logging.getLogger(__name__)
+
+# Above this many FQNs, stale marking joins against a temp table instead of
+# probing the index once per FQN
+STALE_TEMP_TABLE_THRESHOLD = 1024
+
+# Max bound parameters per "IN (...)" lookup; stays under SQLITE_MAX_VARIABLE_NUMBER
+# on old builds (999) and keeps the planner on the index
+IN_QUERY_CHUNK_SIZE = 500
+
+# Prepared statements kept per connection (sqlite3 default is 128); analyzer
+# queries are constant SQL text so repeated calls skip parsing
+STATEMENT_CACHE_SIZE = 256
+
+# Page cache per connection in KiB (SQLite default is 2 MiB); recursive
+# call-graph CTEs revisit the same edges index pages many times
+PAGE_CACHE_KIB = 64 * 1024
+
+# Bytes of the database file read through mmap instead of read() syscalls
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Process-wide serial numbers for connections (part of data_version)
+_connection_serials = itertools.count(1)
+
+
+def _chunks(items: Sequence[str], size: int = IN_QUERY_CHUNK_SIZE) -> Iterator[Sequence[str]]:
+    """Split items into consecutive chunks of at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
 
 
 class SQLiteStore:
@@ -59,14 +102,39 @@ class SQLiteStore:
         if not hasattr(self._local, 'conn'):
             self._local.conn = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False  # Allow access from any thread
+                check_same_thread=False,  # Allow access from any thread
+                cached_statements=STATEMENT_CACHE_SIZE,
             )
+            self._local.conn_serial = next(_connection_serials)
             self._local.conn.row_factory = sqlite3.Row
             self._local.conn.execute("PRAGMA journal_mode=WAL")
+            # WAL keeps the database consistent with NORMAL sync; fsync only at checkpoints
+            self._local.conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn.execute(f"PRAGMA cache_size=-{PAGE_CACHE_KIB}")
+            self._local.conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
             self._local.conn.execute("PRAGMA foreign_keys=ON")
             self._local.conn.execute("PRAGMA busy_timeout=30000")  # 30s timeout
         return self._local.conn
 
+    @property
+    def data_version(self) -> tuple[int, int, int]:
+        """Cache token for the database content as seen by this thread.
+
+        Combines this thread's connection serial number with SQLite's
+        ``PRAGMA data_version`` (bumped by commits from other connections)
+        and the connection's ``total_changes`` (its own writes). The last two
+        are only comparable within one connection (a fresh connection starts
+        at the same values), so the serial keeps tokens from different
+        threads' connections distinct. Equal tokens imply unchanged content.
+        """
+        conn = self.conn
+        return (
+            self._local.conn_serial,
+            conn.execute("PRAGMA data_version").fetchone()[0],
+            conn.total_changes,
+        )
+
     def _rebuild_schema(self) -> None:
         """Drop and recreate all tables."""
         cursor = self.conn.cursor()
@@ -86,6 +154,10 @@ class SQLiteStore:
         for schema_sql in ALL_SCHEMAS.values():
             cursor.executescript(schema_sql)
         self.conn.commit()
+        # Additive column migrations for databases created by older versions
+        add_summary_source_hash(self.conn)
+        add_symbol_layer(self.conn)
+        add_edge_callee_class(self.conn)
 
     # ========================
     # Symbol CRUD
@@ -96,11 +168,13 @@ class SQLiteStore:
         if not symbols:
             return 0
         cursor = self.conn.cursor()
-        rows = [s.to_row() for s in symbols]
+        # The layer is classified once here, so readers get it as a column
+        rows = [(*s.to_row(), infer_layer(s.fqn, s.name, s.annotations)) for s in symbols]
         cursor.executemany(
             """INSERT INTO symbols
-               (fqn, kind, name, file_path, line_number, modifiers, signature, parent_fqn, annotations)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               (fqn, kind, name, file_path, line_number, modifiers, signature, parent_fqn,
+                annotations, layer)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(fqn) DO UPDATE SET
                kind = excluded.kind,
                name = excluded.name,
@@ -110,6 +184,7 @@ class SQLiteStore:
                signature = excluded.signature,
                parent_fqn = excluded.parent_fqn,
                annotations = excluded.annotations,
+               layer = excluded.layer,
                updated_at = CURRENT_TIMESTAMP""",
             rows,
         )
@@ -123,6 +198,74 @@ class SQLiteStore:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def _query_in_chunks(self, sql: str, keys: list[str]) -> Iterator[sqlite3.Row]:
+        """Run an IN-query once per chunk of keys and stream the rows.
+
+        Args:
+            sql: Query with a single ``{placeholders}`` slot for the IN list
+            keys: Values bound to the IN list (IN_QUERY_CHUNK_SIZE per query)
+
+        Yields:
+            Result rows across all chunks
+        """
+        for chunk in _chunks(list(keys)):
+            placeholders = ",".join("?" * len(chunk))
+            yield from self.conn.execute(sql.format(placeholders=placeholders), chunk)
+
+    def batch_get_symbols(self, fqns: list[str]) -> dict[str, dict[str, Any]]:
+        """Get multiple symbols by FQN.
+
+        Large lookups are split into chunks of IN_QUERY_CHUNK_SIZE FQNs.
+
+        Args:
+            fqns: List of symbol FQNs
+
+        Returns:
+            Dict mapping FQN to symbol dict (missing FQNs are omitted)
+        """
+        rows = self._query_in_chunks("SELECT * FROM symbols WHERE fqn IN ({placeholders})", fqns)
+        return {row["fqn"]: dict(row) for row in rows}
+
+    def iter_symbols(self, fqns: list[str]) -> Iterator[sqlite3.Row]:
+        """Stream SymbolData columns for many FQNs without materializing them.
+
+        Rows are fetched chunk by chunk (IN_QUERY_CHUNK_SIZE FQNs per query)
+        and yielded as they come off the cursor. NULL modifiers/annotations
+        come back as '[]', so both columns always hold a JSON array.
+
+        Args:
+            fqns: List of symbol FQNs
+
+        Yields:
+            sqlite3.Row per found symbol (missing FQNs are skipped)
+        """
+        return self._query_in_chunks(
+            """SELECT fqn, kind, name, file_path, line_number, signature, parent_fqn,
+                      COALESCE(modifiers, '[]') AS modifiers,
+                      COALESCE(annotations, '[]') AS annotations
+               FROM symbols WHERE fqn IN ({placeholders})""",
+            fqns,
+        )
+
+    def get_parent_symbol(self, fqn: str) -> dict[str, Any] | None:
+        """Get the parent symbol of a symbol in a single query.
+
+        Args:
+            fqn: Child symbol FQN
+
+        Returns:
+            Parent symbol dict or None if the symbol or its parent is missing
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """SELECT p.* FROM symbols c
+               JOIN symbols p ON p.fqn = c.parent_fqn
+               WHERE c.fqn = ?""",
+            (fqn,),
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
     def get_symbols_by_kind(self, kind: str) -> list[dict[str, Any]]:
         """Get all symbols of a given kind."""
         cursor = self.conn.cursor()
@@ -165,9 +308,11 @@ class SQLiteStore:
         if not edges:
             return 0
         cursor = self.conn.cursor()
-        rows = [e.to_row() for e in edges]
+        # The callee's class is parsed once here, so rules read it as a column
+        rows = [(*e.to_row(), class_fqn_of(e.to_fqn)) for e in edges]
         cursor.executemany(
-            "INSERT INTO edges (from_fqn, to_fqn, relation, metadata) VALUES (?, ?, ?, ?)",
+            """INSERT INTO edges (from_fqn, to_fqn, relation, metadata, callee_class_fqn)
+               VALUES (?, ?, ?, ?, ?)""",
             rows,
         )
         self.conn.commit()
@@ -294,7 +439,7 @@ class SQLiteStore:
             """,
             (start_fqn, max_depth),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor]
 
     def get_reverse_callers(self, target_fqn: str, max_depth: int = 10) -> list[dict[str, Any]]:
         """Find all callers of target_fqn (reverse traversal)."""
@@ -317,7 +462,7 @@ class SQLiteStore:
             """,
             (target_fqn, max_depth),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor]
 
     # ========================
     # Metadata
@@ -454,6 +599,33 @@ class SQLiteStore:
             cursor.execute("SELECT * FROM external_dependencies")
         return [dict(row) for row in cursor.fetchall()]
 
+    def batch_get_external_dependencies(self, caller_fqns: list[str]) -> list[dict[str, Any]]:
+        """Get the distinct external dependency targets of many callers.
+
+        One query; the FQNs are passed as a JSON array, so there is no
+        bound-parameter limit. SQLite groups by target and keeps the first
+        row (lowest id) of each.
+
+        Args:
+            caller_fqns: Caller symbol FQNs
+
+        Returns:
+            One dependency row per target, ordered by id
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT * FROM external_dependencies
+            WHERE id IN (
+                SELECT MIN(id) FROM external_dependencies
+                WHERE caller_fqn IN (SELECT value FROM json_each(?))
+                GROUP BY target
+            )
+            ORDER BY id
+            """,
+            (json.dumps(caller_fqns),),
+        )
+        return [dict(row) for row in cursor]
+
     def get_external_dependency_count(self) -> int:
         """Get total external dependency count."""
         cursor = self.conn.cursor()
@@ -507,6 +679,16 @@ class SQLiteStore:
         self.conn.commit()
         return count
 
+    def analyze(self) -> None:
+        """Refresh the query planner statistics (sqlite_stat1).
+
+        Run after bulk ingest: without statistics SQLite may probe the
+        single-column edges indexes instead of the (fqn, relation)
+        composites in the recursive call-graph queries.
+        """
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+
     def close(self) -> None:
         """Close the database connection."""
         self.conn.close()
@@ -529,13 +711,15 @@ class SQLiteStore:
         """
         cursor = self.conn.cursor()
         cursor.execute(
-            """INSERT INTO summaries (target_fqn, level, summary, vector_id, is_stale, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
+            """INSERT INTO summaries
+               (target_fqn, level, summary, vector_id, is_stale, created_at, updated_at, source_hash)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(target_fqn) DO UPDATE SET
                summary = excluded.summary,
                vector_id = excluded.vector_id,
                is_stale = excluded.is_stale,
-               updated_at = excluded.updated_at""",
+               updated_at = excluded.updated_at,
+               source_hash = excluded.source_hash""",
             summary.to_row(),
         )
         self.conn.commit()
@@ -561,6 +745,74 @@ class SQLiteStore:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def batch_get_summary_staleness(self, target_fqns: list[str]) -> dict[str, bool]:
+        """Get the stale flag of existing summaries for many targets.
+
+        Args:
+            target_fqns: Target symbol FQNs
+
+        Returns:
+            Dict mapping target FQN to is_stale (targets without a summary are omitted)
+        """
+        rows = self._query_in_chunks(
+            "SELECT target_fqn, is_stale FROM summaries WHERE target_fqn IN ({placeholders})",
+            target_fqns,
+        )
+        return {row[0]: bool(row[1]) for row in rows}
+
+    def batch_get_fresh_summary_fqns(self, target_fqns: list[str]) -> set[str]:
+        """Get the targets that already have a non-stale summary.
+
+        Filtering happens in SQL (covered by idx_summaries_target_stale), so
+        only the usually small fresh subset is returned.
+
+        Args:
+            target_fqns: Target symbol FQNs
+
+        Returns:
+            Set of target FQNs whose summary is fresh
+        """
+        rows = self._query_in_chunks(
+            "SELECT target_fqn FROM summaries"
+            " WHERE target_fqn IN ({placeholders}) AND is_stale = 0",
+            target_fqns,
+        )
+        return {row[0] for row in rows}
+
+    def batch_get_summary_source_hashes(self, target_fqns: list[str]) -> dict[str, str]:
+        """Get the recorded input hash of existing summaries for many targets.
+
+        Args:
+            target_fqns: Target symbol FQNs
+
+        Returns:
+            Dict mapping target FQN to source_hash (targets without one are omitted)
+        """
+        rows = self._query_in_chunks(
+            "SELECT target_fqn, source_hash FROM summaries"
+            " WHERE target_fqn IN ({placeholders}) AND source_hash IS NOT NULL",
+            target_fqns,
+        )
+        return {row[0]: row[1] for row in rows}
+
+    def mark_summaries_fresh(self, target_fqns: list[str]) -> int:
+        """Clear the stale flag of summaries that are still valid.
+
+        Args:
+            target_fqns: Target symbol FQNs
+
+        Returns:
+            Number of summaries marked fresh
+        """
+        if not target_fqns:
+            return 0
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE summaries SET is_stale = 0 WHERE target_fqn = ? AND is_stale = 1",
+                [(fqn,) for fqn in dict.fromkeys(target_fqns)],
+            )
+        return cursor.rowcount
+
     def mark_summary_stale(self, target_fqn: str) -> None:
         """Mark a summary as stale (needs regeneration).
 
@@ -577,7 +829,10 @@ class SQLiteStore:
     def mark_summaries_stale(self, target_fqns: list[str]) -> int:
         """Mark multiple summaries as stale in batch.
 
-        Uses a single UPDATE with IN clause for efficiency and correctness.
+        Runs inside a single transaction. Small batches issue one indexed
+        UPDATE per FQN; batches above STALE_TEMP_TABLE_THRESHOLD are loaded
+        into a temp table and marked with a single set-based UPDATE. Neither
+        path is bound by SQLite's parameter limit.
 
         Args:
             target_fqns: List of target symbol FQNs to mark stale
@@ -588,23 +843,43 @@ class SQLiteStore:
         if not target_fqns:
             return 0
 
+        unique_fqns = [(fqn,) for fqn in dict.fromkeys(target_fqns)]
         cursor = self.conn.cursor()
-        placeholders = ",".join("?" * len(target_fqns))
-        cursor.execute(
-            f"UPDATE summaries SET is_stale = 1, updated_at = CURRENT_TIMESTAMP "
-            f"WHERE target_fqn IN ({placeholders})",
-            target_fqns,
-        )
-        self.conn.commit()
-        return cursor.rowcount
+        with self.conn:
+            if len(unique_fqns) <= STALE_TEMP_TABLE_THRESHOLD:
+                cursor.executemany(
+                    "UPDATE summaries SET is_stale = 1, updated_at = CURRENT_TIMESTAMP "
+                    "WHERE target_fqn = ?",
+                    unique_fqns,
+                )
+                return cursor.rowcount
 
-    def batch_create_summaries(self, summaries: list[SummaryData]) -> int:
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _stale_fqns (fqn TEXT PRIMARY KEY)")
+            cursor.execute("DELETE FROM temp._stale_fqns")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO temp._stale_fqns (fqn) VALUES (?)", unique_fqns
+            )
+            cursor.execute(
+                "UPDATE summaries SET is_stale = 1, updated_at = CURRENT_TIMESTAMP "
+                "WHERE target_fqn IN (SELECT fqn FROM temp._stale_fqns)"
+            )
+            marked = cursor.rowcount
+            cursor.execute("DELETE FROM temp._stale_fqns")
+        return marked
+
+    def batch_create_summaries(
+        self,
+        summaries: list[SummaryData],
+        keep_fresh: bool = False,
+    ) -> int:
         """Create multiple summary records in batch.
 
         Uses executemany() for efficient bulk inserts with upsert support.
 
         Args:
             summaries: List of SummaryData objects to create
+            keep_fresh: Leave existing non-stale summaries untouched instead of
+                overwriting them (guards against concurrent regeneration)
 
         Returns:
             Number of summaries created/updated
@@ -612,18 +887,21 @@ class SQLiteStore:
         if not summaries:
             return 0
 
-        cursor = self.conn.cursor()
-        cursor.executemany(
-            """INSERT INTO summaries (target_fqn, level, summary, vector_id, is_stale, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(target_fqn) DO UPDATE SET
-               summary = excluded.summary,
-               vector_id = excluded.vector_id,
-               is_stale = excluded.is_stale,
-               updated_at = excluded.updated_at""",
-            [s.to_row() for s in summaries],
-        )
-        self.conn.commit()
+        sql = """INSERT INTO summaries
+                 (target_fqn, level, summary, vector_id, is_stale, created_at, updated_at, source_hash)
+                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                 ON CONFLICT(target_fqn) DO UPDATE SET
+                 summary = excluded.summary,
+                 vector_id = excluded.vector_id,
+                 is_stale = excluded.is_stale,
+                 updated_at = excluded.updated_at,
+                 source_hash = excluded.source_hash"""
+        if keep_fresh:
+            sql += "\n                 WHERE summaries.is_stale = 1"
+
+        # Commit once for the whole batch (this also ends a transaction the caller opened)
+        with self.conn:
+            cursor = self.conn.executemany(sql, [s.to_row() for s in summaries])
         return cursor.rowcount
 
     def get_stale_summaries(self, limit: int = 1000) -> list[dict[str, Any]]:
@@ -787,6 +1065,38 @@ class SQLiteStore:
         )
         self.conn.commit()
 
+    def batch_create_constraint_rows(
+        self,
+        rows: list[tuple[str, str, str | None, int | None, ConstraintType]],
+    ) -> int:
+        """Upsert plain constraint tuples without building ConstraintEntry objects.
+
+        Args:
+            rows: (name, description, source_fqn, source_line, constraint_type) tuples
+
+        Returns:
+            Number of constraints created/updated
+        """
+        if not rows:
+            return 0
+
+        cursor = self.conn.cursor()
+        with self.conn:
+            cursor.executemany(
+                """INSERT INTO constraints (name, description, source_fqn, source_line, constraint_type)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(name) DO UPDATE SET
+                   description = excluded.description,
+                   source_fqn = excluded.source_fqn,
+                   source_line = excluded.source_line,
+                   constraint_type = excluded.constraint_type""",
+                [
+                    (name, description, source_fqn, source_line, constraint_type.value)
+                    for name, description, source_fqn, source_line, constraint_type in rows
+                ],
+            )
+        return len(rows)
+
     def get_constraint(self, name: str) -> dict[str, Any] | None:
         """Get a constraint by name.
 
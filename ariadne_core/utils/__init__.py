@@ -1,15 +1,19 @@
 """Utility modules for Ariadne."""
 
+from ariadne_core.utils.fqn import class_fqn_of
 from ariadne_core.utils.layer import (
     determine_layer,
     get_layer_priority,
+    infer_layer,
     is_controller,
     is_repository,
     is_service,
 )
 
 __all__ = [
+    "class_fqn_of",
     "determine_layer",
+    "infer_layer",
     "is_controller",
     "is_service",
     "is_repository",
@@ -0,0 +1,22 @@
+"""Utility functions for parsing fully qualified names."""
+
+
+def class_fqn_of(fqn: str | None) -> str | None:
+    """Get the class part of a member FQN.
+
+    Args:
+        fqn: Method or field FQN, e.g. "com.example.UserMapper.select(Long)"
+
+    Returns:
+        Class FQN ("com.example.UserMapper"), or None if the FQN has no
+        class part
+    """
+    if not fqn:
+        return None
+
+    # Drop the parameter list, whose types may contain dots
+    name = fqn.split("(", 1)[0]
+    if "." not in name:
+        return None
+
+    return name.rsplit(".", 1)[0]
@@ -31,9 +31,10 @@ def determine_layer(symbol: dict[str, Any]) -> str | None:
     elif not isinstance(annotations, list):
         annotations = []
 
-    # Check annotations for layer indicators
+    # Check annotations for layer indicators ("Controller" also matches
+    # @RestController, so one substring test per layer suffices)
     for annotation in annotations:
-        if "Controller" in annotation or "RestController" in annotation:
+        if "Controller" in annotation:
             return "controller"
         elif "Service" in annotation:
             return "service"
@@ -62,6 +63,45 @@ def determine_layer_or_unknown(symbol: dict[str, Any]) -> str:
     return determine_layer(symbol) or "unknown"
 
 
+def infer_layer(fqn: str, name: str = "", annotations: str | list[str] | None = None) -> str:
+    """Infer the call-chain layer of a symbol.
+
+    Unlike determine_layer(), this also recognizes MyBatis mappers and
+    DAOs and falls back to naming conventions in the name and FQN. It is
+    materialized in symbols.layer when symbols are stored.
+
+    Args:
+        fqn: Symbol FQN
+        name: Symbol simple name
+        annotations: Annotations as a list or as the stored JSON text
+
+    Returns:
+        Layer name ("controller", "service", "repository", or "unknown")
+    """
+    # Annotation names contain no quotes or commas, so substring checks on
+    # the joined text match the per-element checks
+    if isinstance(annotations, list):
+        annotations = " ".join(annotations)
+    annotations = annotations or ""
+
+    if "Controller" in annotations:
+        return "controller"
+    elif "Service" in annotations:
+        return "service"
+    elif "Repository" in annotations or "Mapper" in annotations:
+        return "repository"
+
+    for text in (name, fqn):
+        if "Controller" in text:
+            return "controller"
+        elif "Service" in text:
+            return "service"
+        elif "Mapper" in text or "Dao" in text or "Repository" in text:
+            return "repository"
+
+    return "unknown"
+
+
 def is_controller(symbol: dict[str, Any]) -> bool:
     """Check if symbol is a controller layer component."""
     return determine_layer(symbol) == "controller"
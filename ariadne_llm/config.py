@@ -15,6 +15,9 @@ Environment Variables:
     ARIADNE_OLLAMA_BASE_URL: Ollama server URL (default: http://localhost:11434)
     ARIADNE_OLLAMA_MODEL: Model for LLM (default: deepseek-r1:7b)
     ARIADNE_OLLAMA_EMBEDDING_MODEL: Model for embeddings
+    ARIADNE_LLM_VERIFY_SSL: Verify TLS certificates (default: true)
+    ARIADNE_LLM_REQUESTS_PER_MINUTE: Provider RPM quota to pace async calls to (default: unset)
+    ARIADNE_LLM_BATCH_MAX_WAIT: Seconds to wait for a Batch API job before cancelling it (default: 3600)
 """
 
 import os
@@ -29,6 +32,7 @@ DEFAULT_DEEPSEEK_BASE_URL = "https://api.deepseek.com"
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 DEFAULT_MAX_TOKENS = 4096
 DEFAULT_TEMPERATURE = 0.3
+DEFAULT_BATCH_MAX_WAIT_SECONDS = 3600.0
 
 
 class LLMProvider(str, Enum):
@@ -54,6 +58,9 @@ class LLMConfig:
         timeout: Request timeout in seconds
         max_workers: Maximum concurrent LLM requests (for batch operations)
         request_timeout: Per-request timeout in seconds (for batch operations)
+        verify_ssl: Verify TLS certificates (disable for on-prem endpoints)
+        requests_per_minute: Optional provider RPM quota; async calls are paced to it
+        batch_max_wait: Seconds to wait for a Batch API job before cancelling it
     """
 
     provider: LLMProvider = LLMProvider.OPENAI
@@ -66,6 +73,9 @@ class LLMConfig:
     timeout: int = 120
     max_workers: int = 10
     request_timeout: float = 30.0
+    verify_ssl: bool = True
+    requests_per_minute: int | None = None
+    batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT_SECONDS
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -78,6 +88,15 @@ class LLMConfig:
         provider = LLMProvider(provider_str)
 
         config = cls(provider=provider)
+        config.verify_ssl = os.environ.get("ARIADNE_LLM_VERIFY_SSL", "true").lower() not in (
+            "0",
+            "false",
+            "no",
+        )
+        if rpm := os.environ.get("ARIADNE_LLM_REQUESTS_PER_MINUTE"):
+            config.requests_per_minute = int(rpm)
+        if max_wait := os.environ.get("ARIADNE_LLM_BATCH_MAX_WAIT"):
+            config.batch_max_wait = float(max_wait)
 
         if provider == LLMProvider.OPENAI:
             config.api_key = os.environ.get("ARIADNE_OPENAI_API_KEY", "")
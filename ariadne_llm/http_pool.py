@@ -0,0 +1,100 @@
+"""
+Ariadne Shared HTTP Pool
+========================
+
+Process-wide httpx connection pool shared by all LLM clients.
+
+Every LLMClient used to open its own connection pool, paying a TCP/TLS
+handshake per instance. Clients now acquire a reference-counted shared
+pool instead; it is closed when the last client releases it.
+"""
+
+import importlib.util
+import logging
+import threading
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits shared by sync and async clients
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 100
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_lock = threading.Lock()
+# Pools keyed by TLS verification setting
+_clients: dict[bool, httpx.Client] = {}
+_refcounts: dict[bool, int] = {}
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def acquire_http_client(verify: bool = True) -> httpx.Client:
+    """Get the shared sync HTTP client, creating it on first use.
+
+    Each call must be paired with release_http_client().
+
+    Args:
+        verify: Verify TLS certificates (disable only for on-prem endpoints)
+
+    Returns:
+        Shared httpx.Client
+    """
+    with _lock:
+        client = _clients.get(verify)
+        if client is None or client.is_closed:
+            client = DefaultHttpxClient(
+                limits=_pool_limits(),
+                verify=verify,
+                http2=HTTP2_AVAILABLE,
+            )
+            _clients[verify] = client
+            _refcounts[verify] = 0
+            logger.debug(f"Created shared HTTP pool (verify={verify}, http2={HTTP2_AVAILABLE})")
+        _refcounts[verify] += 1
+        return client
+
+
+def release_http_client(verify: bool = True) -> None:
+    """Release a reference to the shared sync HTTP client.
+
+    The pool is closed when its last reference is released.
+
+    Args:
+        verify: TLS verification setting passed to acquire_http_client()
+    """
+    with _lock:
+        if _refcounts.get(verify, 0) <= 0:
+            return
+        _refcounts[verify] -= 1
+        if _refcounts[verify] == 0:
+            _clients.pop(verify).close()
+            logger.debug(f"Closed shared HTTP pool (verify={verify})")
+
+
+def create_async_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """Create an async HTTP client with the shared pool limits.
+
+    Async clients are bound to the event loop they first run on, so they
+    are created per LLM client rather than shared process-wide.
+
+    Args:
+        verify: Verify TLS certificates
+
+    Returns:
+        New httpx.AsyncClient
+    """
+    return DefaultAsyncHttpxClient(
+        limits=_pool_limits(),
+        verify=verify,
+        http2=HTTP2_AVAILABLE,
+    )
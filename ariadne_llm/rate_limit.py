@@ -0,0 +1,151 @@
+"""
+Ariadne LLM Rate Limiting
+=========================
+
+Client-side pacing for async LLM calls.
+
+A token bucket spreads requests to the provider's requests-per-minute
+quota, and an AIMD (additive-increase, multiplicative-decrease) limit
+shrinks concurrency when the provider answers 429 and grows it back one
+slot at a time while calls succeed, like TCP congestion control.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+# Pause applied after a 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float:
+    """Read the provider's requested back-off from 429 response headers.
+
+    Args:
+        headers: Response headers (may be None)
+
+    Returns:
+        Seconds to wait before the next request
+    """
+    if headers:
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            try:
+                return max(0.0, float(headers[header]) * scale)
+            except (KeyError, TypeError, ValueError):
+                continue
+    return DEFAULT_RETRY_AFTER_SECONDS
+
+
+class AdaptiveRateLimiter:
+    """Token bucket plus AIMD concurrency limit for async calls.
+
+    Concurrency is unlimited until the first 429; it is then halved and
+    grows by one after each window of ``limit`` consecutive successes.
+    Intended for one event loop at a time (no locks; state only changes
+    between awaits).
+    """
+
+    def __init__(self, requests_per_minute: int | None = None) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Optional provider RPM quota to pace requests to
+        """
+        self.rate = requests_per_minute / 60.0 if requests_per_minute else None
+        # Allow a one-second burst so a quota under 60 RPM still admits a request
+        self.capacity = max(1.0, self.rate) if self.rate else 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+        self.limit: int | None = None
+        self.in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot, any 429 pause and a bucket token."""
+        while self.limit is not None and self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self.in_flight += 1
+        try:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._take_token()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot and wake the next waiter."""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """Record a successful call (additive increase)."""
+        if self.limit is None:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self.limit += 1
+            self._wake()
+
+    def on_rate_limited(self, retry_after: float = DEFAULT_RETRY_AFTER_SECONDS) -> None:
+        """Record a 429 response (multiplicative decrease and pause).
+
+        Args:
+            retry_after: Seconds the provider asked us to wait
+        """
+        current = self.limit if self.limit is not None else self.in_flight
+        self.limit = max(1, current // 2)
+        self._successes = 0
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        logger.warning(
+            f"LLM rate limited; concurrency limit now {self.limit}, pausing {retry_after:.1f}s"
+        )
+
+    async def _take_token(self) -> None:
+        """Consume one token, sleeping until the bucket refills if needed."""
+        if self.rate is None:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def _wake(self) -> None:
+        """Wake one pending waiter if a slot is free."""
+        if self.limit is not None and self.in_flight >= self.limit:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
@@ -0,0 +1,64 @@
+"""Tests for shared API dependencies."""
+
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from ariadne_api.dependencies import get_store, get_vector_store
+from ariadne_core.container import get_container
+from ariadne_core.storage.sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def db_env(temp_db_path):
+    """Point ARIADNE_DB_PATH at an initialized temporary database."""
+    SQLiteStore(temp_db_path, init=True).close()
+    os.environ["ARIADNE_DB_PATH"] = temp_db_path
+    yield temp_db_path
+    del os.environ["ARIADNE_DB_PATH"]
+
+
+class TestGetStore:
+    """Tests for get_store()."""
+
+    def test_connection_reused_across_requests(self, db_env):
+        """Test that consecutive requests on a thread share one open connection."""
+        with get_store() as store:
+            first_conn = store.conn
+
+        with get_store() as store:
+            assert store.conn is first_conn
+            assert store.conn.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_uncommitted_work_rolled_back(self, db_env):
+        """Test that a request's open transaction does not leak into the next one."""
+        with get_store() as store:
+            store.conn.execute("INSERT INTO index_metadata (key, value) VALUES ('k', 'v')")
+
+        with get_store() as store:
+            assert not store.conn.in_transaction
+            assert store.get_metadata("k") is None
+
+    def test_missing_database_returns_503(self, temp_db_path):
+        """Test that a missing database file is reported as unavailable."""
+        os.environ["ARIADNE_DB_PATH"] = temp_db_path
+        try:
+            with pytest.raises(HTTPException) as exc_info, get_store():
+                pass
+        finally:
+            del os.environ["ARIADNE_DB_PATH"]
+
+        assert exc_info.value.status_code == 503
+
+
+class TestGetVectorStore:
+    """Tests for get_vector_store()."""
+
+    def test_returns_shared_container_instance(self):
+        """Test that every call returns the container's vector store."""
+        sentinel = object()
+
+        with get_container().override("vector_store", sentinel):
+            assert get_vector_store() is sentinel
+            assert get_vector_store() is sentinel
@@ -169,6 +169,18 @@ class TestMetricsEndpoints:
         health_metrics = endpoint_metrics["GET /health"]
         assert health_metrics["total_requests"] == 3
 
+    def test_get_endpoint_metrics_keyed_by_route_template(self, client):
+        """Test that parametric routes are tracked under their template."""
+        client.post("/api/v1/metrics/reset")
+
+        client.get("/api/v1/knowledge/symbol/com.example.A")
+        client.get("/api/v1/knowledge/symbol/com.example.B")
+
+        endpoint_metrics = client.get("/api/v1/metrics/endpoints").json()
+
+        assert endpoint_metrics["GET /api/v1/knowledge/symbol/{fqn}"]["total_requests"] == 2
+        assert not any("com.example" in endpoint for endpoint in endpoint_metrics)
+
     def test_get_metrics_health_combines_health_and_metrics(self, client):
         """Test GET /api/v1/metrics/health combines health status with metrics."""
         response = client.get("/api/v1/metrics/health")
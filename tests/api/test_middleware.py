@@ -0,0 +1,36 @@
+"""Tests for API middleware helpers."""
+
+import json
+
+import pytest
+
+from ariadne_api.middleware import create_error_response
+from ariadne_api.schemas.common import ErrorResponse
+
+
+class TestCreateErrorResponse:
+    """Tests for create_error_response()."""
+
+    @pytest.mark.parametrize(
+        "detail,request_id",
+        [(None, None), ("Symbol not found", None), ("Symbol not found", "req-1")],
+    )
+    def test_body_matches_error_schema(self, detail, request_id):
+        """Test that the body equals the ErrorResponse model dump without None fields."""
+        response = create_error_response(404, "Not Found", detail, request_id)
+
+        expected = ErrorResponse(
+            type="https://httpstatuses.com/404",
+            title="Not Found",
+            status=404,
+            detail=detail,
+            instance=request_id,
+        ).model_dump(exclude_none=True)
+        assert response.status_code == 404
+        assert json.loads(response.body) == expected
+
+    def test_request_id_header(self):
+        """Test that the request ID is echoed in the response headers."""
+        response = create_error_response(500, "Internal Server Error", request_id="req-1")
+
+        assert response.headers["X-Request-ID"] == "req-1"
@@ -278,6 +278,49 @@ class TestControllerDaoRule:
         assert len(patterns) == 0
 
 
+    def test_dao_by_annotation(self, store: SQLiteStore, detector: AntiPatternDetector):
+        # Callee class named without a DAO suffix is resolved through its annotations
+        store.insert_symbols([
+            SymbolData(
+                fqn="com.example.OrderController",
+                kind=SymbolKind.CLASS,
+                name="OrderController",
+            ),
+            SymbolData(
+                fqn="com.example.OrderController.list()",
+                kind=SymbolKind.METHOD,
+                name="list",
+                parent_fqn="com.example.OrderController",
+            ),
+            SymbolData(
+                fqn="com.example.OrderStore",
+                kind=SymbolKind.CLASS,
+                name="OrderStore",
+                annotations=["@Repository"],
+            ),
+            SymbolData(
+                fqn="com.example.OrderHelper",
+                kind=SymbolKind.CLASS,
+                name="OrderHelper",
+            ),
+        ])
+        store.insert_edges([
+            EdgeData(
+                from_fqn="com.example.OrderController.list()",
+                to_fqn="com.example.OrderStore.findAll()",
+                relation=RelationKind.CALLS,
+            ),
+            EdgeData(
+                from_fqn="com.example.OrderController.list()",
+                to_fqn="com.example.OrderHelper.sort(List)",
+                relation=RelationKind.CALLS,
+            ),
+        ])
+
+        patterns = detector.detect_all()
+
+        assert [p.to_fqn for p in patterns] == ["com.example.OrderStore.findAll()"]
+
 class TestDetectorMethods:
     def test_detect_by_rule(self, store: SQLiteStore, detector: AntiPatternDetector):
         store.insert_symbols([
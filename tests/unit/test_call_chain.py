@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -69,6 +70,31 @@ class TestEntryResolution:
         with pytest.raises(ValueError, match="Entry not found"):
             tracer.trace_from_entry("GET /api/nonexistent")
 
+    def test_http_index_rebuilt_after_write(self, store: SQLiteStore, tracer: CallChainTracer):
+        store.insert_symbols([
+            SymbolData(fqn="OrderController.list()", kind=SymbolKind.METHOD, name="list"),
+            SymbolData(fqn="OrderController.create()", kind=SymbolKind.METHOD, name="create"),
+        ])
+        store.conn.execute(
+            "INSERT INTO entry_points (symbol_fqn, entry_type, http_method, http_path)"
+            " VALUES ('OrderController.list()', 'http_api', 'GET', '/orders')"
+        )
+        store.conn.commit()
+
+        assert tracer._resolve_entry("GET /orders")["symbol_fqn"] == "OrderController.list()"
+        with patch.object(store, "get_entry_points") as get_entry_points:
+            assert tracer._resolve_entry("GET /orders/1")["symbol_fqn"] == "OrderController.list()"
+        get_entry_points.assert_not_called()
+        assert tracer._resolve_entry("POST /orders") is None
+
+        store.conn.execute(
+            "INSERT INTO entry_points (symbol_fqn, entry_type, http_method, http_path)"
+            " VALUES ('OrderController.create()', 'http_api', 'POST', '/orders')"
+        )
+        store.conn.commit()
+
+        assert tracer._resolve_entry("POST /orders")["symbol_fqn"] == "OrderController.create()"
+
 
 class TestCallChainTracing:
     def test_trace_simple_chain(self, store: SQLiteStore, tracer: CallChainTracer):
@@ -196,6 +222,28 @@ class TestLayerAnnotation:
         assert result.chain[0].get("layer") == "repository"
 
 
+    def test_annotation_lookup_once_per_target(self, store: SQLiteStore, tracer: CallChainTracer):
+        store.insert_symbols([
+            SymbolData(fqn="A.run()", kind=SymbolKind.METHOD, name="run"),
+            SymbolData(fqn="B.run()", kind=SymbolKind.METHOD, name="run"),
+            SymbolData(
+                fqn="Orders.save()", kind=SymbolKind.METHOD, name="save", annotations=["@Repository"]
+            ),
+        ])
+        store.insert_edges([
+            EdgeData(from_fqn="A.run()", to_fqn="B.run()", relation=RelationKind.CALLS),
+            EdgeData(from_fqn="A.run()", to_fqn="Orders.save()", relation=RelationKind.CALLS),
+            EdgeData(from_fqn="B.run()", to_fqn="Orders.save()", relation=RelationKind.CALLS),
+        ])
+
+        with patch.object(store, "get_symbol", wraps=store.get_symbol) as get_symbol:
+            result = tracer.trace_from_fqn("A.run()")
+
+        # Only the entry symbol is fetched individually
+        assert get_symbol.call_count == 1
+        layers = {item["to_fqn"]: item["layer"] for item in result.chain}
+        assert layers == {"B.run()": "unknown", "Orders.save()": "repository"}
+
 class TestExternalDependencies:
     def test_extract_external_deps(self, store: SQLiteStore, tracer: CallChainTracer):
         store.insert_symbols([
@@ -219,6 +267,30 @@ class TestExternalDependencies:
         assert len(result.external_deps) == 1
         assert result.external_deps[0]["dependency_type"] == "mysql"
 
+    def test_deps_fetched_in_one_batch(self, store: SQLiteStore, tracer: CallChainTracer):
+        store.insert_symbols([
+            SymbolData(fqn="Service.save()", kind=SymbolKind.METHOD, name="save"),
+            SymbolData(fqn="Mapper.insert()", kind=SymbolKind.METHOD, name="insert"),
+        ])
+        store.insert_edges([
+            EdgeData(from_fqn="Service.save()", to_fqn="Mapper.insert()", relation=RelationKind.CALLS),
+        ])
+        store.insert_external_dependencies([
+            ExternalDependencyData(
+                caller_fqn=caller,
+                dependency_type=DependencyType.MYSQL,
+                target="orders",
+                strength=DependencyStrength.STRONG,
+            )
+            for caller in ("Service.save()", "Mapper.insert()")
+        ])
+
+        with patch.object(store, "get_external_dependencies") as get_external_dependencies:
+            result = tracer.trace_from_entry("Service.save()")
+
+        get_external_dependencies.assert_not_called()
+        assert [dep["caller_fqn"] for dep in result.external_deps] == ["Service.save()"]
+
     def test_no_external_deps(self, store: SQLiteStore, tracer: CallChainTracer):
         store.insert_symbols([
             SymbolData(fqn="Service.process()", kind=SymbolKind.METHOD, name="process"),
@@ -227,3 +299,41 @@ class TestExternalDependencies:
         result = tracer.trace_from_entry("Service.process()")
 
         assert len(result.external_deps) == 0
+
+
+class TestTraceCache:
+    @pytest.fixture(autouse=True)
+    def _chain(self, store: SQLiteStore):
+        store.insert_symbols([
+            SymbolData(fqn="Service.save()", kind=SymbolKind.METHOD, name="save"),
+            SymbolData(fqn="Mapper.insert()", kind=SymbolKind.METHOD, name="insert"),
+        ])
+        store.insert_edges([
+            EdgeData(from_fqn="Service.save()", to_fqn="Mapper.insert()", relation=RelationKind.CALLS),
+        ])
+
+    def test_repeated_trace_hits_cache(self, store: SQLiteStore, tracer: CallChainTracer):
+        first = tracer.trace_from_fqn("Service.save()")
+
+        with patch.object(store, "get_call_chain") as get_call_chain:
+            second = tracer.trace_from_fqn("Service.save()")
+
+        get_call_chain.assert_not_called()
+        assert second.chain == first.chain
+
+    def test_cached_result_is_a_copy(self, tracer: CallChainTracer):
+        tracer.trace_from_fqn("Service.save()").chain.clear()
+
+        assert len(tracer.trace_from_fqn("Service.save()").chain) == 1
+
+    def test_write_invalidates_cache(self, store: SQLiteStore, tracer: CallChainTracer):
+        assert len(tracer.trace_from_fqn("Service.save()").chain) == 1
+
+        store.insert_symbols([
+            SymbolData(fqn="Mapper.update()", kind=SymbolKind.METHOD, name="update"),
+        ])
+        store.insert_edges([
+            EdgeData(from_fqn="Service.save()", to_fqn="Mapper.update()", relation=RelationKind.CALLS),
+        ])
+
+        assert len(tracer.trace_from_fqn("Service.save()").chain) == 2
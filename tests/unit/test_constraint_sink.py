@@ -0,0 +1,79 @@
+"""Tests for constraint sinks."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ariadne_analyzer.l1_business.constraint_sink import ListSink, SQLiteConstraintSink
+from ariadne_analyzer.l1_business.constraints import BusinessConstraintExtractor
+from ariadne_core.models.types import ConstraintType, SymbolData, SymbolKind
+from ariadne_core.storage.sqlite_store import SQLiteStore
+from ariadne_llm.config import LLMConfig, LLMProvider
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a temporary SQLite store with one method symbol."""
+    store = SQLiteStore(str(tmp_path / "sink.db"), init=True)
+    store.insert_symbols([
+        SymbolData(fqn="com.example.A.run()", kind=SymbolKind.METHOD, name="run")
+    ])
+    yield store
+    store.close()
+
+
+class TestListSink:
+    """Tests for the in-memory sink."""
+
+    def test_columns_and_entries(self):
+        """Test that appended constraints round-trip through the columns."""
+        sink = ListSink()
+        sink.append("c1", "d1", "com.example.A", 3, ConstraintType.VALIDATION)
+        sink.extend([("c2", "d2", None, None, ConstraintType.INVARIANT)])
+
+        assert len(sink) == 2
+        assert sink.names == ["c1", "c2"]
+        assert sink.rows()[1] == ("c2", "d2", None, None, ConstraintType.INVARIANT)
+        assert [e.source_line for e in sink.to_entries()] == [3, None]
+
+        assert sink.flush() == 2
+        assert len(sink) == 0
+
+
+class TestSQLiteConstraintSink:
+    """Tests for the SQLite-backed sink."""
+
+    def test_autoflush_and_flush(self, store):
+        """Test that full batches are written and the tail on flush()."""
+        sink = SQLiteConstraintSink(store, batch_size=2)
+        for i in range(3):
+            sink.append(f"run_c{i}", "d", "com.example.A.run()", None, ConstraintType.VALIDATION)
+
+        assert sink.written == 2
+        assert len(sink) == 1
+        assert sink.flush() == 1
+        assert sink.flush() == 0
+        assert len(store.get_constraints_by_source("com.example.A.run()")) == 3
+
+    def test_extract_into_writes_to_store(self, store):
+        """Test that extraction streams explicit constraints into SQLite."""
+        with patch("ariadne_llm.client.OpenAI"):
+            extractor = BusinessConstraintExtractor(
+                LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+            )
+        extractor.llm_client.generate_structured_response = MagicMock()
+        method = SymbolData(
+            fqn="com.example.A.run()",
+            kind=SymbolKind.METHOD,
+            name="run",
+            annotations=["@NotNull"],
+        )
+
+        sink = SQLiteConstraintSink(store)
+        count = extractor.extract_into(sink, method, "return value;")
+        sink.flush()
+        extractor.close()
+
+        assert count == 1
+        extractor.llm_client.generate_structured_response.assert_not_called()
+        assert store.get_constraint("run_NotNull")["constraint_type"] == "validation"
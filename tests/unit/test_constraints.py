@@ -0,0 +1,418 @@
+"""Tests for BusinessConstraintExtractor."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ariadne_analyzer.l1_business.constraints import BusinessConstraintExtractor
+from ariadne_core.models.types import ConstraintType, SymbolData, SymbolKind
+from ariadne_llm.config import LLMConfig, LLMProvider
+
+
+@pytest.fixture
+def extractor():
+    """Create an extractor with a mocked OpenAI client."""
+    with patch("ariadne_llm.client.OpenAI"):
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        extractor = BusinessConstraintExtractor(config)
+        yield extractor
+        extractor.close()
+
+
+# Method body with enough branching to be sent to the LLM
+BRANCHING_SOURCE = 'if (amount <= 0) { throw new IllegalArgumentException("amount"); }'
+
+
+def make_method(name: str, annotations: list[str] | None = None) -> SymbolData:
+    """Create a method symbol for testing."""
+    return SymbolData(
+        fqn=f"com.example.OrderService.{name}()",
+        kind=SymbolKind.METHOD,
+        name=name,
+        parent_fqn="com.example.OrderService",
+        annotations=annotations or [],
+    )
+
+
+class TestExtractBatch:
+    """Tests for batch constraint extraction."""
+
+    def test_extract_batch_uses_batch_api(self, extractor):
+        """Test that OpenAI provider submits all prompts as one batch."""
+        create = make_method("createOrder", ["@NotNull"])
+        cancel = make_method("cancelOrder")
+
+        extractor.llm_client.batch_generate_structured_responses = MagicMock(
+            return_value={
+                create.fqn: {
+                    "constraints": [
+                        {"name": "amount_positive", "description": "金额需大于0", "type": "business_rule"}
+                    ]
+                },
+                cancel.fqn: {
+                    "constraints": [
+                        {"name": "status_check", "description": "仅未发货订单可取消", "type": "invariant"}
+                    ]
+                },
+            }
+        )
+
+        results = extractor.extract_batch([
+            (create, "if (amount <= 0) throw new IllegalArgumentException();", "OrderService"),
+            (cancel, "if (order.isShipped()) throw new IllegalStateException();", "OrderService"),
+        ])
+
+        extractor.llm_client.batch_generate_structured_responses.assert_called_once()
+        prompts = extractor.llm_client.batch_generate_structured_responses.call_args[0][0]
+        assert set(prompts) == {create.fqn, cancel.fqn}
+
+        assert [c.name for c in results[create.fqn]] == [
+            "createOrder_NotNull",
+            "createOrder_check_0",
+            "amount_positive",
+        ]
+        assert results[cancel.fqn][0].constraint_type == ConstraintType.INVARIANT
+
+    def test_extract_batch_falls_back_to_online_calls_on_batch_failure(self, extractor):
+        """Test that a failed or timed-out batch job falls back to online calls."""
+        method = make_method("createOrder", ["@NotNull"])
+        extractor.llm_client.batch_generate_structured_responses = MagicMock(
+            side_effect=TimeoutError("batch still in_progress; cancelled")
+        )
+        extractor.llm_client.generate_structured_response = MagicMock(
+            return_value={"constraints": [{"name": "amount_positive", "description": "d"}]}
+        )
+
+        results = extractor.extract_batch([(method, BRANCHING_SOURCE, "OrderService")])
+
+        extractor.llm_client.generate_structured_response.assert_called_once()
+        assert [c.name for c in results[method.fqn]] == [
+            "createOrder_NotNull",
+            "createOrder_check_0",
+            "createOrder_check_1",
+            "amount_positive",
+        ]
+
+    def test_extract_batch_falls_back_to_concurrent_calls(self):
+        """Test that providers without a Batch API use concurrent online calls."""
+        with patch("ariadne_llm.client.OpenAI"):
+            config = LLMConfig(
+                provider=LLMProvider.DEEPSEEK,
+                api_key="test-key",
+                base_url="https://api.deepseek.com",
+            )
+            extractor = BusinessConstraintExtractor(config)
+
+        extractor.llm_client.generate_structured_response = MagicMock(
+            return_value={"constraints": [{"name": "c", "description": "d"}]}
+        )
+        extractor.llm_client.batch_generate_structured_responses = MagicMock()
+
+        methods = [(make_method(f"m{i}"), BRANCHING_SOURCE, "OrderService") for i in range(3)]
+        results = extractor.extract_batch(methods)
+
+        extractor.llm_client.batch_generate_structured_responses.assert_not_called()
+        assert extractor.llm_client.generate_structured_response.call_count == 3
+        # Two guard checks from the source plus one implicit constraint
+        assert all(len(entries) == 3 for entries in results.values())
+        extractor.close()
+
+    def test_extract_batch_skips_trivial_methods(self, extractor):
+        """Test that getters and branch-free delegates never reach the LLM."""
+        getter = make_method("getAmount")
+        delegate = make_method("cancelOrder")
+        extractor.llm_client.batch_generate_structured_responses = MagicMock(return_value={})
+
+        results = extractor.extract_batch([
+            (getter, "return amount;", "OrderService"),
+            (delegate, "orderRepository.save(order.withStatus(Status.CANCELLED));", "OrderService"),
+        ])
+
+        extractor.llm_client.batch_generate_structured_responses.assert_not_called()
+        assert results == {getter.fqn: [], delegate.fqn: []}
+
+    def test_needs_llm_skips_well_covered_methods(self, extractor):
+        """Test that methods with many explicit constraints skip the LLM."""
+        method = make_method("createOrder")
+
+        assert extractor._needs_llm(method, BRANCHING_SOURCE, 0)
+        max_explicit = extractor.MAX_EXPLICIT_CONSTRAINTS
+        assert not extractor._needs_llm(method, BRANCHING_SOURCE, max_explicit)
+
+
+class TestExtractionCache:
+    """Tests for the persistent implicit constraint cache."""
+
+    @pytest.fixture
+    def cached_extractor(self, tmp_path):
+        """Create an extractor backed by a temporary cache directory."""
+        with patch("ariadne_llm.client.OpenAI"):
+            config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+            extractor = BusinessConstraintExtractor(config, cache_dir=tmp_path)
+            yield extractor
+            extractor.close()
+
+    def test_cache_hit_skips_llm(self, cached_extractor):
+        """Test that unchanged source is served from the cache."""
+        method = make_method("createOrder")
+        cached_extractor.llm_client.generate_structured_response = MagicMock(
+            return_value={"constraints": [{"name": "c1", "description": "d1", "type": "invariant"}]}
+        )
+
+        first = cached_extractor._extract_implicit_constraints(method, "code", "OrderService")
+        second = cached_extractor._extract_implicit_constraints(method, "code", "OrderService")
+
+        assert cached_extractor.llm_client.generate_structured_response.call_count == 1
+        assert [(c.name, c.constraint_type) for c in second] == [
+            (c.name, c.constraint_type) for c in first
+        ]
+
+    def test_changed_source_misses_cache(self, cached_extractor):
+        """Test that modified source code is re-extracted."""
+        method = make_method("createOrder")
+        cached_extractor.llm_client.generate_structured_response = MagicMock(
+            return_value={"constraints": []}
+        )
+
+        cached_extractor._extract_implicit_constraints(method, "code v1", "OrderService")
+        cached_extractor._extract_implicit_constraints(method, "code v2", "OrderService")
+
+        assert cached_extractor.llm_client.generate_structured_response.call_count == 2
+
+    def test_invalid_entry_is_evicted(self, cached_extractor):
+        """Test that entries failing schema validation are evicted."""
+        method = make_method("createOrder")
+        key = cached_extractor._cache_key(method, "code", "OrderService")
+        cached_extractor.cache.put(key, [{"name": "c1", "constraint_type": "bogus"}])
+
+        assert cached_extractor._load_cached(key, method) is None
+        assert cached_extractor.cache.get(key) is None
+
+
+class TestPatternExtraction:
+    """Tests for regex-based constraint extraction."""
+
+    def test_extract_from_comments(self, extractor):
+        """Test that comments with constraint language are extracted once."""
+        comments = [
+            (10, "// 订单金额必须大于0，不能为负"),
+            (11, "// Amount MUST NOT exceed the credit limit"),
+            (12, "// compute the total"),
+        ]
+
+        constraints = extractor.extract_from_comments(comments, "com.example.OrderService")
+
+        assert [c.source_line for c in constraints] == [10, 11]
+        assert constraints[0].description == "// 订单金额必须大于0，不能为负"
+
+    def test_extract_from_comments_many(self, monkeypatch):
+        """Test that per-file results match the single-file scan, in order."""
+        import ariadne_analyzer.l1_business.constraints as module
+
+        files = [
+            ([(1, "// 金额必须大于0"), (2, "// plain comment")], "com.example.A"),
+            ([(5, "// must not be null")], "com.example.B"),
+            ([], "com.example.C"),
+        ]
+
+        def summarize(entries):
+            return [(c.name, c.source_fqn, c.source_line) for c in entries]
+
+        expected = [
+            summarize(BusinessConstraintExtractor.extract_from_comments(comments, fqn))
+            for comments, fqn in files
+        ]
+
+        inline = BusinessConstraintExtractor.extract_from_comments_many(files)
+        monkeypatch.setattr(module, "COMMENT_POOL_MIN_FILES", 1)
+        pooled = BusinessConstraintExtractor.extract_from_comments_many(files, max_workers=2)
+
+        for results in (inline, pooled):
+            assert [summarize(entries) for entries in results] == expected
+        assert expected[0] == [("constraint_line_1", "com.example.A", 1)]
+
+    def test_constraint_check_pattern_categories(self, extractor):
+        """Test that the combined check pattern recovers each category."""
+        source = """
+            if (amount <= 0) { return; }
+            if (user == null) { return; }
+            throw new IllegalArgumentException("bad arg");
+            throw new IllegalStateException("bad state");
+        """
+
+        labels = [
+            extractor.CONSTRAINT_CHECK_LABELS[m.lastgroup]
+            for m in extractor.CONSTRAINT_CHECK_PATTERN.finditer(source)
+        ]
+
+        assert labels == ["边界值检查", "空值检查", "非法参数异常", "非法状态异常"]
+
+    def test_extract_from_source_single_scan(self, extractor):
+        """Test that asserts and guard checks are typed from one scan."""
+        method = make_method("transfer")
+        source = """
+            assert amount > 0 : "转账金额必须为正";
+            if (target == null) { return; }
+            throw new IllegalStateException("account frozen");
+        """
+
+        rows = extractor._extract_from_source(method, source, "AccountService")
+
+        assert [(name, ctype) for name, _, _, _, ctype in rows] == [
+            ("transfer_assert_0", ConstraintType.BUSINESS_RULE),
+            ("transfer_check_0", ConstraintType.VALIDATION),
+            ("transfer_check_1", ConstraintType.INVARIANT),
+        ]
+        assert rows[0][1] == "转账金额必须为正"
+        assert rows[1][1] == "空值检查: if (target == null)"
+
+    def test_extract_from_annotations(self, extractor):
+        """Test that only validation annotations produce constraints."""
+        method = make_method(
+            "createOrder",
+            ["@Override", "@NotNull", "@Size(min=1, max=10)", "@Transactional", "@Email"],
+        )
+
+        rows = extractor._extract_from_annotations(method, "OrderService")
+
+        assert [row[0] for row in rows] == [
+            "createOrder_NotNull",
+            "createOrder_Size(",
+            "createOrder_Email",
+        ]
+        assert all(row[4] == ConstraintType.VALIDATION for row in rows)
+
+    def test_annotation_templates_are_shared(self, extractor):
+        """Test that identical annotation lists reuse one parsed template."""
+        first = make_method("createOrder", ["@NotNull", "@Override"])
+        second = make_method("updateOrder", ["@NotNull", "@Override"])
+
+        extractor._extract_from_annotations(first, "OrderService")
+        hits_before = extractor._annotation_templates.cache_info().hits
+        rows = extractor._extract_from_annotations(second, "OrderService")
+
+        assert extractor._annotation_templates.cache_info().hits == hits_before + 1
+        assert rows == [
+            ("updateOrder_NotNull", "参数验证: @NotNull", second.fqn, None, ConstraintType.VALIDATION)
+        ]
+
+    def test_extract_from_method_raw_matches_entries(self, extractor):
+        """Test that raw rows and entries describe the same constraints."""
+        method = make_method("getAmount", ["@NotNull"])
+
+        rows = extractor.extract_from_method_raw(method, "return amount;", "OrderService")
+        entries = extractor.extract_from_method(method, "return amount;", "OrderService")
+
+        assert rows == [
+            ("getAmount_NotNull", "参数验证: @NotNull", method.fqn, None, ConstraintType.VALIDATION)
+        ]
+        assert [
+            (e.name, e.description, e.source_fqn, e.source_line, e.constraint_type)
+            for e in entries
+        ] == rows
+
+
+class TestPrepareSource:
+    """Tests for prompt source preparation."""
+
+    def test_strips_license_header_and_blank_lines(self, extractor):
+        """Test that license headers and blank line runs are removed."""
+        source = (
+            "/*\n * Copyright 2024 Example Corp.\n * Licensed under Apache 2.0\n */\n"
+            "public void pay() {\n\n\n    charge();\n  \n\n}\n"
+        )
+
+        assert extractor._prepare_source(source) == "public void pay() {\n    charge();\n}"
+
+    def test_keeps_non_license_leading_comment(self, extractor):
+        """Test that ordinary javadoc is kept."""
+        source = "/** Pays the order. */\npublic void pay() {}"
+
+        assert extractor._prepare_source(source) == source
+
+    def test_truncates_to_char_budget_without_tiktoken(self, extractor, monkeypatch):
+        """Test the character fallback when tiktoken is unavailable."""
+        import ariadne_analyzer.l1_business.constraints as module
+
+        monkeypatch.setattr(module, "tiktoken", None)
+
+        assert len(extractor._prepare_source("x" * 5000)) == module.MAX_SOURCE_CHARS
+
+    def test_falls_back_when_encoding_cannot_load(self, extractor, monkeypatch):
+        """Test that a failing BPE download degrades to the character budget."""
+        import ariadne_analyzer.l1_business.constraints as module
+
+        fake_tiktoken = MagicMock()
+        fake_tiktoken.encoding_for_model.side_effect = OSError("network unreachable")
+        monkeypatch.setattr(module, "tiktoken", fake_tiktoken)
+        module._get_encoding.cache_clear()
+        try:
+            assert len(extractor._prepare_source("x" * 5000)) == module.MAX_SOURCE_CHARS
+            assert len(extractor._prepare_source("y" * 5000)) == module.MAX_SOURCE_CHARS
+        finally:
+            module._get_encoding.cache_clear()
+
+        fake_tiktoken.encoding_for_model.assert_called_once()
+
+    def test_truncates_to_token_budget(self, extractor, monkeypatch):
+        """Test that tokenizer-aware truncation keeps max_tokens tokens."""
+        import ariadne_analyzer.l1_business.constraints as module
+
+        encoding = MagicMock()
+        encoding.encode.side_effect = lambda text, **_: text.split(" ")
+        encoding.decode.side_effect = " ".join
+        monkeypatch.setattr(module, "tiktoken", MagicMock())
+        monkeypatch.setattr(module, "_get_encoding", lambda model: encoding)
+
+        source = " ".join(f"t{i}" for i in range(10))
+
+        assert extractor._prepare_source(source, max_tokens=4) == "t0 t1 t2 t3"
+        assert extractor._prepare_source("a b", max_tokens=4) == "a b"
+
+
+class TestAsyncExtraction:
+    """Tests for the asyncio extraction path."""
+
+    async def test_aextract_many_bounds_concurrency(self, extractor):
+        """Test that all methods are extracted with at most N calls in flight."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_response(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"constraints": [{"name": "c", "description": "d"}]}
+
+        extractor.llm_client.agenerate_structured_response = fake_response
+        methods = [
+            (make_method(f"m{i}", ["@NotNull"]), BRANCHING_SOURCE, "OrderService") for i in range(10)
+        ]
+
+        results = await extractor.aextract_many(methods, concurrency=3)
+
+        assert set(results) == {m.fqn for m, _, _ in methods}
+        assert all([c.name for c in r][-1] == "c" for r in results.values())
+        assert all(len(r) == 4 for r in results.values())
+        assert peak == 3
+
+    async def test_failed_call_keeps_explicit_constraints(self, extractor):
+        """Test that a failing async LLM call still yields explicit constraints."""
+        extractor.llm_client.agenerate_structured_response = MagicMock(
+            side_effect=RuntimeError("boom")
+        )
+        method = make_method("createOrder", ["@NotNull"])
+
+        constraints = await extractor.extract_from_method_async(
+            method, BRANCHING_SOURCE, "OrderService"
+        )
+
+        assert [c.name for c in constraints] == [
+            "createOrder_NotNull",
+            "createOrder_check_0",
+            "createOrder_check_1",
+        ]
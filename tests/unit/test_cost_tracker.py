@@ -0,0 +1,75 @@
+"""Tests for LLMCostTracker."""
+
+import pytest
+
+from ariadne_analyzer.l1_business.cost_tracker import LLMCostTracker
+
+
+class TestLLMCostTracker:
+    """Test suite for LLMCostTracker."""
+
+    def test_record_request_aggregates_by_model(self):
+        """Test that totals and per-model costs are aggregated."""
+        tracker = LLMCostTracker()
+
+        tracker.record_request("gpt-4o-mini", input_tokens=800, output_tokens=200)
+        tracker.record_request("gpt-4o-mini", input_tokens=500, output_tokens=500, cached=True)
+        tracker.record_request("gpt-4o", input_tokens=1000, output_tokens=1000)
+
+        summary = tracker.get_summary()
+
+        assert summary["requests_count"] == 3
+        assert summary["cached_count"] == 1
+        assert summary["total_tokens"] == 4000
+        assert summary["model_costs"]["gpt-4o-mini"]["requests"] == 2
+        assert summary["model_costs"]["gpt-4o-mini"]["cost"] == pytest.approx(2 * 0.00015)
+        assert summary["model_costs"]["gpt-4o"]["cost"] == pytest.approx(2 * 0.005)
+        assert summary["total_cost_usd"] == pytest.approx(2 * 0.00015 + 2 * 0.005)
+
+    def test_unknown_model_uses_default_cost(self):
+        """Test that unknown models fall back to the default rate."""
+        tracker = LLMCostTracker()
+
+        tracker.record_request("custom-model", input_tokens=1000, output_tokens=0)
+
+        assert tracker.get_summary()["total_cost_usd"] == pytest.approx(0.001)
+
+    def test_report_and_reset(self):
+        """Test report formatting and reset."""
+        tracker = LLMCostTracker()
+        tracker.record_request("deepseek-chat", input_tokens=1500, output_tokens=500)
+
+        report = tracker.get_report()
+        assert "Total Requests: 1" in report
+        assert "deepseek-chat: 1 requests, 2,000 tokens" in report
+
+        tracker.reset()
+        summary = tracker.get_summary()
+        assert summary["requests_count"] == 0
+        assert summary["model_costs"] == {}
+
+    def test_concurrent_records_are_not_lost(self):
+        """Test that records from many threads are all merged."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracker = LLMCostTracker()
+
+        def record_many(_: int) -> None:
+            for _ in range(500):
+                tracker.record_request("gpt-4o-mini", input_tokens=3, output_tokens=1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record_many, range(8)))
+
+        summary = tracker.get_summary()
+        assert summary["requests_count"] == 8 * 500
+        assert summary["total_tokens"] == 8 * 500 * 4
+        assert summary["model_costs"]["gpt-4o-mini"]["requests"] == 8 * 500
+
+    def test_custom_model_costs_are_precomputed(self):
+        """Test that per-token rates follow MODEL_COSTS passed at init."""
+        tracker = LLMCostTracker(MODEL_COSTS={"local-model": 0.002})
+
+        tracker.record_request("local-model", input_tokens=1500, output_tokens=500)
+
+        assert tracker.get_summary()["total_cost_usd"] == pytest.approx(0.004)
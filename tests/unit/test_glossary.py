@@ -0,0 +1,289 @@
+"""Tests for DomainGlossaryExtractor."""
+
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ariadne_analyzer.l1_business.glossary import (
+    DomainGlossaryExtractor,
+    _is_accessor_name,
+    _split_camel,
+)
+from ariadne_core.models.types import SymbolData, SymbolKind
+from ariadne_llm.config import LLMConfig, LLMProvider
+
+
+@pytest.fixture
+def extractor():
+    """Create a glossary extractor with a mocked OpenAI client."""
+    with patch("ariadne_llm.client.OpenAI"):
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        extractor = DomainGlossaryExtractor(config)
+        yield extractor
+        extractor.close()
+
+
+def make_method(name: str, parent: str = "com.example.OrderService") -> SymbolData:
+    """Create a method symbol for testing."""
+    return SymbolData(
+        fqn=f"{parent}.{name}()",
+        kind=SymbolKind.METHOD,
+        name=name,
+        parent_fqn=parent,
+    )
+
+
+class TestTermExtraction:
+    """Tests for term extraction helpers."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["getAmount", "setAmount", "isPaid", "hashCode", "toString", "equals", "has"],
+    )
+    def test_getters_setters_are_skipped(self, extractor, name):
+        """Test that accessors and Object methods yield no term."""
+        assert extractor._extract_method_term(name) is None
+        assert not extractor._is_domain_relevant_method(make_method(name))
+
+    @pytest.mark.parametrize(
+        "name",
+        ["get", "getX", "is", "isOpen", "issue", "isÉtat", "setup", "setUp", "hashCodeOf", "has"],
+    )
+    def test_accessor_names_match_regex(self, name):
+        """Test that string-based accessor detection matches the previous regex."""
+        pattern = re.compile(r"^(?:(?:get|set|is)[A-Z]|(?:has|contains|equals|hashCode|toString)$)")
+        assert _is_accessor_name(name) is bool(pattern.match(name))
+
+    def test_method_term_splits_camel_case(self, extractor):
+        """Test that method names are split into lowercase words."""
+        assert extractor._extract_method_term("cancelOrder") == "cancel order"
+        # "getter"/"issue" do not match the accessor pattern (no capital after prefix)
+        assert extractor._extract_method_term("issueRefund") == "issue refund"
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("cancelOrder", "cancel order"),
+            ("OrderStatus", "order status"),
+            ("orderID", "order i d"),
+            ("total", "total"),
+            ("ÉtatCommande", "état commande"),
+        ],
+    )
+    def test_split_camel_matches_regex_split(self, name, expected):
+        """Test camelCase splitting, including acronyms and non-ASCII capitals."""
+        assert _split_camel(name) == expected
+        assert _split_camel(name) == re.sub(r"([A-Z])", r" \1", name).strip().lower()
+
+    def test_field_term(self, extractor):
+        """Test field term extraction and technical field skipping."""
+        assert extractor._extract_field_term("orderStatus") == "order status"
+        assert extractor._extract_field_term("serialVersionUID") is None
+        assert extractor._extract_field_term("_cache") is None
+
+    @pytest.mark.parametrize(
+        ("class_name", "expected"),
+        [
+            ("OrderEntity", "Order"),
+            ("PaymentService", "Payment"),
+            ("InvoiceDTO", "Invoice"),
+            ("RefundProcessor", "Refund"),
+            ("Customer", "Customer"),
+            ("TestOrder", None),
+            ("MockPayment", None),
+            ("VO", None),
+        ],
+    )
+    def test_class_term_strips_suffix(self, extractor, class_name, expected):
+        """Test that technical suffixes are removed from class terms."""
+        assert extractor._extract_class_term(class_name) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "relevant"),
+        [
+            ("createOrder", True),
+            ("bulkUpdate", True),
+            ("reCalculateTotal", True),
+            ("cancel", False),
+            ("getOrder", False),
+        ],
+    )
+    def test_domain_relevant_method(self, extractor, name, relevant):
+        """Test business verb detection anywhere in the name."""
+        assert extractor._is_domain_relevant_method(make_method(name)) is relevant
+
+
+class TestBuildGlossary:
+    """Tests for build_glossary()."""
+
+    def test_groups_members_by_parent_class(self, extractor):
+        """Test that each class receives only its own methods and fields."""
+        order = SymbolData(fqn="com.example.Order", kind=SymbolKind.CLASS, name="Order")
+        invoice = SymbolData(fqn="com.example.Invoice", kind=SymbolKind.CLASS, name="Invoice")
+        symbols = [
+            order,
+            make_method("createOrder", parent=order.fqn),
+            SymbolData(
+                fqn="com.example.Order.orderStatus",
+                kind=SymbolKind.FIELD,
+                name="orderStatus",
+                parent_fqn=order.fqn,
+            ),
+            invoice,
+            make_method("generateInvoice", parent=invoice.fqn),
+        ]
+        extractor._collect_class_terms = MagicMock(return_value=[])
+
+        extractor.build_glossary(symbols)
+
+        calls = {
+            call.args[0].name: ([m.name for m in call.args[1]], [f.name for f in call.args[2]])
+            for call in extractor._collect_class_terms.call_args_list
+        }
+        assert calls == {
+            "Order": (["createOrder"], ["orderStatus"]),
+            "Invoice": (["generateInvoice"], []),
+        }
+
+    def test_duplicate_terms_are_explained_once(self, extractor):
+        """Test that repeated terms are deduplicated before the LLM call."""
+        extractor.llm_client.generate_structured_response = MagicMock(
+            side_effect=fake_batch_response
+        )
+        symbols = []
+        for name in ("OrderService", "OrderRepository"):
+            cls = SymbolData(fqn=f"com.example.{name}", kind=SymbolKind.CLASS, name=name)
+            symbols += [cls, make_method("createOrder", parent=cls.fqn)]
+
+        entries = extractor.build_glossary(symbols)
+
+        prompt = extractor.llm_client.generate_structured_response.call_args.args[0]
+        sent = json.loads(re.search(r"^\[.*\]$", prompt, re.MULTILINE).group(0))
+        assert [t["term"] for t in sent] == ["Order", "create order"]
+        assert [(e.code_term, e.source_fqn) for e in entries] == [
+            ("Order", "com.example.OrderService"),
+            ("create order", "com.example.OrderService.createOrder()"),
+        ]
+
+
+def fake_batch_response(prompt: str) -> dict:
+    """Answer a multi-term glossary prompt with one meaning per term."""
+    terms = json.loads(re.search(r"^\[.*\]$", prompt, re.MULTILINE).group(0))
+    return {
+        "terms": [
+            {"id": t["id"], "business_meaning": f"meaning of {t['term']}", "synonyms": []}
+            for t in terms
+            if t["term"] != "skip me"
+        ]
+    }
+
+
+class TestExtractTermsBatch:
+    """Tests for multi-term LLM batching."""
+
+    def test_one_request_per_chunk(self, extractor):
+        """Test that terms are chunked into multi-term requests."""
+        extractor.llm_client.generate_structured_response = MagicMock(
+            side_effect=fake_batch_response
+        )
+        terms = [(f"term {i}", {"class_name": "Order"}, f"com.example.F{i}") for i in range(5)]
+
+        entries = extractor.extract_terms_batch(terms, batch_size=2)
+
+        assert extractor.llm_client.generate_structured_response.call_count == 3
+        assert [e.code_term for e in entries] == [f"term {i}" for i in range(5)]
+        assert entries[3].business_meaning == "meaning of term 3"
+        assert entries[3].source_fqn == "com.example.F3"
+
+    def test_missing_and_failed_terms_are_omitted(self, extractor):
+        """Test that unanswered terms and failed chunks yield no entries."""
+        extractor.llm_client.generate_structured_response = MagicMock(
+            side_effect=fake_batch_response
+        )
+        terms = [("keep me", {}, "a"), ("skip me", {}, "b")]
+
+        assert [e.code_term for e in extractor.extract_terms_batch(terms)] == ["keep me"]
+
+        extractor.llm_client.generate_structured_response.side_effect = RuntimeError("boom")
+        assert extractor.extract_terms_batch(terms) == []
+
+    def test_extract_terms_from_class_uses_single_request(self, extractor):
+        """Test that one class is explained with one LLM request."""
+        extractor.llm_client.generate_structured_response = MagicMock(
+            side_effect=fake_batch_response
+        )
+        order = SymbolData(
+            fqn="com.example.OrderService", kind=SymbolKind.CLASS, name="OrderService"
+        )
+
+        entries = extractor.extract_terms_from_class(
+            order, [make_method("createOrder"), make_method("cancelOrder"), make_method("getId")]
+        )
+
+        extractor.llm_client.generate_structured_response.assert_called_once()
+        assert [e.code_term for e in entries] == ["Order", "create order"]
+
+
+class TestGlossaryCache:
+    """Tests for the persistent term meaning cache."""
+
+    @pytest.fixture
+    def cached_extractor(self, tmp_path):
+        """Create a glossary extractor with a disk cache."""
+        with patch("ariadne_llm.client.OpenAI"):
+            config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+            extractor = DomainGlossaryExtractor(config, cache_dir=tmp_path)
+            extractor.llm_client.generate_structured_response = MagicMock(
+                side_effect=fake_batch_response
+            )
+            yield extractor
+            extractor.close()
+
+    def test_cached_terms_skip_llm(self, cached_extractor):
+        """Test that only uncached terms are sent on the next run."""
+        llm = cached_extractor.llm_client.generate_structured_response
+        cached_extractor.extract_terms_batch([("order", {"class_name": "Order"}, "a")])
+
+        entries = cached_extractor.extract_terms_batch(
+            [("order", {"class_name": "Order"}, "a"), ("refund", {}, "b")]
+        )
+
+        assert llm.call_count == 2
+        sent = json.loads(re.search(r"^\[.*\]$", llm.call_args.args[0], re.MULTILINE).group(0))
+        assert [t["term"] for t in sent] == ["refund"]
+        assert [(e.code_term, e.business_meaning) for e in entries] == [
+            ("order", "meaning of order"),
+            ("refund", "meaning of refund"),
+        ]
+
+    def test_context_is_part_of_key(self, cached_extractor):
+        """Test that the same term in another context is explained again."""
+        llm = cached_extractor.llm_client.generate_structured_response
+        cached_extractor.extract_terms_batch([("order", {"class_name": "Order"}, "a")])
+        cached_extractor.extract_terms_batch([("order", {"class_name": "Invoice"}, "b")])
+
+        assert llm.call_count == 2
+
+    def test_failed_terms_are_not_cached(self, cached_extractor):
+        """Test that terms without a meaning are retried."""
+        llm = cached_extractor.llm_client.generate_structured_response
+        terms = [("skip me", {}, "a")]
+        cached_extractor.extract_terms_batch(terms)
+        cached_extractor.extract_terms_batch(terms)
+
+        assert llm.call_count == 2
+
+    def test_invalid_cache_entry_is_evicted(self, cached_extractor):
+        """Test that malformed cached payloads are regenerated."""
+        llm = cached_extractor.llm_client.generate_structured_response
+        candidate = ("order", {}, "a")
+        key = cached_extractor._cache_key(candidate)
+        cached_extractor.cache.put(key, {"business_meaning": 42})
+
+        entries = cached_extractor.extract_terms_batch([candidate])
+
+        assert llm.call_count == 1
+        assert entries[0].business_meaning == "meaning of order"
+        assert cached_extractor.cache.get(key)["business_meaning"] == "meaning of order"
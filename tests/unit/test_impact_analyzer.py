@@ -0,0 +1,159 @@
+"""Tests for ImpactAnalyzer."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ariadne_analyzer.l3_implementation.impact_analyzer import ImpactAnalyzer
+from ariadne_core.models.types import EdgeData, RelationKind, SymbolData, SymbolKind
+from ariadne_core.storage.sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    """Create a store with two call chains ending in different services."""
+    store = SQLiteStore(str(tmp_path / "test.db"), init=True)
+    store.insert_symbols([
+        SymbolData(
+            fqn="com.example.OrderController",
+            kind=SymbolKind.CLASS,
+            name="OrderController",
+            file_path="/src/OrderController.java",
+            annotations=["@RestController"],
+        ),
+        SymbolData(fqn="com.example.OrderService.create", kind=SymbolKind.METHOD, name="create"),
+        SymbolData(fqn="com.example.UserService.find", kind=SymbolKind.METHOD, name="find"),
+        SymbolData(fqn="com.example.OrderRepository.save", kind=SymbolKind.METHOD, name="save"),
+    ])
+    store.insert_edges([
+        EdgeData(
+            "com.example.OrderController",
+            "com.example.OrderService.create",
+            RelationKind.CALLS,
+        ),
+        EdgeData(
+            "com.example.OrderService.create",
+            "com.example.OrderRepository.save",
+            RelationKind.CALLS,
+        ),
+        EdgeData(
+            "com.example.OrderService.create",
+            "com.example.UserService.find",
+            RelationKind.CALLS,
+        ),
+    ])
+    yield store
+    store.close()
+
+
+class TestFindCallers:
+    """Tests for the reverse call graph traversal."""
+
+    def test_single_query_returns_callers_and_symbols(self, store):
+        """Test that callers carry layer info and their symbol rows."""
+        analyzer = ImpactAnalyzer(store)
+
+        callers, symbol_map, truncated = analyzer._find_callers_with_symbols(
+            ["com.example.OrderRepository.save"], max_depth=5
+        )
+
+        assert [(c["depth"], c["from_fqn"]) for c in callers] == [
+            (0, "com.example.OrderService.create"),
+            (1, "com.example.OrderController"),
+        ]
+        assert callers[1]["layer"] == "controller"
+        assert callers[1]["from_kind"] == "class"
+        assert symbol_map["com.example.OrderController"]["file_path"] == "/src/OrderController.java"
+        assert not truncated
+
+    def test_multiple_targets_in_one_traversal(self, store):
+        """Test that each caller is tagged with the target it was reached from."""
+        analyzer = ImpactAnalyzer(store)
+
+        callers, _, _ = analyzer._find_callers_with_symbols(
+            ["com.example.OrderRepository.save", "com.example.UserService.find"], max_depth=0
+        )
+
+        assert sorted((c["target_fqn"], c["from_fqn"]) for c in callers) == [
+            ("com.example.OrderRepository.save", "com.example.OrderService.create"),
+            ("com.example.UserService.find", "com.example.OrderService.create"),
+        ]
+
+    def test_traversal_is_bounded(self, store):
+        """Test that the traversal stops after max_callers rows, shallowest first."""
+        analyzer = ImpactAnalyzer(store)
+
+        callers, _, _ = analyzer._find_callers_with_symbols(
+            ["com.example.OrderRepository.save"], max_depth=5, max_callers=1
+        )
+
+        assert [c["from_fqn"] for c in callers] == ["com.example.OrderService.create"]
+
+    def test_analyze_impact_reports_truncation(self, store):
+        """Test that analyze_impact flags results cut off at max_callers."""
+        analyzer = ImpactAnalyzer(store)
+        target = "com.example.OrderRepository.save"
+
+        bounded = analyzer.analyze_impact(target, include_tests=False, max_callers=1)
+        complete = analyzer.analyze_impact(target, include_tests=False)
+
+        assert bounded.truncated
+        assert len(bounded.affected_callers) == 1
+        assert not complete.truncated
+        assert len(complete.affected_callers) == 2
+
+
+class TestMapToEntryPoints:
+    """Tests for mapping callers to entry points."""
+
+    def test_entry_points_of_callers(self, store):
+        """Test that entry points are found for every distinct caller."""
+        store.conn.execute(
+            "INSERT INTO entry_points (symbol_fqn, entry_type, http_method, http_path)"
+            " VALUES ('com.example.OrderController', 'http_api', 'POST', '/orders')"
+        )
+        store.conn.commit()
+        analyzer = ImpactAnalyzer(store)
+        callers, _, _ = analyzer._find_callers_with_symbols(
+            ["com.example.OrderRepository.save", "com.example.UserService.find"], max_depth=5
+        )
+
+        entry_points = analyzer._map_to_entry_points(callers)
+
+        assert [(ep["fqn"], ep["http_path"]) for ep in entry_points] == [
+            ("com.example.OrderController", "/orders")
+        ]
+
+
+class TestFindRelatedTests:
+    """Tests for mapping callers to test files."""
+
+    def test_callers_grouped_by_file_in_one_lookup(self, store, tmp_path):
+        """Test that callers are deduplicated and their symbols fetched in one batch."""
+        source = tmp_path / "src/main/java/com/example/OrderService.java"
+        test_file = tmp_path / "src/test/java/com/example/OrderServiceTest.java"
+        test_file.parent.mkdir(parents=True)
+        test_file.touch()
+        store.conn.execute(
+            "UPDATE symbols SET file_path = ? WHERE fqn LIKE 'com.example.OrderService%'",
+            (str(source),),
+        )
+        store.conn.commit()
+        callers = [
+            {"from_fqn": "com.example.OrderService.create", "depth": 0},
+            {"from_fqn": "com.example.OrderService.create", "depth": 1},
+        ]
+        analyzer = ImpactAnalyzer(store)
+
+        with patch.object(store, "get_symbol") as get_symbol:
+            tests = analyzer._find_related_tests(callers)
+
+        get_symbol.assert_not_called()
+        assert tests == [
+            {
+                "path": str(test_file),
+                "covers": ["com.example.OrderService.create"],
+                "additional_tests": [],
+            }
+        ]
@@ -231,6 +231,209 @@ class TestIncrementalSummarizerCoordinator:
         assert result.cost_report
         assert "LLM Usage Report" in result.cost_report
 
+    def test_concurrent_fresh_summary_is_kept(self, mock_llm_client, populated_store):
+        """Test that a summary refreshed during summarization is not overwritten."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        summarize = coordinator.parallel.summarize_symbols_batch
+
+        def summarize_with_concurrent_update(symbols, **kwargs):
+            results = summarize(symbols, **kwargs)
+            populated_store.create_summary(
+                SummaryData(
+                    target_fqn="com.example.ClassB.callMethodA()",
+                    level=SummaryLevel.METHOD,
+                    summary="Concurrent summary",
+                    is_stale=False,
+                )
+            )
+            return results
+
+        coordinator.parallel.summarize_symbols_batch = summarize_with_concurrent_update
+        source_map = {
+            "com.example.ClassA.methodA()": "public void methodA() { }",
+            "com.example.ClassB.callMethodA()": "public void callMethodA() { methodA(); }",
+        }
+
+        coordinator.regenerate_incremental(
+            changed_symbols=["com.example.ClassA.methodA()"],
+            symbol_source_map=source_map,
+            show_progress=False,
+        )
+
+        kept = populated_store.get_summary("com.example.ClassB.callMethodA()")
+        assert kept["summary"] == "Concurrent summary"
+        assert populated_store.get_summary("com.example.ClassA.methodA()")["summary"] == (
+            "Summary for methodA"
+        )
+
+    def test_symbols_loaded_from_rows(self, mock_llm_client, populated_store):
+        """Test that symbol rows are converted with decoded JSON columns."""
+        populated_store.insert_symbols([
+            SymbolData(
+                fqn="com.example.ClassA.methodA()",
+                kind=SymbolKind.METHOD,
+                name="methodA",
+                signature="public void methodA()",
+                parent_fqn="com.example.ClassA",
+                modifiers=["public"],
+                annotations=["@Transactional"],
+            )
+        ])
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        received = []
+        coordinator.parallel.summarize_symbols_batch = MagicMock(
+            side_effect=lambda symbols, **kwargs: received.extend(symbols) or {}
+        )
+
+        coordinator.regenerate_incremental(
+            changed_symbols=["com.example.ClassA.methodA()"],
+            symbol_source_map={"com.example.ClassA.methodA()": "public void methodA() { }"},
+            show_progress=False,
+        )
+
+        [(symbol, source)] = received
+        assert symbol.kind == SymbolKind.METHOD
+        assert symbol.parent_fqn == "com.example.ClassA"
+        assert symbol.modifiers == ["public"]
+        assert symbol.annotations == ["@Transactional"]
+        assert source == "public void methodA() { }"
+
+    def test_close_stops_background_reader(self, mock_llm_client, populated_store):
+        """Test that close() shuts down the cache-filter reader thread."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        coordinator.regenerate_incremental(
+            changed_symbols=["com.example.ClassA.methodA()"],
+            symbol_source_map={"com.example.ClassA.methodA()": "public void methodA() { }"},
+            show_progress=False,
+        )
+
+        coordinator.close()
+
+        with pytest.raises(RuntimeError):
+            coordinator._io_pool.submit(lambda: None)
+        mock_llm_client.close.assert_called_once()
+
+    def test_all_cached_symbols_are_skipped(self, mock_llm_client, populated_store):
+        """Test that symbols with fresh summaries are never dispatched."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        get_affected_symbols = coordinator.tracker.get_affected_symbols
+
+        def affected_with_fresh_summaries(changed_fqns):
+            # Summaries refreshed right after the tracker marked them stale
+            affected = get_affected_symbols(changed_fqns)
+            populated_store.batch_create_summaries([
+                SummaryData(target_fqn=fqn, level=SummaryLevel.METHOD, summary="Cached")
+                for fqn in affected.total_set
+            ])
+            return affected
+
+        coordinator.tracker.get_affected_symbols = affected_with_fresh_summaries
+        coordinator.parallel.summarize_symbols_batch = MagicMock(
+            side_effect=lambda symbols, **kwargs: {s.fqn: "new" for s, _ in symbols}
+        )
+        source_map = {
+            "com.example.ClassA.methodA()": "public void methodA() { }",
+            "com.example.ClassB.callMethodA()": "public void callMethodA() { methodA(); }",
+        }
+
+        result = coordinator.regenerate_incremental(
+            changed_symbols=["com.example.ClassA.methodA()"],
+            symbol_source_map=source_map,
+            show_progress=False,
+        )
+
+        assert result.regenerated_count == 0
+        assert result.skipped_cached == 2
+        assert populated_store.get_summary("com.example.ClassA.methodA()")["summary"] == "Cached"
+
+    def test_completed_summaries_survive_failure(self, mock_llm_client, populated_store):
+        """Test that summaries written before a mid-run crash are persisted."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+
+        def summarize_then_crash(symbols, show_progress=True, on_complete=None, **kwargs):
+            symbol, _ = next(iter(symbols))
+            on_complete(symbol.fqn, "Written before crash")
+            raise RuntimeError("LLM outage")
+
+        coordinator.parallel.summarize_symbols_batch = summarize_then_crash
+        source_map = {
+            "com.example.ClassA.methodA()": "public void methodA() { }",
+            "com.example.ClassB.callMethodA()": "public void callMethodA() { methodA(); }",
+        }
+
+        with pytest.raises(RuntimeError):
+            coordinator.regenerate_incremental(
+                changed_symbols=["com.example.ClassA.methodA()"],
+                symbol_source_map=source_map,
+                show_progress=False,
+            )
+
+        written = [
+            fqn for fqn in source_map
+            if (populated_store.get_summary(fqn) or {}).get("summary") == "Written before crash"
+        ]
+        assert len(written) == 1
+
+
+    def test_rerun_reuses_summaries_with_unchanged_input(
+        self, mock_llm_client, populated_store
+    ):
+        """Test that a rerun over the same changes does not call the LLM again."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        source_map = {
+            "com.example.ClassA.methodA()": "public void methodA() { }",
+            "com.example.ClassB.callMethodA()": "public void callMethodA() { methodA(); }",
+        }
+
+        def run():
+            return coordinator.regenerate_incremental(
+                changed_symbols=["com.example.ClassA.methodA()"],
+                symbol_source_map=source_map,
+                show_progress=False,
+            )
+
+        assert run().regenerated_count == 2
+
+        mock_llm_client.generate_summary = MagicMock(return_value="Should not be called")
+        result = run()
+
+        assert result.regenerated_count == 0
+        assert result.skipped_cached == 2
+        mock_llm_client.generate_summary.assert_not_called()
+        assert populated_store.batch_get_fresh_summary_fqns(list(source_map)) == set(source_map)
+
+        # Edited source is summarized again
+        source_map["com.example.ClassA.methodA()"] = "public void methodA() { log(); }"
+        assert run().regenerated_count == 1
+
+    def test_fallback_summaries_are_retried(self, mock_llm_client, populated_store):
+        """Test that summaries from failed LLM calls are not reused."""
+        coordinator = IncrementalSummarizerCoordinator(
+            mock_llm_client, populated_store, max_workers=2
+        )
+        source_map = {"com.example.ClassA.methodA()": "public void methodA() { }"}
+        mock_llm_client.generate_summary = MagicMock(side_effect=RuntimeError("outage"))
+
+        coordinator.regenerate_incremental(
+            changed_symbols=["com.example.ClassA.methodA()"],
+            symbol_source_map=source_map,
+            show_progress=False,
+        )
+
+        assert populated_store.batch_get_summary_source_hashes(list(source_map)) == {}
+
 
 class TestIncrementalResult:
     """Test IncrementalResult dataclass."""
@@ -6,6 +6,7 @@ from ariadne_core.utils.layer import (
     determine_layer,
     determine_layer_or_unknown,
     get_layer_priority,
+    infer_layer,
     is_controller,
     is_repository,
     is_service,
@@ -86,6 +87,21 @@ class TestDetermineLayerOrUnknown:
         assert determine_layer_or_unknown(sample_symbol) == "controller"
 
 
+class TestInferLayer:
+    """Tests for infer_layer function."""
+
+    def test_annotations_take_precedence(self):
+        """Test that annotations win over naming conventions."""
+        assert infer_layer("com.example.service.Api", "Api", '["@RestController"]') == "controller"
+        assert infer_layer("com.example.Orders", "OrderController", ["@Service"]) == "service"
+
+    def test_falls_back_to_name_and_fqn(self):
+        """Test naming-convention inference for unannotated symbols."""
+        assert infer_layer("com.example.UserDao.find()", "find") == "repository"
+        assert infer_layer("com.example.OrderServiceImpl", "OrderServiceImpl") == "service"
+        assert infer_layer("com.example.Order", "Order") == "unknown"
+
+
 class TestHelperFunctions:
     """Tests for layer detection helper functions."""
 
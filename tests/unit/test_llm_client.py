@@ -166,6 +166,257 @@ class TestLLMClient:
         assert summary == "Summary text"
         assert mock_client.chat.completions.create.call_count == 2
 
+    @patch("ariadne_llm.client.OpenAI")
+    def test_batch_generate_structured_responses(self, mock_openai):
+        """Test submitting prompts through the Batch API."""
+        import json
+
+        from ariadne_llm.client import create_llm_client
+
+        output_lines = [
+            {
+                "custom_id": "a",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": json.dumps({"ok": 1})}}]},
+                },
+                "error": None,
+            },
+            {
+                "custom_id": "b",
+                "response": {"status_code": 500, "body": {}},
+                "error": {"message": "server error"},
+            },
+        ]
+
+        mock_client = MagicMock()
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(id="batch-1", status="in_progress")
+        mock_client.batches.retrieve.return_value = MagicMock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        mock_client.files.content.return_value = MagicMock(
+            text="\n".join(json.dumps(line) for line in output_lines)
+        )
+        mock_openai.return_value = mock_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = create_llm_client(config)
+
+        results = client.batch_generate_structured_responses(
+            {"a": "prompt a", "b": "prompt b"}, poll_interval=0
+        )
+
+        assert results == {"a": {"ok": 1}}
+        assert mock_client.batches.create.call_args.kwargs["completion_window"] == "24h"
+        mock_client.batches.retrieve.assert_called_once_with("batch-1")
+
+    @patch("ariadne_llm.client.OpenAI")
+    def test_batch_api_generate_summaries(self, mock_openai):
+        """Test submitting summary prompts through the Batch API."""
+        import json
+
+        from ariadne_llm.client import SUMMARY_SYSTEM_PROMPT, create_llm_client
+
+        output_line = {
+            "custom_id": "com.example.A.run()",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": " 摘要: 运行任务 "}}]},
+            },
+            "error": None,
+        }
+
+        mock_client = MagicMock()
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        mock_client.files.content.return_value = MagicMock(text=json.dumps(output_line))
+        mock_openai.return_value = mock_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = create_llm_client(config)
+
+        with patch.object(client, "_chat_request_body", wraps=client._chat_request_body) as body:
+            item = {"code": "void run() {}", "context": {"method_name": "run"}}
+            results = client.batch_api_generate_summaries(
+                {"com.example.A.run()": item}, poll_interval=0
+            )
+
+        assert results == {"com.example.A.run()": "运行任务"}
+        assert body.call_args.args[1] == SUMMARY_SYSTEM_PROMPT
+
+    @patch("ariadne_llm.client.OpenAI")
+    def test_batch_job_cancelled_after_max_wait(self, mock_openai):
+        """Test that a batch job still running after max_wait is cancelled."""
+        from ariadne_llm.client import create_llm_client
+
+        mock_client = MagicMock()
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(id="batch-1", status="in_progress")
+        mock_client.batches.retrieve.return_value = MagicMock(id="batch-1", status="in_progress")
+        mock_openai.return_value = mock_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key", batch_max_wait=0)
+        client = create_llm_client(config)
+
+        with pytest.raises(TimeoutError):
+            client.batch_generate_structured_responses({"a": "prompt a"}, poll_interval=0)
+
+        mock_client.batches.cancel.assert_called_once_with("batch-1")
+        mock_client.files.content.assert_not_called()
+
+
+    @patch("ariadne_llm.client.AsyncOpenAI")
+    @patch("ariadne_llm.client.OpenAI")
+    async def test_agenerate_structured_response(self, mock_openai, mock_async_openai):
+        """Test the async structured response path and lazy async client."""
+        from unittest.mock import AsyncMock
+
+        from ariadne_llm.client import create_llm_client
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content='{"ok": 1}'))]
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_client.close = AsyncMock()
+        mock_async_openai.return_value = mock_async_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = create_llm_client(config)
+        mock_async_openai.assert_not_called()
+
+        assert await client.agenerate_structured_response("prompt") == {"ok": 1}
+        assert await client.agenerate_structured_response("prompt") == {"ok": 1}
+        mock_async_openai.assert_called_once()
+
+        await client.aclose()
+        mock_async_client.close.assert_awaited_once()
+
+    @patch("ariadne_llm.client.AsyncOpenAI")
+    @patch("ariadne_llm.client.OpenAI")
+    async def test_agenerate_summary(self, mock_openai, mock_async_openai):
+        """Test that the async summary path cleans the response like the sync one."""
+        from unittest.mock import AsyncMock
+
+        from ariadne_llm.client import create_llm_client
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content=" 摘要: 验证用户登录凭据 "))]
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai.return_value = mock_async_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = create_llm_client(config)
+
+        summary = await client.agenerate_summary("void login() {}", {"method_name": "login"})
+
+        assert summary == "验证用户登录凭据"
+        prompt = mock_async_client.chat.completions.create.call_args.kwargs["messages"][-1]
+        assert "方法名: login" in prompt["content"]
+
+
+    @patch("ariadne_llm.client.AsyncOpenAI")
+    @patch("ariadne_llm.client.OpenAI")
+    def test_batch_generate_summaries_uses_async_client(self, mock_openai, mock_async_openai):
+        """Test that batch summaries go through one async client, in input order."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from ariadne_llm.client import create_llm_client
+
+        async def create(**kwargs):
+            content = kwargs["messages"][-1]["content"]
+            if "slow" in content:
+                await asyncio.sleep(1)
+            summary = "A" if "item_a" in content else "B"
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=summary))])
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_client.close = AsyncMock()
+        mock_async_openai.return_value = mock_async_client
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key", request_timeout=0.05)
+        client = create_llm_client(config)
+        items = [{"code": "item_a"}, {"code": "slow"}, {"code": "item_b"}]
+
+        summaries = client.batch_generate_summaries(items, concurrent_limit=2)
+
+        assert summaries == ["A", "N/A", "B"]
+        mock_openai.return_value.chat.completions.create.assert_not_called()
+
+        # The loop and async client are kept across calls until close()
+        assert client.batch_generate_summaries(items[:1]) == ["A"]
+        mock_async_openai.assert_called_once()
+        mock_async_client.close.assert_not_awaited()
+
+        client.close()
+        mock_async_client.close.assert_awaited_once()
+
+    @patch("ariadne_llm.client.AsyncOpenAI")
+    @patch("ariadne_llm.client.OpenAI")
+    async def test_batch_generate_summaries_inside_running_loop(
+        self, mock_openai, mock_async_openai
+    ):
+        """Test that the sync batch API works when called from a running event loop."""
+        from ariadne_llm.client import create_llm_client
+
+        mock_openai.return_value.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="同步摘要"))]
+        )
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = create_llm_client(config)
+
+        summaries = client.batch_generate_summaries([{"code": "a"}, {"code": "b"}])
+
+        assert summaries == ["同步摘要", "同步摘要"]
+        mock_async_openai.assert_not_called()
+        client.close()
+
+
+    @patch("ariadne_llm.client.OpenAI")
+    def test_clients_share_http_pool(self, mock_openai, monkeypatch):
+        """Test that clients share one HTTP pool that closes with the last client."""
+        from ariadne_llm import http_pool
+        from ariadne_llm.client import LLMClient
+
+        # Isolate from pool references held by other tests' clients
+        monkeypatch.setattr(http_pool, "_clients", {})
+        monkeypatch.setattr(http_pool, "_refcounts", {})
+
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        first = LLMClient(config)
+        second = LLMClient(config)
+
+        pools = [c.kwargs["http_client"] for c in mock_openai.call_args_list]
+        assert pools[0] is pools[1]
+
+        first.close()
+        first.close()  # idempotent, must not release the pool twice
+        assert not pools[0].is_closed
+
+        second.close()
+        assert pools[0].is_closed
+
+    @patch("ariadne_llm.client.OpenAI")
+    def test_explicit_http_client_is_not_closed(self, mock_openai):
+        """Test that a caller-provided HTTP client is left open on close."""
+        import httpx
+
+        from ariadne_llm.client import LLMClient
+
+        http_client = httpx.Client()
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        client = LLMClient(config, http_client=http_client)
+        client.close()
+
+        assert mock_openai.call_args.kwargs["http_client"] is http_client
+        assert not http_client.is_closed
+        http_client.close()
+
 
 class TestEmbedder:
     """Tests for Embedder."""
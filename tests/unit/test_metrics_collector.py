@@ -2,10 +2,17 @@
 
 import threading
 import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ariadne_api.metrics import MetricsCollector, get_metrics_collector
+from ariadne_api import metrics as metrics_module
+from ariadne_api.metrics import (
+    HISTOGRAM_BUCKETS,
+    MAX_TRACKED_ENDPOINTS,
+    MetricsCollector,
+    get_metrics_collector,
+)
 
 
 @pytest.fixture
@@ -32,6 +39,13 @@ class TestMetricsCollectorSingleton:
         # Both should be the same instance
         assert collector1 is collector2
 
+    def test_constructor_keeps_recorded_state(self, collector):
+        """Test that calling the constructor again does not reinitialize metrics."""
+        collector.record_request("GET", "/test", 10.0, 200)
+
+        assert MetricsCollector() is get_metrics_collector()
+        assert MetricsCollector().request_metrics.total_requests == 1
+
 
 class TestRequestMetrics:
     """Tests for RequestMetrics."""
@@ -82,14 +96,24 @@ class TestRequestMetrics:
         # P99 of 10 samples is the 10th value
         assert collector.request_metrics.p99_duration_ms == 1000.0
 
-    def test_durations_list_bounded(self, collector):
-        """Test that durations list is bounded to 1000 entries."""
-        # Record 2000 requests
+    def test_histogram_memory_bounded(self, collector):
+        """Test that recording requests does not grow per-request storage."""
         for i in range(2000):
-            collector.record_request("GET", "/test", 100.0, 200)
+            collector.record_request("GET", "/test", float(i), 200)
+
+        metrics = collector.request_metrics
+        assert len(metrics.buckets) == HISTOGRAM_BUCKETS
+        assert sum(metrics.buckets) == 2000
+
+    def test_percentile_within_bucket_error(self, collector):
+        """Test that percentiles stay within one bucket of the exact value."""
+        for i in range(1, 1001):
+            collector.record_request("GET", "/test", float(i), 200)
 
-        # Should only keep last 1000
-        assert len(collector.request_metrics.durations) == 1000
+        p95 = collector.request_metrics.p95_duration_ms
+        assert 951.0 <= p95 <= 951.0 * 2 ** (1 / 8)
+        assert 1.0 <= collector.request_metrics.percentile(0.0) <= 2 ** (1 / 8)
+        assert collector.request_metrics.percentile(1.0) == 1000.0
 
 
 class TestMetricsCollection:
@@ -136,6 +160,17 @@ class TestMetricsCollection:
         for field in expected_fields:
             assert field in metrics
 
+
+    def test_memory_usage_sampled_once_per_ttl(self, collector):
+        """Test that repeated snapshots reuse the cached memory reading."""
+        with patch.object(metrics_module, "_memory_cache", [0.0, 0.0]), patch.object(
+            metrics_module._process, "memory_info", return_value=MagicMock(rss=2 * 1024 * 1024)
+        ) as memory_info:
+            first = collector.get_metrics()
+            second = collector.get_metrics()
+
+        memory_info.assert_called_once()
+        assert first["memory_usage_mb"] == second["memory_usage_mb"] == 2.0
     def test_uptime_seconds_increases(self, collector):
         """Test that uptime_seconds is reasonable."""
         metrics = collector.get_metrics()
@@ -177,6 +212,27 @@ class TestEndpointMetrics:
         assert "p95_duration_ms" in test_metrics
         assert "p99_duration_ms" in test_metrics
 
+    def test_id_segments_collapsed(self, collector):
+        """Test that raw paths with IDs share one endpoint entry."""
+        collector.record_request("GET", "/api/v1/jobs/42", 10.0, 200)
+        collector.record_request("GET", "/api/v1/jobs/3f2a9c1e-77b0-4c1d-9e8a-2b6d5f0a1c3e", 10.0, 200)
+
+        assert list(collector.get_endpoint_metrics()) == ["GET /api/v1/jobs/:id"]
+
+    def test_endpoint_count_bounded(self, collector):
+        """Test that least recently used endpoints are evicted past the cap."""
+        collector.record_request("GET", "/first", 10.0, 200)
+        for i in range(MAX_TRACKED_ENDPOINTS):
+            collector.record_request("GET", f"/first/x{i}", 10.0, 200)
+            collector.record_request("GET", "/first", 10.0, 200)
+        collector.record_request("GET", "/last", 10.0, 200)
+
+        endpoint_metrics = collector.get_endpoint_metrics()
+        assert len(endpoint_metrics) == MAX_TRACKED_ENDPOINTS
+        assert "GET /first" in endpoint_metrics
+        assert "GET /first/x0" not in endpoint_metrics
+        assert "GET /last" in endpoint_metrics
+
 
 class TestThreadSafety:
     """Tests for thread-safe metrics collection."""
@@ -240,6 +296,21 @@ class TestThreadSafety:
         test_metrics = endpoint_metrics["GET /api/v1/test"]
         assert test_metrics["total_requests"] == 250  # 5 threads * 50 requests
 
+    def test_recording_skips_collector_lock(self, collector):
+        """Test that a thread's shard is registered once and recording is lock-free."""
+        collector.record_request("GET", "/test", 10.0, 200)
+
+        with patch.object(collector, "_lock") as lock:
+            collector.increment_active_requests()
+            collector.record_request("GET", "/test", 20.0, 500)
+            collector.decrement_active_requests()
+
+        lock.__enter__.assert_not_called()
+        metrics = collector.request_metrics
+        assert metrics.total_requests == 2
+        assert metrics.error_count == 1
+        assert metrics.active_requests == 0
+
 
 class TestActiveRequestTracking:
     """Tests for active request tracking."""
@@ -1,11 +1,14 @@
 """Tests for ParallelSummarizer."""
 
+import asyncio
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from ariadne_analyzer.l1_business.extraction_cache import ExtractionCache
 from ariadne_analyzer.l1_business.parallel_summarizer import ParallelSummarizer
+from ariadne_analyzer.l1_business.semantic_cache import SemanticSummaryCache
 from ariadne_core.models.types import SymbolData, SymbolKind
 from ariadne_llm import LLMConfig, LLMProvider
 
@@ -32,6 +35,7 @@ def mock_llm_client():
         return f"Summary for {method_name}"
 
     client.generate_summary = mock_generate
+    client.supports_batch_api.return_value = False
 
     return client
 
@@ -151,6 +155,86 @@ class TestParallelSummarizer:
         assert stats["failed"] == 1
         assert stats["success"] == 3
 
+    def test_generator_input_is_pulled_incrementally(self, mock_llm_client, sample_symbols):
+        """Test that a generator is consumed with a bounded number of requests in flight."""
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+        pulled = 0
+        max_ahead = 0
+        completed: list[str] = []
+
+        def generate(code, context):
+            time.sleep(0.01)
+            completed.append(context["method_name"])
+            return f"Summary for {context['method_name']}"
+
+        def symbols():
+            nonlocal pulled, max_ahead
+            for item in sample_symbols:
+                pulled += 1
+                max_ahead = max(max_ahead, pulled - len(completed))
+                yield item
+
+        mock_llm_client.generate_summary = generate
+
+        results = summarizer.summarize_symbols_batch(symbols(), show_progress=False)
+
+        assert len(results) == 10
+        assert summarizer.get_stats()["total"] == 10
+        # Never more than max_workers * 2 requests outstanding
+        assert max_ahead <= 4
+
+    def test_on_complete_called_per_summary(self, mock_llm_client, sample_symbols):
+        """Test that on_complete receives every summary, including fallbacks."""
+        def generate(code, context):
+            if context["method_name"] == "method3":
+                raise Exception("Simulated error")
+            return f"Summary for {context['method_name']}"
+
+        mock_llm_client.generate_summary = generate
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+        completed: dict[str, str] = {}
+
+        results = summarizer.summarize_symbols_batch(
+            sample_symbols, show_progress=False, on_complete=completed.__setitem__
+        )
+
+        assert completed == results
+        assert completed["com.example.TestClass.method3()"] == "Method: method3()"
+
+    def test_native_async_client_runs_on_event_loop(self, mock_llm_client, sample_symbols):
+        """Test that agenerate_summary() is awaited with at most max_workers in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def agenerate(code, context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"Async summary for {context['method_name']}"
+
+        mock_llm_client.agenerate_summary = agenerate
+        mock_llm_client.generate_summary = MagicMock(side_effect=AssertionError("sync call"))
+        mock_llm_client.aclose = AsyncMock()
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=3)
+
+        results = summarizer.summarize_symbols_batch(sample_symbols, show_progress=False)
+
+        assert len(results) == 10
+        assert results["com.example.TestClass.method0()"] == "Async summary for method0"
+        assert peak == 3
+
+        # The event loop (and the client's async pool) is kept until close()
+        loop = summarizer._runner.get_loop()
+        summarizer.summarize_symbols_batch(sample_symbols[:2], show_progress=False)
+        assert summarizer._runner.get_loop() is loop
+        mock_llm_client.aclose.assert_not_awaited()
+
+        summarizer.close()
+        mock_llm_client.aclose.assert_awaited_once()
+        assert loop.is_closed()
+
     def test_fallback_summary_getter_setter(self, mock_llm_client):
         """Test fallback summary generation for getters/setters."""
         summarizer = ParallelSummarizer(mock_llm_client)
@@ -170,6 +254,36 @@ class TestParallelSummarizer:
         fallback = summarizer._fallback_summary("com.example.Test.process()", context_regular)
         assert "Method: process" in fallback
 
+    def test_trivial_methods_skip_llm(self, mock_llm_client, sample_symbols):
+        """Test that plain accessors and Object methods never reach the LLM."""
+        mock_llm_client.generate_summary = MagicMock(return_value="Summary")
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+
+        def method(name: str) -> SymbolData:
+            return SymbolData(
+                fqn=f"com.example.TestClass.{name}()",
+                kind=SymbolKind.METHOD,
+                name=name,
+                parent_fqn="com.example.TestClass",
+            )
+
+        trivial = [
+            (method("getName"), "public String getName() {\n    return name;\n}"),
+            (method("setName"), "public void setName(String name) { this.name = name; }"),
+            (method("toString"), "@Override public String toString() { return format(); }"),
+        ]
+        results = summarizer.summarize_symbols_batch(
+            trivial + sample_symbols[:1], show_progress=False
+        )
+
+        assert results["com.example.TestClass.getName()"] == "N/A (getter/accessor)"
+        assert results["com.example.TestClass.setName()"] == "N/A (setter/mutator)"
+        assert results["com.example.TestClass.toString()"] == "N/A"
+        assert mock_llm_client.generate_summary.call_count == 1
+        stats = summarizer.get_stats()
+        assert stats["trivial_skipped"] == 3
+        assert stats["total"] == 1
+
     def test_stats_tracking(self, mock_llm_client, sample_symbols):
         """Test statistics tracking."""
         summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
@@ -211,6 +325,149 @@ class TestParallelSummarizer:
         assert len(results) == 10
 
 
+    def test_cache_hits_skip_llm(self, mock_llm_client, sample_symbols, tmp_path):
+        """Test that cached summaries are served without calling the LLM."""
+        cache = ExtractionCache(tmp_path, "openai", "gpt-4o-mini", "v1")
+        calls = []
+        original_generate = mock_llm_client.generate_summary
+
+        def counting_generate(code, context):
+            calls.append(code)
+            return original_generate(code, context)
+
+        mock_llm_client.generate_summary = counting_generate
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2, cache=cache)
+
+        first = summarizer.summarize_symbols_batch(sample_symbols, show_progress=False)
+        summarizer.reset_stats()
+        second = summarizer.summarize_symbols_batch(sample_symbols, show_progress=False)
+
+        assert second == first
+        assert len(calls) == 10
+        assert summarizer.get_stats()["cache_hits"] == 10
+
+
+    def test_semantic_hits_skip_llm(self, mock_llm_client, sample_symbols):
+        """Test that near-duplicate methods reuse an earlier summary."""
+        embedder = MagicMock()
+        embedder.embed_text.return_value = [1.0, 0.0, 0.0]
+        calls = []
+        original_generate = mock_llm_client.generate_summary
+
+        def counting_generate(code, context):
+            calls.append(code)
+            return original_generate(code, context)
+
+        mock_llm_client.generate_summary = counting_generate
+        summarizer = ParallelSummarizer(
+            mock_llm_client, max_workers=2, semantic_cache=SemanticSummaryCache(embedder)
+        )
+
+        summarizer.summarize_symbols_batch(sample_symbols[:1], show_progress=False)
+        summarizer.reset_stats()
+        results = summarizer.summarize_symbols_batch(sample_symbols[1:3], show_progress=False)
+
+        # Every symbol embeds identically, so only the first reaches the LLM
+        assert len(calls) == 1
+        assert set(results.values()) == {"Summary for method0"}
+        assert summarizer.get_stats()["semantic_hits"] == 2
+
+
+    def test_stats_describe_last_batch(self, mock_llm_client, sample_symbols):
+        """Test that counters are reset per batch and success is counted inline."""
+        original_generate = mock_llm_client.generate_summary
+
+        def failing_generate(code, context):
+            if context["method_name"] == "method0":
+                raise RuntimeError("API error")
+            return original_generate(code, context)
+
+        mock_llm_client.generate_summary = failing_generate
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+
+        summarizer.summarize_symbols_batch(sample_symbols[:4], show_progress=False)
+        first = summarizer.get_stats()
+        summarizer.summarize_symbols_batch(sample_symbols[4:6], show_progress=False)
+        second = summarizer.get_stats()
+
+        assert (first["total"], first["success"], first["failed"]) == (4, 3, 1)
+        assert (second["total"], second["success"], second["failed"]) == (2, 2, 0)
+
+    def test_request_timeout_uses_fallback(self, mock_llm_client, sample_symbols):
+        """Test that calls exceeding request_timeout fall back instead of blocking."""
+        mock_llm_client.config.request_timeout = 0.05
+
+        def hanging_generate(code, context):
+            time.sleep(0.5)
+            return "too late"
+
+        mock_llm_client.generate_summary = hanging_generate
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+
+        results = summarizer.summarize_symbols_batch(sample_symbols[:2], show_progress=False)
+
+        assert set(results.values()) == {"Method: method0()", "Method: method1()"}
+        assert summarizer.get_stats()["failed"] == 2
+
+    def test_collect_false_streams_only(self, mock_llm_client, sample_symbols):
+        """Test that collect=False hands summaries to on_complete without keeping them."""
+        completed = {}
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2)
+
+        results = summarizer.summarize_symbols_batch(
+            sample_symbols,
+            show_progress=False,
+            on_complete=completed.__setitem__,
+            collect=False,
+        )
+
+        assert results == {}
+        assert len(completed) == 10
+
+    def test_large_run_uses_batch_api(self, mock_llm_client, sample_symbols):
+        """Test that runs above the threshold are submitted as one batch job."""
+        mock_llm_client.supports_batch_api.return_value = True
+        # The batch drops one request, which falls back to an online call
+        mock_llm_client.batch_api_generate_summaries.side_effect = lambda items: {
+            fqn: f"Batch {fqn}" for fqn in list(items)[1:]
+        }
+        completed = []
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2, batch_threshold=5)
+
+        results = summarizer.summarize_symbols_batch(
+            iter(sample_symbols),
+            show_progress=False,
+            on_complete=lambda fqn, summary: completed.append(fqn),
+        )
+
+        mock_llm_client.batch_api_generate_summaries.assert_called_once()
+        assert len(results) == len(completed) == 10
+        assert results[sample_symbols[0][0].fqn] == "Summary for method0"
+        assert results[sample_symbols[1][0].fqn] == f"Batch {sample_symbols[1][0].fqn}"
+        assert summarizer.get_stats()["total"] == 10
+
+    def test_batch_failure_falls_back_to_online_calls(self, mock_llm_client, sample_symbols):
+        """Test that a failed batch job is retried through concurrent calls."""
+        mock_llm_client.supports_batch_api.return_value = True
+        mock_llm_client.batch_api_generate_summaries.side_effect = RuntimeError("expired")
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2, batch_threshold=5)
+
+        results = summarizer.summarize_symbols_batch(sample_symbols, show_progress=False)
+
+        assert len(results) == 10
+        assert all(summary.startswith("Summary for") for summary in results.values())
+
+    def test_small_run_skips_batch_api(self, mock_llm_client, sample_symbols):
+        """Test that runs at or below the threshold stay on online calls."""
+        mock_llm_client.supports_batch_api.return_value = True
+        summarizer = ParallelSummarizer(mock_llm_client, max_workers=2, batch_threshold=10)
+
+        results = summarizer.summarize_symbols_batch(sample_symbols, show_progress=False)
+
+        assert len(results) == 10
+        mock_llm_client.batch_api_generate_summaries.assert_not_called()
+
+
 class TestParallelSummarizerIntegration:
     """Integration tests for ParallelSummarizer with real LLM client."""
 
@@ -0,0 +1,88 @@
+"""Tests for AdaptiveRateLimiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from ariadne_llm.rate_limit import (
+    DEFAULT_RETRY_AFTER_SECONDS,
+    AdaptiveRateLimiter,
+    retry_after_seconds,
+)
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after": "2"}, 2.0),
+        ({"retry-after-ms": "250", "retry-after": "2"}, 0.25),
+        ({"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"}, DEFAULT_RETRY_AFTER_SECONDS),
+        (None, DEFAULT_RETRY_AFTER_SECONDS),
+    ],
+)
+def test_retry_after_seconds(headers, expected):
+    """Test Retry-After parsing, preferring the millisecond header."""
+    assert retry_after_seconds(headers) == expected
+
+
+def test_aimd_limit():
+    """Test that 429s halve the limit and successes grow it by one per window."""
+    limiter = AdaptiveRateLimiter()
+    limiter.in_flight = 8
+
+    limiter.on_rate_limited(retry_after=0)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit == 5
+
+    limiter.on_rate_limited(retry_after=0)
+    limiter.on_rate_limited(retry_after=0)
+    limiter.on_rate_limited(retry_after=0)
+    assert limiter.limit == 1
+
+
+async def test_limit_caps_concurrency():
+    """Test that no more than limit calls hold a slot at once."""
+    limiter = AdaptiveRateLimiter()
+    limiter.limit = 2
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_token_bucket_paces_requests():
+    """Test that requests beyond the one-second burst wait for tokens."""
+    limiter = AdaptiveRateLimiter(requests_per_minute=600)  # 10/s, burst of 10
+
+    start = time.monotonic()
+    for _ in range(12):
+        async with limiter.slot():
+            pass
+
+    assert time.monotonic() - start >= 0.15
+
+
+async def test_pause_after_rate_limit():
+    """Test that acquire honours the Retry-After pause."""
+    limiter = AdaptiveRateLimiter()
+    limiter.on_rate_limited(retry_after=0.1)
+
+    start = time.monotonic()
+    async with limiter.slot():
+        pass
+
+    assert time.monotonic() - start >= 0.09
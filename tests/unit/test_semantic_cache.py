@@ -0,0 +1,79 @@
+"""Tests for SemanticSummaryCache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ariadne_analyzer.l1_business.semantic_cache import (
+    INITIAL_CAPACITY,
+    SemanticSummaryCache,
+    normalize_source,
+)
+
+
+def make_embedder(vectors: dict[str, list[float]]) -> MagicMock:
+    """Create an embedder returning fixed vectors by normalized-source suffix."""
+    embedder = MagicMock()
+    embedder.embed_text.side_effect = lambda text: vectors[text.split("\n")[-1]]
+    return embedder
+
+
+def test_normalize_source():
+    """Test that comments and formatting do not affect the normalized text."""
+    code = """
+        // fetch the order
+        public Order get(long id) {   /* by primary
+           key */ return repo.find(id);
+        }
+    """
+
+    assert normalize_source(code) == "public Order get(long id) { return repo.find(id); }"
+
+
+class TestSemanticSummaryCache:
+    """Tests for similarity lookups."""
+
+    def test_similar_method_hits(self):
+        """Test that a vector above the threshold returns the cached summary."""
+        cache = SemanticSummaryCache(
+            make_embedder({"a": [1.0, 0.0], "b": [0.99, 0.05]}), threshold=0.92
+        )
+        cache.add(cache.embed("a", {}), "A.a()", "Summary A")
+
+        hit = cache.lookup(cache.embed("b", {}))
+
+        assert hit is not None
+        assert hit[:2] == ("A.a()", "Summary A")
+        assert hit[2] == pytest.approx(0.9987, abs=1e-3)
+
+    def test_dissimilar_method_misses(self):
+        """Test that vectors below the threshold miss."""
+        cache = SemanticSummaryCache(make_embedder({"a": [1.0, 0.0], "b": [0.5, 0.5]}))
+        cache.add(cache.embed("a", {}), "A.a()", "Summary A")
+
+        assert cache.lookup(cache.embed("b", {})) is None
+
+    def test_embedding_failure_returns_none(self):
+        """Test that embedder errors disable the lookup instead of raising."""
+        embedder = MagicMock()
+        embedder.embed_text.side_effect = RuntimeError("endpoint down")
+        cache = SemanticSummaryCache(embedder)
+
+        assert cache.embed("code", {"signature": "void f()"}) is None
+
+    def test_grows_past_initial_capacity(self):
+        """Test that the vector matrix grows and keeps earlier entries."""
+        embedder = MagicMock()
+        cache = SemanticSummaryCache(embedder)
+        count = INITIAL_CAPACITY + 1
+        for i in range(count):
+            vector = [0.0] * count
+            vector[i] = 1.0
+            embedder.embed_text.return_value = vector
+            cache.add(cache.embed("code", {}), f"A.m{i}()", f"S{i}")
+
+        embedder.embed_text.return_value = [1.0] + [0.0] * (count - 1)
+        hit = cache.lookup(cache.embed("code", {}))
+
+        assert len(cache) == count
+        assert hit is not None and hit[0] == "A.m0()"
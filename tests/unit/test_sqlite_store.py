@@ -1,6 +1,7 @@
 """Unit tests for SQLiteStore."""
 
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -77,6 +78,32 @@ class TestSymbols:
 
         assert store.get_symbol_count() == 2
 
+    def test_batch_get_symbols(self, store: SQLiteStore):
+        symbols = [
+            SymbolData(fqn="com.example.A", kind=SymbolKind.CLASS, name="A"),
+            SymbolData(fqn="com.example.B", kind=SymbolKind.CLASS, name="B"),
+        ]
+        store.insert_symbols(symbols)
+
+        result = store.batch_get_symbols(["com.example.A", "com.example.B", "com.example.Missing"])
+        assert set(result) == {"com.example.A", "com.example.B"}
+        assert result["com.example.B"]["name"] == "B"
+        assert store.batch_get_symbols([]) == {}
+
+    def test_get_parent_symbol(self, store: SQLiteStore):
+        symbols = [
+            SymbolData(fqn="com.example.A", kind=SymbolKind.CLASS, name="A"),
+            SymbolData(
+                fqn="com.example.A.run", kind=SymbolKind.METHOD, name="run", parent_fqn="com.example.A"
+            ),
+        ]
+        store.insert_symbols(symbols)
+
+        parent = store.get_parent_symbol("com.example.A.run")
+        assert parent is not None
+        assert parent["fqn"] == "com.example.A"
+        assert store.get_parent_symbol("com.example.A") is None
+
 
 class TestEdges:
     def test_insert_and_get_edges(self, store: SQLiteStore):
@@ -141,6 +168,16 @@ class TestGraphTraversal:
         assert chain[0]["depth"] == 0
         assert chain[0]["to_fqn"] == "B"
 
+    def test_analyze_collects_edge_index_stats(self, store: SQLiteStore):
+        store.insert_edges([
+            EdgeData(from_fqn="A", to_fqn="B", relation=RelationKind.CALLS),
+        ])
+
+        store.analyze()
+
+        indexes = {row[0] for row in store.conn.execute("SELECT idx FROM sqlite_stat1")}
+        assert {"idx_edges_from_relation", "idx_edges_to_relation"} <= indexes
+
     def test_reverse_callers(self, store: SQLiteStore):
         # First insert symbols for foreign key constraint
         store.insert_symbols([
@@ -172,6 +209,44 @@ class TestMetadata:
         assert store.get_metadata("key") == "value2"
 
 
+class TestConnection:
+    def test_read_tuning_pragmas(self, store: SQLiteStore):
+        from ariadne_core.storage.sqlite_store import PAGE_CACHE_KIB
+
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.conn.execute("PRAGMA cache_size").fetchone()[0] == -PAGE_CACHE_KIB
+
+
+class TestDataVersion:
+    def test_changes_on_own_and_other_writes(self, store: SQLiteStore):
+        version = store.data_version
+        assert store.data_version == version
+
+        store.insert_symbols([SymbolData(fqn="A", kind=SymbolKind.CLASS, name="A")])
+        own_write = store.data_version
+        assert own_write != version
+
+        other = SQLiteStore(store.db_path)
+        other.set_metadata("key", "value")
+        other.close()
+        assert store.data_version != own_write
+
+    def test_distinct_across_thread_connections(self, store: SQLiteStore):
+        """A connection opened after a write must not reuse an older connection's token."""
+        def version_on_new_thread() -> tuple[int, int, int]:
+            result: list[tuple[int, int, int]] = []
+            thread = threading.Thread(target=lambda: result.append(store.data_version))
+            thread.start()
+            thread.join()
+            return result[0]
+
+        before_write = version_on_new_thread()
+        store.insert_symbols([SymbolData(fqn="A", kind=SymbolKind.CLASS, name="A")])
+        after_write = version_on_new_thread()
+
+        assert after_write != before_write
+
+
 class TestCleanup:
     def test_clean_all(self, store: SQLiteStore):
         store.insert_symbols([
@@ -337,3 +412,257 @@ class TestBatchCreateSummaries:
         method_result = store.get_summary("com.example.myMethod")
         assert class_result["level"] == "class"
         assert method_result["level"] == "method"
+
+    def test_batch_create_keep_fresh(self, store: SQLiteStore):
+        """Test that keep_fresh only overwrites stale or missing summaries."""
+        from ariadne_core.models.types import SummaryData, SummaryLevel
+
+        fqns = ["com.example.Fresh", "com.example.Stale", "com.example.New"]
+        store.insert_symbols([
+            SymbolData(fqn=fqn, kind=SymbolKind.CLASS, name=fqn.rsplit(".", 1)[-1])
+            for fqn in fqns
+        ])
+        store.batch_create_summaries([
+            SummaryData(target_fqn=fqns[0], level=SummaryLevel.CLASS, summary="old"),
+            SummaryData(target_fqn=fqns[1], level=SummaryLevel.CLASS, summary="old", is_stale=True),
+        ])
+
+        count = store.batch_create_summaries(
+            [SummaryData(target_fqn=fqn, level=SummaryLevel.CLASS, summary="new") for fqn in fqns],
+            keep_fresh=True,
+        )
+
+        assert count == 2
+        assert store.get_summary(fqns[0])["summary"] == "old"
+        assert store.get_summary(fqns[1])["summary"] == "new"
+        assert store.get_summary(fqns[1])["is_stale"] == 0
+        assert store.get_summary(fqns[2])["summary"] == "new"
+
+
+class TestSummarySourceHash:
+    """Tests for recording the input hash of summaries."""
+
+    def test_hashes_roundtrip_and_mark_fresh(self, store: SQLiteStore):
+        """Test storing hashes and clearing the stale flag of reused summaries."""
+        from ariadne_core.models.types import SummaryData, SummaryLevel
+
+        fqns = ["com.example.A", "com.example.B"]
+        store.insert_symbols([
+            SymbolData(fqn=fqn, kind=SymbolKind.CLASS, name=fqn[-1]) for fqn in fqns
+        ])
+        store.batch_create_summaries([
+            SummaryData(target_fqn=fqns[0], level=SummaryLevel.CLASS, summary="a", source_hash="h"),
+            SummaryData(target_fqn=fqns[1], level=SummaryLevel.CLASS, summary="b"),
+        ])
+        store.mark_summaries_stale(fqns)
+
+        assert store.batch_get_summary_source_hashes(fqns) == {fqns[0]: "h"}
+        assert store.mark_summaries_fresh([fqns[0]]) == 1
+        assert store.batch_get_fresh_summary_fqns(fqns) == {fqns[0]}
+
+    def test_existing_database_is_migrated(self, tmp_path: Path):
+        """Test that opening a database without the column adds it."""
+        import sqlite3
+
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE summaries (id INTEGER PRIMARY KEY, target_fqn TEXT NOT NULL UNIQUE,"
+            " level TEXT NOT NULL, summary TEXT NOT NULL, vector_id TEXT,"
+            " is_stale BOOLEAN DEFAULT FALSE, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteStore(str(db_path))
+        try:
+            columns = {row[1] for row in store.conn.execute("PRAGMA table_info(summaries)")}
+            assert "source_hash" in columns
+        finally:
+            store.close()
+
+
+class TestSymbolLayer:
+    """Tests for the materialized symbols.layer column."""
+
+    def test_layer_stored_on_insert(self, store: SQLiteStore):
+        """Test that the layer is classified when symbols are written."""
+        store.insert_symbols([
+            SymbolData(
+                fqn="com.example.Orders",
+                kind=SymbolKind.CLASS,
+                name="Orders",
+                annotations=["@RestController"],
+            ),
+            SymbolData(
+                fqn="com.example.UserMapper.select()", kind=SymbolKind.METHOD, name="select"
+            ),
+        ])
+
+        assert store.get_symbol("com.example.Orders")["layer"] == "controller"
+        assert store.get_symbol("com.example.UserMapper.select()")["layer"] == "repository"
+
+    def test_existing_symbols_are_backfilled(self, store: SQLiteStore):
+        """Test that rows written without a layer are classified on open."""
+        store.conn.execute(
+            "INSERT INTO symbols (fqn, kind, name, annotations)"
+            " VALUES ('com.example.Billing', 'class', 'Billing', '[\"@Service\"]')"
+        )
+        store.conn.commit()
+
+        reopened = SQLiteStore(store.db_path)
+        try:
+            assert reopened.get_symbol("com.example.Billing")["layer"] == "service"
+        finally:
+            reopened.close()
+
+
+class TestEdgeCalleeClass:
+    """Tests for the materialized edges.callee_class_fqn column."""
+
+    def test_callee_class_stored_on_insert(self, store: SQLiteStore):
+        """Test that the callee's class is parsed when edges are written."""
+        store.insert_edges([
+            EdgeData(
+                from_fqn="com.example.A.run()",
+                to_fqn="com.example.UserMapper.select(java.lang.Long)",
+                relation=RelationKind.CALLS,
+            ),
+            EdgeData(from_fqn="com.example.A.run()", to_fqn="helper", relation=RelationKind.CALLS),
+        ])
+
+        rows = store.conn.execute("SELECT callee_class_fqn FROM edges ORDER BY id").fetchall()
+        assert [row[0] for row in rows] == ["com.example.UserMapper", None]
+
+    def test_existing_edges_are_backfilled(self, tmp_path: Path):
+        """Test that opening a database without the column adds and fills it."""
+        import sqlite3
+
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE edges (id INTEGER PRIMARY KEY, from_fqn TEXT NOT NULL,"
+            " to_fqn TEXT NOT NULL, relation TEXT NOT NULL, metadata TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO edges (from_fqn, to_fqn, relation)"
+            " VALUES ('com.example.A.run()', 'com.example.OrderDao.save()', 'calls')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteStore(str(db_path))
+        try:
+            row = store.conn.execute("SELECT callee_class_fqn FROM edges").fetchone()
+            assert row[0] == "com.example.OrderDao"
+        finally:
+            store.close()
+
+
+class TestMarkSummariesStale:
+    """Tests for mark_summaries_stale() method."""
+
+    def test_mark_summaries_stale_batch(self, store: SQLiteStore):
+        """Test that every listed summary is marked stale in one call."""
+        from ariadne_core.models.types import SummaryData, SummaryLevel
+
+        fqns = [f"com.example.Class{i}" for i in range(1200)]
+        store.insert_symbols([
+            SymbolData(fqn=fqn, kind=SymbolKind.CLASS, name=fqn.rsplit(".", 1)[-1])
+            for fqn in fqns
+        ])
+        store.batch_create_summaries([
+            SummaryData(target_fqn=fqn, level=SummaryLevel.CLASS, summary="s")
+            for fqn in fqns
+        ])
+
+        # Small batch: per-FQN indexed updates
+        assert store.mark_summaries_stale(fqns[:5] + fqns[:2]) == 5
+
+        # Exceeds the temp-table threshold and the legacy 999 bound-parameter
+        # limit, and includes duplicates and unknown FQNs
+        count = store.mark_summaries_stale(fqns[:1100] + fqns[:10] + ["com.example.Missing"])
+
+        assert count == 1100
+        assert store.get_summary(fqns[0])["is_stale"] == 1
+        assert store.get_summary(fqns[1099])["is_stale"] == 1
+        assert store.get_summary(fqns[-1])["is_stale"] == 0
+        assert store.mark_summaries_stale([]) == 0
+
+
+class TestChunkedLookups:
+    """Tests for lookups that exceed one IN-query chunk."""
+
+    def test_batch_lookups_span_chunks(self, store: SQLiteStore):
+        """Test symbol and summary lookups with more FQNs than one chunk holds."""
+        from ariadne_core.models.types import SummaryData, SummaryLevel
+
+        fqns = [f"com.example.Class{i}" for i in range(1200)]
+        store.insert_symbols([
+            SymbolData(fqn=fqn, kind=SymbolKind.CLASS, name=fqn.rsplit(".", 1)[-1])
+            for fqn in fqns
+        ])
+        store.batch_create_summaries([
+            SummaryData(target_fqn=fqn, level=SummaryLevel.CLASS, summary="s", is_stale=i % 2 == 0)
+            for i, fqn in enumerate(fqns[:1100])
+        ])
+
+        symbols = store.batch_get_symbols(fqns + ["com.example.Missing"])
+        staleness = store.batch_get_summary_staleness(fqns)
+
+        assert len(symbols) == 1200
+        assert symbols[fqns[-1]]["name"] == "Class1199"
+        assert len(staleness) == 1100
+        assert staleness[fqns[0]] is True
+        assert staleness[fqns[1099]] is False
+        assert store.batch_get_symbols([]) == {}
+        assert store.batch_get_summary_staleness([]) == {}
+
+        fresh = store.batch_get_fresh_summary_fqns(fqns)
+        assert len(fresh) == 550
+        assert fqns[1] in fresh and fqns[0] not in fresh
+
+    def test_iter_symbols_coalesces_json_columns(self, store: SQLiteStore):
+        """Test that missing modifiers/annotations stream as empty JSON arrays."""
+        store.insert_symbols([
+            SymbolData(fqn="com.example.Plain", kind=SymbolKind.CLASS, name="Plain"),
+            SymbolData(
+                fqn="com.example.Public",
+                kind=SymbolKind.CLASS,
+                name="Public",
+                modifiers=["public"],
+            ),
+        ])
+
+        fqns = ["com.example.Plain", "com.example.Public"]
+        rows = {row["fqn"]: row for row in store.iter_symbols(fqns)}
+
+        assert rows["com.example.Plain"]["modifiers"] == "[]"
+        assert rows["com.example.Plain"]["annotations"] == "[]"
+        assert rows["com.example.Public"]["modifiers"] == '["public"]'
+
+class TestConstraintRows:
+    """Tests for batch_create_constraint_rows() method."""
+
+    def test_batch_create_constraint_rows_upserts(self, store: SQLiteStore):
+        """Test that raw constraint tuples are inserted and upserted."""
+        from ariadne_core.models.types import ConstraintType
+
+        store.insert_symbols([
+            SymbolData(fqn="com.example.A.run", kind=SymbolKind.METHOD, name="run")
+        ])
+        rows = [
+            ("run_NotNull", "参数验证: @NotNull", "com.example.A.run", None, ConstraintType.VALIDATION),
+            ("run_check_0", "空值检查", "com.example.A.run", None, ConstraintType.VALIDATION),
+        ]
+
+        assert store.batch_create_constraint_rows(rows) == 2
+        assert store.batch_create_constraint_rows(
+            [("run_check_0", "状态检查", "com.example.A.run", None, ConstraintType.INVARIANT)]
+        ) == 1
+
+        updated = store.get_constraint("run_check_0")
+        assert updated["description"] == "状态检查"
+        assert updated["constraint_type"] == "invariant"
+        assert len(store.get_constraints_by_source("com.example.A.run")) == 2
+        assert store.batch_create_constraint_rows([]) == 0
@@ -0,0 +1,196 @@
+"""Tests for HierarchicalSummarizer."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ariadne_analyzer.l1_business.extraction_cache import ExtractionCache
+from ariadne_analyzer.l1_business.summarizer import HierarchicalSummarizer
+from ariadne_core.models.types import SymbolData, SymbolKind
+from ariadne_llm.config import LLMConfig, LLMProvider
+
+
+@pytest.fixture
+def summarizer(tmp_path):
+    """Create a summarizer backed by a temporary cache directory."""
+    with patch("ariadne_llm.client.OpenAI"):
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test-key")
+        summarizer = HierarchicalSummarizer(config, cache_dir=tmp_path)
+        yield summarizer
+        summarizer.close()
+
+
+def make_method(name: str) -> SymbolData:
+    """Create a method symbol for testing."""
+    return SymbolData(
+        fqn=f"com.example.OrderService.{name}()",
+        kind=SymbolKind.METHOD,
+        name=name,
+        parent_fqn="com.example.OrderService",
+        signature=f"public void {name}()",
+    )
+
+
+class TestSummaryCache:
+    """Tests for the persistent method and class summary cache."""
+
+    def test_method_cache_hit_skips_llm(self, summarizer):
+        """Test that unchanged method source is served from the cache."""
+        summarizer.llm_client.generate_summary = MagicMock(return_value="Creates an order")
+        method = make_method("createOrder")
+
+        first = summarizer.summarize_method(method, "code")
+        second = summarizer.summarize_method(method, "code")
+
+        assert first == second == "Creates an order"
+        assert summarizer.llm_client.generate_summary.call_count == 1
+
+    def test_changed_source_misses_cache(self, summarizer):
+        """Test that modified source code is re-summarized."""
+        summarizer.llm_client.generate_summary = MagicMock(return_value="Creates an order")
+        method = make_method("createOrder")
+
+        summarizer.summarize_method(method, "code v1")
+        summarizer.summarize_method(method, "code v2")
+
+        assert summarizer.llm_client.generate_summary.call_count == 2
+
+    def test_failed_summary_not_cached(self, summarizer):
+        """Test that "N/A" results are retried instead of cached."""
+        summarizer.llm_client.generate_summary = MagicMock(return_value="N/A")
+        method = make_method("createOrder")
+
+        summarizer.summarize_method(method, "code")
+        summarizer.summarize_method(method, "code")
+
+        assert summarizer.llm_client.generate_summary.call_count == 2
+
+    def test_batch_sends_only_misses(self, summarizer):
+        """Test that batch summarization only sends uncached methods to the LLM."""
+        methods = [(make_method("a"), "code a"), (make_method("b"), "code b")]
+        summarizer.llm_client.batch_generate_summaries = MagicMock(
+            side_effect=lambda items, limit: [f"S{i}" for i in range(len(items))]
+        )
+        summarizer.batch_summarize_methods(methods[:1])
+
+        results = summarizer.batch_summarize_methods(methods)
+
+        assert results == [(methods[0][0].fqn, "S0"), (methods[1][0].fqn, "S0")]
+        second_call_items = summarizer.llm_client.batch_generate_summaries.call_args[0][0]
+        assert [item["code"] for item in second_call_items] == ["code b"]
+
+    def test_class_summary_cached(self, summarizer):
+        """Test that class summaries are cached by prompt."""
+        summarizer.llm_client._call_llm = MagicMock(return_value=" Manages orders ")
+        cls = SymbolData(fqn="com.example.OrderService", kind=SymbolKind.CLASS, name="OrderService")
+
+        first = summarizer.summarize_class(cls, [("createOrder", "Creates an order")])
+        second = summarizer.summarize_class(cls, [("createOrder", "Creates an order")])
+
+        assert first == second == "Manages orders"
+        assert summarizer.llm_client._call_llm.call_count == 1
+
+
+class TestExtractionCacheTTL:
+    """Tests for ExtractionCache expiry."""
+
+    def test_expired_entry_is_evicted(self, tmp_path):
+        """Test that entries older than max_age are treated as misses."""
+        cache = ExtractionCache(
+            tmp_path, "openai", "gpt-4o-mini", "v1", max_age=timedelta(days=1)
+        )
+        key = cache.make_key("com.example.A", "code")
+        cache.put(key, {"summary": "fresh"})
+        assert cache.get(key) == {"summary": "fresh"}
+
+        path = cache._path(key)
+        record = json.loads(path.read_text())
+        record["created_at"] = (datetime.now(UTC) - timedelta(days=2)).isoformat()
+        path.write_text(json.dumps(record))
+
+        assert cache.get(key) is None
+        assert not path.exists()
+
+
+class TestFusedClassSummary:
+    """Tests for summarizing a class and its methods in one call."""
+
+    def make_class(self) -> SymbolData:
+        """Create a class symbol for testing."""
+        return SymbolData(
+            fqn="com.example.OrderService", kind=SymbolKind.CLASS, name="OrderService"
+        )
+
+    def test_single_call_yields_method_and_class_rows(self, summarizer):
+        """Test that one structured response fills every summary."""
+        summarizer.llm_client.generate_structured_response = MagicMock(
+            return_value={
+                "methods": {"0": "Creates an order", "1": "N/A"},
+                "class": "Handles orders",
+            }
+        )
+        methods = [(make_method("createOrder"), "code"), (make_method("getId"), "code")]
+
+        rows = summarizer.summarize_class_fused(self.make_class(), methods)
+        again = summarizer.summarize_class_fused(self.make_class(), methods)
+
+        assert [(r.level.value, r.summary) for r in rows] == [
+            ("method", "Creates an order"),
+            ("method", "N/A"),
+            ("class", "Handles orders"),
+        ]
+        assert [r.summary for r in again] == [r.summary for r in rows]
+        assert summarizer.llm_client.generate_structured_response.call_count == 1
+
+    def test_incomplete_response_falls_back(self, summarizer):
+        """Test that a response missing a method is rejected."""
+        summarizer.llm_client.generate_structured_response = MagicMock(
+            return_value={"methods": {"0": "Creates an order"}, "class": "Handles orders"}
+        )
+        methods = [(make_method("createOrder"), "code"), (make_method("cancel"), "code")]
+
+        assert summarizer.summarize_class_fused(self.make_class(), methods) is None
+
+    def test_large_class_is_not_fused(self, summarizer):
+        """Test that classes over the method limit are left to per-method calls."""
+        summarizer.llm_client.generate_structured_response = MagicMock()
+        methods = [(make_method(f"m{i}"), "code") for i in range(21)]
+
+        assert summarizer.summarize_class_fused(self.make_class(), methods) is None
+        summarizer.llm_client.generate_structured_response.assert_not_called()
+
+
+class TestIncrementalSummaries:
+    """Tests for generate_incremental_summaries without a store."""
+
+    def test_class_summary_uses_only_its_own_methods(self, summarizer):
+        """Test that a class is not credited with methods of a prefix-named class."""
+        order = SymbolData(fqn="com.example.Order", kind=SymbolKind.CLASS, name="Order")
+        item = SymbolData(fqn="com.example.OrderItem", kind=SymbolKind.CLASS, name="OrderItem")
+        methods = [
+            SymbolData(
+                fqn=f"{cls.fqn}.{name}()",
+                kind=SymbolKind.METHOD,
+                name=name,
+                parent_fqn=cls.fqn,
+            )
+            for cls, name in ((order, "place"), (item, "price"))
+        ]
+        summarizer.summarize_class_fused = MagicMock(return_value=None)
+        summarizer.summarize_method = MagicMock(side_effect=lambda m, *_: f"summary of {m.name}")
+        summarizer.summarize_class = MagicMock(return_value="class summary")
+
+        summarizer.generate_incremental_summaries(
+            [order, item, *methods], {m.fqn: "code" for m in methods}
+        )
+
+        assert summarizer.summarize_class.call_args_list[0].args == (
+            order,
+            [("com.example.Order.place()", "summary of place")],
+        )
+        assert summarizer.summarize_class.call_args_list[1].args == (
+            item,
+            [("com.example.OrderItem.price()", "summary of price")],
+        )
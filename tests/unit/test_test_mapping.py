@@ -298,3 +298,62 @@ class TestBatchOperations:
         assert "statistics" in coverage1
         assert "total_callers" in coverage1["statistics"]
         assert "coverage_percentage" in coverage1["statistics"]
+
+
+class TestMapperDirectoryCache:
+    """Tests for TestMapper's cached test directory listings."""
+
+    def test_one_listing_per_test_directory(self, store_with_sample_data, tmp_path):
+        """Test that candidate test files of one package share a single listdir."""
+        from unittest.mock import patch
+
+        from ariadne_analyzer.l3_implementation import test_mapper as test_mapper_module
+
+        main_dir = tmp_path / "src/main/java/com/example"
+        test_dir = tmp_path / "src/test/java/com/example"
+        test_dir.mkdir(parents=True)
+        (test_dir / "OrderServiceTest.java").touch()
+        (test_dir / "OrderServiceIT.java").touch()
+        mapper = test_mapper_module.TestMapper(store_with_sample_data)
+
+        with patch.object(
+            test_mapper_module.os, "listdir", wraps=test_mapper_module.os.listdir
+        ) as listdir:
+            order = mapper.find_tests_for_file_path(str(main_dir / "OrderService.java"), ["a"])
+            user = mapper.find_tests_for_file_path(str(main_dir / "UserService.java"), ["b"])
+
+        assert order["path"] == str(test_dir / "OrderServiceTest.java")
+        assert order["additional_tests"] == [str(test_dir / "OrderServiceIT.java")]
+        assert user is None
+        assert listdir.call_count == 1
+
+    def test_package_tests_match_prefix_literally(self, store_with_sample_data, tmp_path):
+        """Test that package lookup treats "_" literally and finds existing tests."""
+        from ariadne_analyzer.l3_implementation.test_mapper import TestMapper
+
+        main_dir = tmp_path / "src/main/java/com/my_app"
+        test_dir = tmp_path / "src/test/java/com/my_app"
+        test_dir.mkdir(parents=True)
+        (test_dir / "BillingTest.java").touch()
+        (test_dir / "OtherTest.java").touch()
+        store_with_sample_data.insert_symbols([
+            SymbolData(
+                fqn="com.my_app.Billing",
+                kind=SymbolKind.CLASS,
+                name="Billing",
+                file_path=str(main_dir / "Billing.java"),
+            ),
+            SymbolData(
+                fqn="com.myXapp.Other",
+                kind=SymbolKind.CLASS,
+                name="Other",
+                file_path=str(main_dir / "Other.java"),
+            ),
+        ])
+        mapper = TestMapper(store_with_sample_data)
+
+        tests = mapper.find_all_tests_for_package("com.my_app")
+
+        assert tests == [
+            {"path": str(test_dir / "BillingTest.java"), "source_package": "com.my_app"}
+        ]